@@ -0,0 +1,37 @@
+"""亚克力无边框窗口组件包
+
+公开类在首次访问时才导入对应子模块，冷启动只付出实际用到部分的代价。
+"""
+import importlib
+
+__all__ = [
+    "AcrylicWindow",
+    "AcrylicEffect",
+    "TitleBar",
+    "TitleButton",
+    "WindowResizer",
+    "WindowMiniMode",
+]
+
+# 公开名称 -> 定义它的子模块
+_EXPORTS = {
+    "AcrylicWindow": ".window",
+    "AcrylicEffect": ".effect",
+    "TitleBar": ".title_bar",
+    "TitleButton": ".title_bar",
+    "WindowResizer": ".resizer",
+    "WindowMiniMode": ".mini_mode",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 之后的访问不再经过 __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
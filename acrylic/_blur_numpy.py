@@ -0,0 +1,38 @@
+"""基于 NumPy 前缀和的盒式模糊实现"""
+import math
+import numpy as np
+from PySide6.QtGui import QImage
+
+
+def gaussian_blur(image, radius):
+    if radius < 1 or image.isNull():
+        return image
+
+    passes = 3
+    box_radius = max(1, int(math.sqrt(radius ** 2 * 12 / passes) + 1) // 2)
+
+    image = image.convertToFormat(QImage.Format_ARGB32)
+    w, h = image.width(), image.height()
+    pixels = np.frombuffer(image.constBits(), np.uint8)
+    pixels = pixels.reshape(h, image.bytesPerLine())[:, :w * 4].reshape(h, w, 4)
+
+    blurred = pixels
+    for _ in range(passes):
+        blurred = _box_blur_axis(blurred, box_radius, 1)  # 水平
+        blurred = _box_blur_axis(blurred, box_radius, 0)  # 垂直
+
+    blurred = np.ascontiguousarray(blurred)
+    return QImage(blurred.data, w, h, w * 4, QImage.Format_ARGB32).copy()
+
+
+def _box_blur_axis(pixels, radius, axis):
+    """沿指定轴做一次边缘复制的盒式模糊"""
+    size = 2 * radius + 1
+    n = pixels.shape[axis]
+    pad = [(0, 0)] * pixels.ndim
+    pad[axis] = (radius + 1, radius)
+    sums = np.cumsum(np.pad(pixels, pad, mode="edge"), axis=axis, dtype=np.uint32)
+
+    sums = np.moveaxis(sums, axis, 0)
+    window = (sums[size:size + n] - sums[:n]) // size
+    return np.moveaxis(window, 0, axis).astype(np.uint8)
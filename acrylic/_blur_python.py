@@ -0,0 +1,120 @@
+"""纯 Python 盒式模糊实现，未安装 NumPy 时使用"""
+import math
+from PySide6.QtGui import QImage
+
+
+def gaussian_blur(image, radius):
+    if radius < 1:
+        return image
+
+    passes = 3
+    box_radius = int(math.sqrt(radius ** 2 * 12 / passes) + 1) // 2
+    if box_radius < 1:
+        box_radius = 1
+
+    blurred = image.copy()
+    for _ in range(passes):
+        blurred = _box_blur(blurred, box_radius)
+    return blurred
+
+
+def _box_blur(image, radius):
+    if radius < 1 or image.isNull():
+        return image
+
+    # 水平模糊
+    temp = _box_blur_pass(image, radius, True)
+    # 垂直模糊
+    return _box_blur_pass(temp, radius, False)
+
+
+def _box_blur_pass(src, radius, horizontal):
+    src = src.convertToFormat(QImage.Format_ARGB32)
+    w, h = src.width(), src.height()
+    dst = QImage(w, h, QImage.Format_ARGB32)
+    src_bits = src.constBits()
+    dst_bits = dst.bits()
+
+    if horizontal:
+        for y in range(h):
+            sum_b = sum_g = sum_r = sum_a = 0
+            count = 0
+
+            # 初始化窗口
+            for x in range(-radius, radius + 1):
+                px = max(0, min(x, w - 1))
+                idx = (y * w + px) * 4
+                sum_b += src_bits[idx]
+                sum_g += src_bits[idx + 1]
+                sum_r += src_bits[idx + 2]
+                sum_a += src_bits[idx + 3]
+                count += 1
+
+            # 滑动处理
+            for x in range(w):
+                idx = (y * w + x) * 4
+                dst_bits[idx] = sum_b // count
+                dst_bits[idx + 1] = sum_g // count
+                dst_bits[idx + 2] = sum_r // count
+                dst_bits[idx + 3] = sum_a // count
+
+                # 更新窗口
+                left = x - radius
+                if left >= 0:
+                    left_idx = (y * w + left) * 4
+                    sum_b -= src_bits[left_idx]
+                    sum_g -= src_bits[left_idx + 1]
+                    sum_r -= src_bits[left_idx + 2]
+                    sum_a -= src_bits[left_idx + 3]
+                    count -= 1
+
+                right = x + radius + 1
+                if right < w:
+                    right_idx = (y * w + right) * 4
+                    sum_b += src_bits[right_idx]
+                    sum_g += src_bits[right_idx + 1]
+                    sum_r += src_bits[right_idx + 2]
+                    sum_a += src_bits[right_idx + 3]
+                    count += 1
+    else:
+        # 垂直方向处理
+        for x in range(w):
+            sum_b = sum_g = sum_r = sum_a = 0
+            count = 0
+
+            for y in range(-radius, radius + 1):
+                py = max(0, min(y, h - 1))
+                idx = (py * w + x) * 4
+                sum_b += src_bits[idx]
+                sum_g += src_bits[idx + 1]
+                sum_r += src_bits[idx + 2]
+                sum_a += src_bits[idx + 3]
+                count += 1
+
+            for y in range(h):
+                idx = (y * w + x) * 4
+                dst_bits[idx] = sum_b // count
+                dst_bits[idx + 1] = sum_g // count
+                dst_bits[idx + 2] = sum_r // count
+                dst_bits[idx + 3] = sum_a // count
+
+                # 更新窗口
+                top = y - radius
+                if top >= 0:
+                    top_idx = (top * w + x) * 4
+                    sum_b -= src_bits[top_idx]
+                    sum_g -= src_bits[top_idx + 1]
+                    sum_r -= src_bits[top_idx + 2]
+                    sum_a -= src_bits[top_idx + 3]
+                    count -= 1
+
+                bottom = y + radius + 1
+                if bottom < h:
+                    bottom_idx = (bottom * w + x) * 4
+                    sum_b += src_bits[bottom_idx]
+                    sum_g += src_bits[bottom_idx + 1]
+                    sum_r += src_bits[bottom_idx + 2]
+                    sum_a += src_bits[bottom_idx + 3]
+                    count += 1
+
+    return dst
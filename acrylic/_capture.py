@@ -0,0 +1,14 @@
+"""基于 QScreen.grabWindow 的屏幕截图提供者"""
+from PySide6.QtCore import QPoint
+from PySide6.QtWidgets import QApplication
+
+
+def grab_behind(widget, rect):
+    """截取控件 rect 区域背后的屏幕内容，返回 QImage"""
+    screen = QApplication.primaryScreen()
+    global_pos = widget.mapToGlobal(QPoint(0, 0))
+    return screen.grabWindow(0,
+                             global_pos.x() + rect.x(),
+                             global_pos.y() + rect.y(),
+                             rect.width(),
+                             rect.height()).toImage()
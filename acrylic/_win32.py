@@ -0,0 +1,37 @@
+import ctypes
+from ctypes import wintypes
+
+
+class Win32API:
+    class ACCENTPOLICY(ctypes.Structure):
+        _fields_ = [
+            ("AccentState", ctypes.c_uint),
+            ("AccentFlags", ctypes.c_uint),
+            ("GradientColor", ctypes.c_uint),
+            ("AnimationId", ctypes.c_uint),
+        ]
+
+    class WINCOMPATTRDATA(ctypes.Structure):
+        _fields_ = [
+            ("Attribute", ctypes.c_int),
+            ("Data", ctypes.POINTER(ctypes.c_ubyte)),
+            ("SizeOfData", ctypes.c_size_t),
+        ]
+
+    @staticmethod
+    def enable_blur(hwnd):
+        SetWindowCompositionAttribute = ctypes.windll.user32.SetWindowCompositionAttribute
+        SetWindowCompositionAttribute.restype = ctypes.c_bool
+        SetWindowCompositionAttribute.argtypes = [wintypes.HWND, ctypes.POINTER(Win32API.WINCOMPATTRDATA)]
+
+        accent = Win32API.ACCENTPOLICY()
+        accent.AccentState = 3  # ACCENT_ENABLE_BLURBEHIND
+        accent.AccentFlags = 0x20 | 0x40
+        accent.GradientColor = 0x00FFFFFF  # 完全透明
+
+        data = Win32API.WINCOMPATTRDATA()
+        data.Attribute = 19  # WCA_ACCENT_POLICY
+        data.SizeOfData = ctypes.sizeof(accent)
+        data.Data = ctypes.cast(ctypes.pointer(accent), ctypes.POINTER(ctypes.c_ubyte))
+
+        return SetWindowCompositionAttribute(hwnd, ctypes.pointer(data))
@@ -0,0 +1,43 @@
+"""按需加载的渲染后端
+
+模糊实现（NumPy / 纯 Python）、Win32 硬件模糊和屏幕截图提供者都在第一次使用时才导入，
+导入 acrylic 包本身不会触发其中任何一个。
+"""
+import sys
+
+_blur_backend = None
+_capture_provider = None
+_win32_api = False  # False 表示尚未探测，None 表示当前平台不可用
+
+
+def blur_backend():
+    """返回模糊实现模块：优先 NumPy，缺失时退回纯 Python 实现"""
+    global _blur_backend
+    if _blur_backend is None:
+        try:
+            from . import _blur_numpy as backend
+        except ImportError:
+            from . import _blur_python as backend
+        _blur_backend = backend
+    return _blur_backend
+
+
+def capture_provider():
+    """返回屏幕截图提供者模块"""
+    global _capture_provider
+    if _capture_provider is None:
+        from . import _capture
+        _capture_provider = _capture
+    return _capture_provider
+
+
+def win32_api():
+    """返回 Win32API，非 Windows 平台返回 None"""
+    global _win32_api
+    if _win32_api is False:
+        if sys.platform == "win32":
+            from ._win32 import Win32API
+            _win32_api = Win32API
+        else:
+            _win32_api = None
+    return _win32_api
@@ -0,0 +1,198 @@
+from PySide6.QtCore import QThread, QTimer, QRect, Qt
+from PySide6.QtGui import QColor
+
+from .backends import blur_backend, capture_provider, win32_api
+from .snapshot import SnapshotCache
+
+
+def blur_image(image, radius):
+    """缩小后高斯模糊再放大回原尺寸，不访问任何控件，可在工作线程中调用"""
+    # 缩小图像提高性能
+    small_img = image.scaled(
+        max(1, image.width() // 2),
+        max(1, image.height() // 2),
+        Qt.IgnoreAspectRatio,
+        Qt.SmoothTransformation
+    )
+
+    # 应用高斯模糊
+    blurred = blur_backend().gaussian_blur(small_img, radius)
+
+    # 放大回原尺寸
+    return blurred.scaled(image.size(), Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+
+
+class _BlurWorker(QThread):
+    """在后台线程模糊一张截图，完成后由 finished 通知界面线程读取 result"""
+
+    def __init__(self, image, radius, parent=None):
+        super().__init__(parent)
+        self.image = image
+        self.radius = radius
+        self.result = None
+
+    def run(self):
+        self.result = blur_image(self.image, self.radius)
+
+
+class AcrylicEffect:
+    def __init__(self, widget):
+        self.widget = widget
+        self.blur_radius = 8
+        self.tint_color = QColor(30, 30, 30, 150)
+        self.update_interval = 50
+        self.use_hardware_accel = True
+        self.suspended = False
+
+        self.blur_cache = None
+        self.dirty_rects = []
+        # 只在有失效区域时启动一次，合并间隔内的多次失效；空闲时不唤醒
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(self.update_interval)
+        self.timer.timeout.connect(self._update)
+
+        # 启动快照：首帧先画上次关闭时的背景，再截图并在后台线程模糊后替换
+        # 键为空时使用窗口的 objectName，两者都为空则不使用快照
+        self.snapshot_cache = SnapshotCache()
+        self.snapshot_key = None
+        self._snapshot = None
+        self._snapshot_checked = False
+        self._refine_pending = False  # 已安排刷新，快照期间的重绘不再重复安排
+        self._blur_worker = None
+        self._refined = None  # 后台模糊的结果，下一次绘制时使用
+
+    def set_opacity(self, opacity):
+        """设置窗口透明度(0-255)"""
+        opacity = max(0, min(opacity, 255))  # 确保在0-255范围内
+        self.tint_color.setAlpha(opacity)
+        self._invalidate_cache()
+
+    def set_blur_radius(self, radius):
+        self.blur_radius = max(1, min(radius, 20))
+        self._invalidate_cache()
+
+    def set_tint_color(self, color):
+        self.tint_color = color
+        self._invalidate_cache()
+
+    def set_update_interval(self, interval):
+        self.update_interval = max(10, min(interval, 100))
+        self.timer.setInterval(self.update_interval)
+
+    def set_snapshot_cache(self, cache, key=None):
+        """设置快照缓存，传入 None 关闭启动快照"""
+        self.snapshot_cache = cache
+        if key:
+            self.snapshot_key = key
+
+    def _snapshot_name(self):
+        return self.snapshot_key or self.widget.objectName() or None
+
+    def save_snapshot(self):
+        """保存最后一帧模糊背景，通常在窗口关闭时调用"""
+        if self._blur_worker is not None:
+            self._blur_worker.wait()  # 窗口关闭前等待后台模糊结束
+        key = self._snapshot_name()
+        if self.snapshot_cache is None or key is None or self.use_hardware_accel:
+            return False
+        return self.snapshot_cache.save(key, self.widget, self.blur_cache)
+
+    def _refine_snapshot(self):
+        """界面线程截图，模糊交给后台线程"""
+        rect = self.widget.rect()
+        if rect.isEmpty():
+            self._refine_pending = False
+            return
+        screenshot = capture_provider().grab_behind(self.widget, rect)
+        self._blur_worker = _BlurWorker(screenshot, self.blur_radius, self.widget)
+        self._blur_worker.finished.connect(self._on_refined)
+        self._blur_worker.start()
+
+    def _on_refined(self):
+        worker, self._blur_worker = self._blur_worker, None
+        worker.deleteLater()
+        self._refine_pending = False
+        self._snapshot = None
+        self._refined = worker.result
+        self.widget.update()
+
+    def suspend(self):
+        """暂停背景刷新，窗口停靠或不可见时调用"""
+        self.suspended = True
+        self.timer.stop()
+        self.dirty_rects.clear()
+
+    def resume(self):
+        """恢复背景刷新并重新截图"""
+        if self.suspended:
+            self.suspended = False
+            self.dirty_rects.clear()
+            self._invalidate_cache()
+
+    def enable_hardware_accel(self, enabled):
+        self.use_hardware_accel = enabled
+        self._invalidate_cache()
+
+    def _invalidate_cache(self):
+        self.blur_cache = None
+        if self.suspended:
+            return  # 恢复时会整体重新失效
+        if not self.dirty_rects:
+            self.timer.start()
+        self.dirty_rects.append(QRect(0, 0, self.widget.width(), self.widget.height()))
+
+    def _update(self):
+        if self.dirty_rects:
+            self.widget.update()
+            self.dirty_rects.clear()
+
+    def apply_effect(self):
+        if self.use_hardware_accel:
+            api = win32_api()
+            if api is None or not api.enable_blur(int(self.widget.winId())):
+                self.use_hardware_accel = False
+
+    def paint(self, painter):
+        if self.use_hardware_accel:
+            painter.fillRect(self.widget.rect(), self.tint_color)
+            return
+
+        visible_rect = self.widget.rect()
+
+        if not self._snapshot_checked:
+            self._snapshot_checked = True
+            key = self._snapshot_name()
+            if self.snapshot_cache is not None and key is not None:
+                self._snapshot = self.snapshot_cache.load(key, self.widget)
+
+        if self._snapshot is not None:
+            # 先绘制快照，截图推迟到下一轮事件循环，模糊在后台线程进行
+            painter.drawImage(visible_rect, self._snapshot)
+            painter.fillRect(visible_rect, self.tint_color)
+            if not self._refine_pending:
+                self._refine_pending = True
+                QTimer.singleShot(0, self._refine_snapshot)
+            return
+
+        if self._refined is not None:
+            blurred, self._refined = self._refined, None
+            self.blur_cache = blurred
+            painter.drawImage(visible_rect, blurred)
+            painter.fillRect(visible_rect, self.tint_color)
+            return
+
+        if not visible_rect.isEmpty():
+            # 获取屏幕截图
+            screenshot = capture_provider().grab_behind(self.widget, visible_rect)
+
+            # 应用模糊效果
+            blurred = self._apply_blur(screenshot)
+            self.blur_cache = blurred
+
+            # 绘制效果
+            painter.drawImage(visible_rect.topLeft(), blurred)
+            painter.fillRect(visible_rect, self.tint_color)
+
+    def _apply_blur(self, image):
+        return blur_image(image, self.blur_radius)
@@ -0,0 +1,46 @@
+from PySide6.QtCore import QObject, QEvent, Qt
+from PySide6.QtWidgets import QApplication
+
+
+class BorderEventRouter(QObject):
+    """应用级事件路由
+
+    在 QApplication 上只安装一个事件过滤器，监听各顶层窗口的 QWindow 收到的鼠标移动，
+    仅把落在边框附近的移动转交给对应的 WindowResizer。每个事件只做一次字典查找和
+    几次整数比较，与窗口内控件数量无关，也不需要给子控件逐个安装过滤器或开启鼠标跟踪。
+    """
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """返回进程内唯一的路由器，首次调用时安装到 QApplication"""
+        if cls._instance is None:
+            app = QApplication.instance()
+            cls._instance = cls(app)
+            app.installEventFilter(cls._instance)
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._resizers = {}  # QWindow -> WindowResizer
+        self.routed = 0  # 实际转交给 WindowResizer 的事件数
+
+    def register(self, resizer):
+        handle = resizer.window.windowHandle()
+        self._resizers[handle] = resizer
+        resizer.window.destroyed.connect(lambda: self._resizers.pop(handle, None))
+
+    def unregister(self, resizer):
+        self._resizers.pop(resizer.window.windowHandle(), None)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseMove and event.buttons() == Qt.NoButton:
+            resizer = self._resizers.get(obj)
+            if resizer is not None:
+                pos = event.position().toPoint()
+                # 离开边框时还需再转交一次以恢复光标
+                if resizer.zones().near_border(pos.x(), pos.y()) or resizer.last_valid_cursor is not None:
+                    self.routed += 1
+                    resizer.handle_hover_move(pos)
+        return False
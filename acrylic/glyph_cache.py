@@ -0,0 +1,93 @@
+"""进程级的标题栏按钮绘制缓存
+
+图标字形和圆角背景预先渲染成位图，悬停动画的每一帧只需贴图，
+不再为每次绘制构造 QFont、QPainterPath 并调用 drawText。
+"""
+from collections import OrderedDict
+
+from PySide6.QtCore import Qt, QRectF
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QPainter, QPainterPath, QPixmap
+from PySide6.QtWidgets import QApplication
+
+PREFERRED_ICON_FONTS = ["Segoe MDL2 Assets", "Material Icons", "FontAwesome"]
+
+_icon_font = None
+
+
+def best_icon_font():
+    """按优先级选择可用的图标字体，结果在进程内只计算一次"""
+    global _icon_font
+    if _icon_font is None:
+        _icon_font = next((font for font in PREFERRED_ICON_FONTS if QFontDatabase.hasFamily(font)),
+                          QApplication.font().family())
+    return _icon_font
+
+
+class _PixmapCache:
+    """容量有限的 LRU 位图缓存"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._items = OrderedDict()
+        self.misses = 0
+
+    def get(self, key, render):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+            return pixmap
+        self.misses += 1
+        pixmap = self._items[key] = render()
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+        return pixmap
+
+    def clear(self):
+        self._items.clear()
+
+
+glyphs = _PixmapCache(64)
+backgrounds = _PixmapCache(128)
+
+
+def _blank(width, height, dpr):
+    pixmap = QPixmap(round(width * dpr), round(height * dpr))
+    pixmap.setDevicePixelRatio(dpr)
+    pixmap.fill(Qt.transparent)
+    return pixmap
+
+
+def glyph_pixmap(glyph, family, font_size, color, width, height, dpr):
+    """居中渲染在 width x height 区域内的字形位图"""
+    def render():
+        pixmap = _blank(width, height, dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.setFont(QFont(family, font_size))
+        painter.setPen(QColor(color))
+        painter.drawText(QRectF(0, 0, width, height), Qt.AlignCenter, glyph)
+        painter.end()
+        return pixmap
+
+    return glyphs.get((glyph, family, font_size, color, width, height, dpr), render)
+
+
+def rounded_background(width, height, radius, color, dpr):
+    """不透明的圆角背景位图，透明度由调用方通过 QPainter.setOpacity 施加
+
+    颜色按 16 级量化，悬停动画中连续变化的颜色只会落到少数几个缓存项上。
+    """
+    rgb = (color.red() >> 4, color.green() >> 4, color.blue() >> 4)
+
+    def render():
+        pixmap = _blank(width, height, dpr)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, width, height), radius, radius)
+        painter.fillPath(path, QColor(*(c * 17 for c in rgb)))
+        painter.end()
+        return pixmap
+
+    return backgrounds.get((width, height, radius, rgb, dpr), render)
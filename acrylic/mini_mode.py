@@ -0,0 +1,272 @@
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QPoint, QRect, QTimer
+from PySide6.QtGui import QCursor, QPainter
+from PySide6.QtWidgets import QWidget
+
+from .screens import ScreenIndex
+
+# 迷你模式状态：停靠 -> 悬停待展开 -> 展开中 -> 已展开 -> 收回中 -> 停靠
+DOCKED = "docked"
+PEEKING = "peeking"
+EXPANDING = "expanding"
+EXPANDED = "expanded"
+COLLAPSING = "collapsing"
+
+
+class _AnimationProxy(QWidget):
+    """动画期间代替真实窗口移动的无边框截图窗口"""
+
+    def __init__(self):
+        super().__init__(None, Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+                         | Qt.WindowTransparentForInput | Qt.WindowDoesNotAcceptFocus)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        self._pixmap = None
+
+    def set_pixmap(self, pixmap):
+        self._pixmap = pixmap
+        self.update()
+
+    def paintEvent(self, event):
+        if self._pixmap is not None:
+            QPainter(self).drawPixmap(0, 0, self._pixmap)
+
+
+class WindowMiniMode:
+    """窗口迷你模式控制器
+
+    进入/离开事件只登记意图，由一个可复用的防抖定时器在延迟后执行；
+    重复或已被后续事件取消的转换直接丢弃，一串快速悬停最多只触发一次动画。
+    """
+
+    def __init__(self, window: QWidget):
+        self.window = window
+        self.normal_geometry = None
+        self.visible_strip = 10  # 隐藏后保留的可见像素
+        self.animation_duration = 300  # 动画时长(ms)
+        self.expand_delay = 300  # 悬停多久后展开(ms)
+        self.collapse_delay = 500  # 离开多久后收回(ms)
+
+        self.state = None  # None 表示未启用迷你模式
+        self.animations = 0  # 实际启动的动画次数
+
+        # 停靠/展开动画移动的是截图代理窗口，真实窗口在动画期间隐藏
+        self._proxy = None
+        self._proxy_target = None
+        self.pos_anim = QPropertyAnimation(window, b"pos")
+        self.pos_anim.setEasingCurve(QEasingCurve.OutQuad)
+        self.pos_anim.setDuration(self.animation_duration)
+        self.pos_anim.finished.connect(self._on_animation_finished)
+
+        # 悬停意图防抖
+        self._intent = None
+        self._intent_timer = QTimer(singleShot=True, timeout=self._run_intent)
+
+    def enable(self):
+        """启用迷你模式"""
+        if self.state is None:
+            self.normal_geometry = self.window.geometry()
+            self.state = EXPANDED
+            self.attach_to_nearest_edge()
+
+    def disable(self):
+        """禁用迷你模式"""
+        if self.state is not None:
+            self.state = None
+            self._cancel_intent()
+            self.pos_anim.stop()
+            self._thaw()
+            self._swap_back()
+            self.window.showNormal()
+            if self.normal_geometry:
+                self.window.setGeometry(self.normal_geometry)
+
+    def toggle(self):
+        """切换迷你模式状态"""
+        if self.is_enabled():
+            self.disable()
+        else:
+            self.enable()
+
+    def is_enabled(self):
+        """检查是否处于迷你模式"""
+        return self.state is not None
+
+    def attach_to_nearest_edge(self):
+        """精确计算最近边缘并吸附"""
+        if self.state is None:
+            return
+        self._cancel_intent()
+        closest_edge, screen = ScreenIndex.instance().nearest_edge(self.window.geometry().center())
+        self.state = COLLAPSING
+        {
+            'left': self.attach_to_left,
+            'right': self.attach_to_right,
+            'top': self.attach_to_top,
+            'bottom': self.attach_to_bottom
+        }[closest_edge](screen)
+
+    def attach_to_left(self, screen_geo):
+        """吸附到左边缘"""
+        target_x = screen_geo.left() - self.window.width() + self.visible_strip
+        target_y = max(screen_geo.top(), min(
+            self.window.y(),
+            screen_geo.bottom() - self.window.height()
+        ))
+        self.animate_to(QPoint(target_x, target_y))
+
+    def attach_to_right(self, screen_geo):
+        """吸附到右边缘"""
+        target_x = screen_geo.right() - self.visible_strip
+        target_y = max(screen_geo.top(), min(
+            self.window.y(),
+            screen_geo.bottom() - self.window.height()
+        ))
+        self.animate_to(QPoint(target_x, target_y))
+
+    def attach_to_top(self, screen_geo):
+        """吸附到上边缘"""
+        target_x = max(screen_geo.left(), min(
+            self.window.x(),
+            screen_geo.right() - self.window.width()
+        ))
+        target_y = screen_geo.top() - self.window.height() + self.visible_strip
+        self.animate_to(QPoint(target_x, target_y))
+
+    def attach_to_bottom(self, screen_geo):
+        """吸附到底部"""
+        target_x = max(screen_geo.left(), min(
+            self.window.x(),
+            screen_geo.right() - self.window.width()
+        ))
+        target_y = screen_geo.bottom() - self.visible_strip
+        self.animate_to(QPoint(target_x, target_y))
+
+    def animate_to(self, target_pos):
+        """执行位移动画，目标与正在进行的动画相同时不重启"""
+        if (self.pos_anim.state() == QPropertyAnimation.Running
+                and self.pos_anim.endValue() == target_pos):
+            return
+        self.pos_anim.stop()
+
+        if self._proxy_target is None:
+            # 不在动画中：真实窗口已就位则无需动画
+            if self.window.pos() == target_pos:
+                self._on_animation_finished()
+                return
+            self._swap_in_proxy()
+        start = self._proxy.pos()
+
+        self.animations += 1
+        self._proxy_target = target_pos
+        self.pos_anim.setStartValue(start)
+        self.pos_anim.setEndValue(target_pos)
+        self.pos_anim.start()
+
+    def _swap_in_proxy(self):
+        """截取窗口内容放入代理窗口，隐藏真实窗口并暂停其绘制"""
+        if self._proxy is None:
+            self._proxy = _AnimationProxy()
+            self.pos_anim.setTargetObject(self._proxy)
+        self._proxy.set_pixmap(self.window.grab())
+        self._proxy.setGeometry(self.window.geometry())
+        self._proxy.show()
+        self.window.setUpdatesEnabled(False)
+        self.window.hide()
+
+    def _swap_back(self):
+        """把真实窗口放回代理窗口的最终位置"""
+        target, self._proxy_target = self._proxy_target, None
+        if target is None:
+            return
+        self.window.move(target)
+        self.window.setUpdatesEnabled(True)
+        self.window.show()
+        self._proxy.hide()
+        self._proxy.set_pixmap(None)
+
+    def _freeze(self):
+        """停靠后窗口只剩一条可见，改为绘制缓存图并暂停完整渲染"""
+        suspend = getattr(self.window, "suspend_rendering", None)
+        if suspend is None:
+            return
+        pixmap = self._proxy._pixmap if self._proxy_target is not None else None
+        suspend(pixmap if pixmap is not None else self.window.grab())
+
+    def _thaw(self):
+        resume = getattr(self.window, "resume_rendering", None)
+        if resume is not None:
+            resume()
+
+    def _on_animation_finished(self):
+        # 在真实窗口重新显示前切换渲染模式，避免多绘制一帧
+        if self.state == COLLAPSING:
+            self._freeze()
+        elif self.state == EXPANDING:
+            self._thaw()
+        self._swap_back()
+        if self.state == EXPANDING:
+            self.state = EXPANDED
+        elif self.state == COLLAPSING:
+            self.state = DOCKED
+
+    def _schedule(self, intent, delay):
+        """登记意图，后到的意图覆盖先前未执行的意图"""
+        self._intent = intent
+        self._intent_timer.start(delay)
+
+    def _cancel_intent(self):
+        self._intent = None
+        self._intent_timer.stop()
+
+    def _run_intent(self):
+        intent, self._intent = self._intent, None
+        if intent == "expand" and self.state == PEEKING:
+            self.expand_window()
+        elif intent == "collapse" and self.state in (EXPANDING, EXPANDED):
+            if not self.window.geometry().contains(QCursor.pos()):
+                self.attach_to_nearest_edge()
+
+    def handle_enter_event(self):
+        """鼠标进入：停靠状态下延迟展开，展开状态下取消待执行的收回"""
+        if self._proxy_target is not None:
+            return  # 代理动画期间真实窗口的进入/离开来自隐藏与重新显示
+        if self.state in (DOCKED, COLLAPSING):
+            self.state = PEEKING
+            self._schedule("expand", self.expand_delay)
+        elif self.state in (EXPANDING, EXPANDED):
+            self._cancel_intent()
+
+    def handle_leave_event(self):
+        """鼠标离开：悬停未满延迟则放弃展开，已展开则延迟收回"""
+        if self._proxy_target is not None:
+            return
+        if self.state == PEEKING:
+            self._cancel_intent()
+            # 仍停在原位时直接回到停靠，否则继续收回动画
+            self.state = COLLAPSING if self.pos_anim.state() == QPropertyAnimation.Running else DOCKED
+        elif self.state in (EXPANDING, EXPANDED):
+            self._schedule("collapse", self.collapse_delay)
+
+    def expand_window(self, animate=True):
+        """从迷你模式展开，animate=False 时立即还原（如拖动中）"""
+        if self.state is None or self.state in (EXPANDING, EXPANDED):
+            return
+        self._cancel_intent()
+        if self.normal_geometry:
+            target = QRect(self.normal_geometry)
+        else:
+            # 默认展开到右侧
+            screen = ScreenIndex.instance().available_at(self.window.geometry().center())
+            target = QRect(screen.right() - self.window.width(), screen.top(),
+                           self.window.width(), screen.height())
+        if not animate:
+            self.pos_anim.stop()
+            self._thaw()
+            self._swap_back()
+            self.state = EXPANDED
+            self.window.setGeometry(target)
+            return
+        self.state = EXPANDING
+        if self.window.size() != target.size():
+            self.window.resize(target.size())
+        self.animate_to(target.topLeft())
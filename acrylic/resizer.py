@@ -0,0 +1,385 @@
+import time
+
+from PySide6.QtCore import Qt, QObject, QRect, QPoint, QTimer
+from PySide6.QtGui import QCursor, QPainter
+from PySide6.QtWidgets import QApplication, QRubberBand, QWidget
+
+from .event_router import BorderEventRouter
+from .screens import ScreenIndex
+
+# live: 每帧实时调整；outline: 只移动橡皮筋边框，松开时应用一次；
+# snapshot: 拉伸调整前的截图，暂停子控件布局与重绘；auto: 按实测帧耗时自动选择
+RESIZE_MODES = ("auto", "live", "outline", "snapshot")
+
+
+class ResizeZoneMap:
+    """预先计算的边框热区表
+
+    原先每次鼠标移动都用浮点公式计算动态边距，这里在窗口尺寸或 DPI 变化时
+    一次性算好整数分段，命中检测只剩几次整数比较。
+    """
+
+    CURSORS = {
+        1: Qt.SizeHorCursor, 2: Qt.SizeHorCursor,
+        4: Qt.SizeVerCursor, 8: Qt.SizeVerCursor,
+        5: Qt.SizeFDiagCursor, 6: Qt.SizeBDiagCursor,
+        9: Qt.SizeBDiagCursor, 10: Qt.SizeFDiagCursor
+    }
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.rebuilds = 0
+
+    def rebuild(self, width, height, margin):
+        """按窗口尺寸和边距重建热区"""
+        self.width, self.height = width, height
+        self.rebuilds += 1
+
+        # 动态边距：中间 1/4 宽度加粗 1 像素，左右最外 1/8 收窄 1 像素
+        self._outer = min(margin - 1, 20)
+        self._normal = min(margin, 20)
+        self._inner = min(margin + 1, 20)
+        self._outer_left = width // 8
+        self._outer_right = width - width // 8
+        self._inner_left = width * 3 // 8
+        self._inner_right = width - width * 3 // 8
+
+        # 抖动抑制：靠近边缘的角落退化为上下边，只有远离原点的右下角保留对角
+        band = self._outer
+        self._corners = {
+            5: 4,
+            6: 4,
+            9: 8,
+            10: 10 if width - band >= band * 2 and height - band >= band * 2 else 8,
+        }
+
+    def _band(self, x):
+        if x < self._outer_left or x > self._outer_right:
+            return self._outer
+        if self._inner_left <= x <= self._inner_right:
+            return self._inner
+        return self._normal
+
+    def near_border(self, x, y):
+        """是否落在最宽的边框带内，用于事件路由的快速预筛"""
+        band = self._inner
+        return x <= band or y <= band or x >= self.width - band or y >= self.height - band
+
+    def edge_at(self, x, y):
+        """返回 (x, y) 所在的边缘位掩码：1 左、2 右、4 上、8 下"""
+        band = self._band(x)
+        edge = 0
+        if x <= band: edge |= 1
+        if x >= self.width - band: edge |= 2
+        if y <= band: edge |= 4
+        if y >= self.height - band: edge |= 8
+        return self._corners.get(edge, edge)
+
+
+class _SnapshotOverlay(QWidget):
+    """快照模式下覆盖整个窗口、拉伸绘制截图的遮罩"""
+
+    def __init__(self, window, pixmap):
+        super().__init__(window)
+        self._pixmap = pixmap
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setGeometry(window.rect())
+        self.raise_()
+        self.show()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(self.rect(), self._pixmap)
+
+
+class WindowResizer(QObject):
+    """专门处理窗口边框调整功能的类
+
+    以窗口为 parent，随窗口销毁，屏幕变化等信号连接也随之断开。
+    """
+
+    REPROBE_AFTER = 30.0  # 被判定过慢的调整模式在多少秒后重新试探
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.resize_margin = 10
+        self.resize_direction = None
+        self.start_global_pos = None
+        self.start_geometry = None
+        self.drag_offset = None
+        self.last_valid_cursor = None
+        self.dpi_scale = 1.0
+        self.cursor_updates = 0  # 光标检测次数，空闲时应保持不变
+        self.zone_map = ResizeZoneMap()
+
+        # 按显示器刷新率合并几何更新：一帧内只应用最后一次目标
+        self.pending_geometry = None
+        self.geometry_applies = 0
+        self.frame_timer = QTimer(self, singleShot=True, timeout=self._on_frame)
+        self.frame_timer.setTimerType(Qt.PreciseTimer)
+
+        # 调整大小策略
+        self.resize_mode = "auto"
+        self.active_mode = None
+        # 各模式实测的每帧耗时：模式 -> (几何应用与重绘的平均毫秒数, 最近测量时间)
+        self.frame_costs = {}
+        self._frame_cost = None  # 当前帧已累计的耗时，未在调整中时为 None
+        self._rubber_band = None
+        self._overlay = None
+        self._frozen_children = []
+
+        # 初始化设置
+        self.window.setMouseTracking(True)
+        self.window.winId()  # 确保原生窗口句柄已创建
+        self.window.windowHandle().screenChanged.connect(self.update_scale_factor)
+        self._update_screen_rect()
+        ScreenIndex.instance().changed.connect(self._update_screen_rect)
+        self.rebuild_zones()
+        self._update_frame_interval(QApplication.primaryScreen())
+        BorderEventRouter.instance().register(self)
+
+    def update_scale_factor(self):
+        """自动适应屏幕缩放比例"""
+        screen = self.window.windowHandle().screen()
+        self.dpi_scale = screen.devicePixelRatio()
+        self.resize_margin = int(10 * self.dpi_scale)
+        self.rebuild_zones()
+        self._update_frame_interval(screen)
+
+    def _update_frame_interval(self, screen):
+        rate = screen.refreshRate() if screen else 0
+        self.frame_timer.setInterval(max(1, int(1000 / rate)) if rate > 0 else 16)
+
+    def request_geometry(self, target):
+        """提交目标几何（QRect）或位置（QPoint），每帧最多应用一次"""
+        self.pending_geometry = target
+        if not self.frame_timer.isActive():
+            # 空闲时立即应用，保证延迟不超过一帧
+            self.flush_geometry()
+            self.frame_timer.start()
+
+    def _on_frame(self):
+        if self.pending_geometry is not None:
+            self._record_frame_cost()
+            self.flush_geometry()
+            self.frame_timer.start()
+
+    def add_frame_cost(self, seconds):
+        """累计当前帧的实际工作耗时（几何应用、窗口重绘），调整期间由窗口和 flush_geometry 调用"""
+        if self._frame_cost is not None:
+            self._frame_cost += seconds * 1000
+
+    def _record_frame_cost(self):
+        """把上一帧累计的耗时计入当前模式的平均值"""
+        cost, mode = self._frame_cost, self.active_mode
+        if not cost or not mode:
+            return
+        self._frame_cost = 0.0
+        old = self.frame_costs.get(mode)
+        average = cost if old is None else old[0] * 0.8 + cost * 0.2
+        self.frame_costs[mode] = (average, time.monotonic())
+
+    def set_resize_mode(self, mode):
+        """设置调整大小策略，取值见 RESIZE_MODES"""
+        if mode not in RESIZE_MODES:
+            raise ValueError(f"未知的调整模式: {mode}")
+        self.resize_mode = mode
+
+    def _choose_mode(self):
+        """auto 模式下优先实时调整，实测跟不上刷新率时依次降级"""
+        if self.resize_mode != "auto":
+            return self.resize_mode
+        budget = self.frame_timer.interval()
+        now = time.monotonic()
+        for mode in ("live", "snapshot"):
+            measured = self.frame_costs.get(mode)
+            # 测得太慢的模式过一段时间重新试探，窗口内容变轻后可以恢复
+            if measured is None or measured[0] <= budget or now - measured[1] > self.REPROBE_AFTER:
+                return mode
+        return "outline"
+
+    def _begin_resize(self):
+        self.active_mode = self._choose_mode()
+        self._frame_cost = 0.0
+        if self.active_mode == "outline":
+            self._rubber_band = QRubberBand(QRubberBand.Rectangle)
+            self._rubber_band.setGeometry(self.window.geometry())
+            self._rubber_band.show()
+        elif self.active_mode == "snapshot":
+            pixmap = self.window.grab()
+            layout = self.window.layout()
+            if layout is not None:
+                layout.setEnabled(False)
+            self._frozen_children = [
+                child for child in self.window.findChildren(QWidget, options=Qt.FindDirectChildrenOnly)
+                if child.isVisible() and child.updatesEnabled()
+            ]
+            for child in self._frozen_children:
+                child.setUpdatesEnabled(False)
+            self._overlay = _SnapshotOverlay(self.window, pixmap)
+
+    def _end_resize(self):
+        self._record_frame_cost()
+        self._frame_cost = None
+        mode, self.active_mode = self.active_mode, None
+        if mode == "outline":
+            geometry = self._rubber_band.geometry()
+            self._rubber_band.hide()
+            self._rubber_band.deleteLater()
+            self._rubber_band = None
+            self.geometry_applies += 1
+            self.window.setGeometry(geometry)
+        elif mode == "snapshot":
+            self._overlay.hide()
+            self._overlay.deleteLater()
+            self._overlay = None
+            for child in self._frozen_children:
+                child.setUpdatesEnabled(True)
+            self._frozen_children = []
+            layout = self.window.layout()
+            if layout is not None:
+                layout.setEnabled(True)
+                layout.activate()
+            self.window.update()
+
+    def is_suspended(self):
+        """快照模式调整期间窗口自身无需重绘背景"""
+        return self.active_mode == "snapshot"
+
+    def finish_geometry(self):
+        """拖动结束：应用最后一次目标并停止帧定时器"""
+        self.flush_geometry()
+        self.frame_timer.stop()
+
+    def flush_geometry(self):
+        """立即应用挂起的几何更新"""
+        target = self.pending_geometry
+        if target is None:
+            return
+        self.pending_geometry = None
+        if isinstance(target, QPoint):
+            self.geometry_applies += 1
+            self.window.move(target)
+        elif self.active_mode == "outline":
+            self._rubber_band.setGeometry(target)
+        else:
+            start = time.perf_counter()
+            self.geometry_applies += 1
+            self.window.setGeometry(target)
+            if self._overlay is not None:
+                self._overlay.setGeometry(self.window.rect())
+            self.add_frame_cost(time.perf_counter() - start)
+
+    def _update_screen_rect(self):
+        """窗口所在屏幕的可用区域，拖动和调整大小都限制在其中"""
+        self.screen_rect = ScreenIndex.instance().available_at(self.window.geometry().center())
+
+    def rebuild_zones(self):
+        """DPI 变化后重建热区表"""
+        self.zone_map.rebuild(self.window.width(), self.window.height(), self.resize_margin)
+
+    def zones(self):
+        """返回与窗口当前尺寸一致的热区表，尺寸变化后在下一次命中检测时重建"""
+        zone_map = self.zone_map
+        if zone_map.width != self.window.width() or zone_map.height != self.window.height():
+            self.rebuild_zones()
+        return zone_map
+
+    def update_resize_cursor(self, pos=None):
+        """更新鼠标光标形状以指示可调整方向"""
+        if pos is None:
+            pos = self.window.mapFromGlobal(QCursor.pos())
+        self.cursor_updates += 1
+
+        # 热区以逻辑坐标构建，DPI 已体现在 resize_margin 中
+        edge = self.zones().edge_at(pos.x(), pos.y())
+        if edge == 0:
+            if self.last_valid_cursor is not None:
+                self.window.unsetCursor()
+                self.last_valid_cursor = None
+        else:
+            new_cursor = ResizeZoneMap.CURSORS.get(edge, Qt.ArrowCursor)
+            if new_cursor != self.last_valid_cursor:
+                self.window.setCursor(new_cursor)
+                self.last_valid_cursor = new_cursor
+
+    def handle_enter_event(self, event):
+        """鼠标进入窗口时按进入位置设置光标"""
+        self.update_resize_cursor(event.position().toPoint())
+
+    def handle_hover_move(self, pos):
+        """边框附近的悬停移动（由 BorderEventRouter 转交），pos 为窗口坐标"""
+        if self.resize_direction is None:
+            self.update_resize_cursor(pos)
+
+    def _get_resize_edge(self, pos):
+        """确定鼠标位于哪个可调整边缘"""
+        return self.zones().edge_at(pos.x(), pos.y())
+
+    def handle_mouse_press(self, event):
+        """处理鼠标按下事件"""
+        if event.button() == Qt.LeftButton:
+            self.start_global_pos = event.globalPosition().toPoint()
+            self.start_geometry = self.window.geometry()
+            self._update_screen_rect()
+
+            local_pos = event.position().toPoint()
+            self.resize_direction = self._get_resize_edge(local_pos)
+            if self.resize_direction:
+                self._begin_resize()
+
+            if not self.resize_direction:
+                # 窗口拖动模式
+                self.drag_offset = self.start_global_pos - self.window.geometry().topLeft()
+
+    def handle_mouse_move(self, event):
+        """处理按住左键时的调整与拖动，悬停光标由 BorderEventRouter 负责"""
+        current_global_pos = event.globalPosition().toPoint()
+
+        if self.resize_direction and event.buttons() == Qt.LeftButton:
+            # 窗口调整模式
+            delta = current_global_pos - self.start_global_pos
+            new_geo = QRect(self.start_geometry)
+
+            # 根据方向调整几何
+            if self.resize_direction & 1:  # 左
+                new_geo.setLeft(min(new_geo.left() + delta.x(),
+                                    new_geo.right() - self.window.minimumWidth()))
+            if self.resize_direction & 2:  # 右
+                new_geo.setRight(max(new_geo.right() + delta.x(),
+                                     new_geo.left() + self.window.minimumWidth()))
+            if self.resize_direction & 4:  # 上
+                new_geo.setTop(min(new_geo.top() + delta.y(),
+                                   new_geo.bottom() - self.window.minimumHeight()))
+            if self.resize_direction & 8:  # 下
+                new_geo.setBottom(max(new_geo.bottom() + delta.y(),
+                                      new_geo.top() + self.window.minimumHeight()))
+
+            # 限制在屏幕范围内
+            new_geo = new_geo.intersected(self.screen_rect)
+            self.request_geometry(new_geo)
+
+        elif event.buttons() == Qt.LeftButton and hasattr(self, 'drag_offset'):
+            # 窗口拖动模式
+            new_pos = current_global_pos - self.drag_offset
+            # 限制窗口在屏幕内
+            new_x = max(self.screen_rect.left(),
+                        min(new_pos.x(), self.screen_rect.right() - self.window.width()))
+            new_y = max(self.screen_rect.top(),
+                        min(new_pos.y(), self.screen_rect.bottom() - self.window.height()))
+            self.request_geometry(QPoint(new_x, new_y))
+
+    def handle_mouse_release(self, event):
+        """处理鼠标释放事件"""
+        self.finish_geometry()
+        if self.active_mode:
+            self._end_resize()
+        self.resize_direction = None
+        self.update_resize_cursor(event.position().toPoint())
+
+    def handle_leave_event(self, event):
+        """处理鼠标离开窗口事件"""
+        self.window.unsetCursor()
+        self.last_valid_cursor = None
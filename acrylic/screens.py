@@ -0,0 +1,88 @@
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QApplication
+
+
+class ScreenEntry:
+    """单个屏幕的几何快照"""
+
+    __slots__ = ("screen", "geometry", "available")
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.geometry = screen.geometry()
+        self.available = screen.availableGeometry()
+
+
+class ScreenIndex(QObject):
+    """缓存的多显示器几何索引
+
+    贴边吸附、窗口拖动限制和迷你模式共享同一份屏幕几何，只在屏幕增删或几何变化时刷新，
+    鼠标移动时不再调用 QApplication.screenAt / availableGeometry。
+    """
+
+    changed = Signal()
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """返回进程内唯一的屏幕索引"""
+        if cls._instance is None:
+            cls._instance = cls(QApplication.instance())
+        return cls._instance
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._app = app
+        self.entries = []
+        self._last = None  # 上次命中的屏幕，连续的鼠标移动几乎总落在同一块屏幕上
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self.refresh)
+        app.primaryScreenChanged.connect(self.refresh)
+        for screen in app.screens():
+            self._watch(screen)
+        self.refresh()
+
+    def _watch(self, screen):
+        screen.geometryChanged.connect(self.refresh)
+        screen.availableGeometryChanged.connect(self.refresh)
+
+    def _on_screen_added(self, screen):
+        self._watch(screen)
+        self.refresh()
+
+    def refresh(self):
+        """重建索引，主屏幕排在第一位"""
+        primary = self._app.primaryScreen()
+        screens = [s for s in self._app.screens() if s is not primary]
+        if primary is not None:
+            screens.insert(0, primary)
+        self.entries = [ScreenEntry(s) for s in screens]
+        self._last = self.entries[0] if self.entries else None
+        self.changed.emit()
+
+    def entry_at(self, pos):
+        """返回包含 pos 的屏幕，落在所有屏幕之外时返回主屏幕"""
+        last = self._last
+        if last is not None and last.geometry.contains(pos):
+            return last
+        for entry in self.entries:
+            if entry.geometry.contains(pos):
+                self._last = entry
+                return entry
+        return self.entries[0] if self.entries else None
+
+    def available_at(self, pos):
+        """pos 所在屏幕的可用区域"""
+        return self.entry_at(pos).available
+
+    def nearest_edge(self, pos):
+        """返回 (边, 可用区域)：pos 所在屏幕可用区域中离 pos 最近的边，'left'/'right'/'top'/'bottom'"""
+        geo = self.available_at(pos)
+        distances = {
+            'left': abs(pos.x() - geo.left()),
+            'right': abs(geo.right() - pos.x()),
+            'top': abs(pos.y() - geo.top()),
+            'bottom': abs(geo.bottom() - pos.y())
+        }
+        return min(distances, key=distances.get), geo
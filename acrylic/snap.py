@@ -0,0 +1,126 @@
+"""标题栏拖动时的贴边吸附
+
+拖动过程中只移动一个半透明的预览框，松开鼠标时才对真实窗口做一次几何变更。
+"""
+from PySide6.QtCore import Qt, QObject, QRect
+from PySide6.QtGui import QColor, QPainter, QPen
+from PySide6.QtWidgets import QWidget
+
+from .screens import ScreenIndex
+
+
+class SnapZones:
+    """单个屏幕的吸附热区，按可用区域一次性算好阈值和目标几何"""
+
+    __slots__ = ("left", "right", "top", "bottom", "corner_top", "corner_bottom", "targets")
+
+    def __init__(self, geo, margin, corner):
+        self.left = geo.left() + margin
+        self.right = geo.right() - margin
+        self.top = geo.top() + margin
+        self.bottom = geo.bottom() - margin
+        self.corner_top = geo.top() + corner
+        self.corner_bottom = geo.bottom() - corner
+
+        half_w, half_h = geo.width() // 2, geo.height() // 2
+        x, y, mid_x, mid_y = geo.left(), geo.top(), geo.left() + half_w, geo.top() + half_h
+        self.targets = {
+            "maximize": QRect(geo),
+            "left": QRect(x, y, half_w, geo.height()),
+            "right": QRect(mid_x, y, geo.width() - half_w, geo.height()),
+            "top_left": QRect(x, y, half_w, half_h),
+            "top_right": QRect(mid_x, y, geo.width() - half_w, half_h),
+            "bottom_left": QRect(x, mid_y, half_w, geo.height() - half_h),
+            "bottom_right": QRect(mid_x, mid_y, geo.width() - half_w, geo.height() - half_h),
+        }
+
+    def zone_at(self, x, y):
+        """返回 (x, y) 所在的吸附区名称，不在任何热区内返回 None"""
+        if x <= self.left:
+            side = "left"
+        elif x >= self.right:
+            side = "right"
+        else:
+            return "maximize" if y <= self.top else None
+        if y <= self.corner_top:
+            return "top_" + side
+        if y >= self.corner_bottom:
+            return "bottom_" + side
+        return side
+
+
+class SnapPreview(QWidget):
+    """吸附目标区域的半透明预览框"""
+
+    def __init__(self):
+        super().__init__(None, Qt.Tool | Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint
+                         | Qt.WindowTransparentForInput | Qt.WindowDoesNotAcceptFocus)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(255, 255, 255, 160), 2))
+        painter.setBrush(QColor(255, 255, 255, 50))
+        painter.drawRoundedRect(self.rect().adjusted(4, 4, -4, -4), 8, 8)
+
+
+class SnapEngine(QObject):
+    """拖动期间计算吸附区并显示预览，松开时提交一次几何变更
+
+    随 parent 一起销毁，屏幕变化的连接也随之断开。
+    """
+
+    def __init__(self, margin=20, corner=120, parent=None):
+        super().__init__(parent)
+        self.margin = margin
+        self.corner = corner
+        self.zone = None
+        self._target = None
+        self._preview = None
+        self._zones = {}  # ScreenEntry -> SnapZones
+        ScreenIndex.instance().changed.connect(self._clear_zones)
+
+    def _clear_zones(self):
+        self._zones.clear()
+
+    def _zones_for(self, entry):
+        zones = self._zones.get(entry)
+        if zones is None:
+            zones = self._zones[entry] = SnapZones(entry.available, self.margin, self.corner)
+        return zones
+
+    def update(self, pos):
+        """根据全局坐标更新预览，只有吸附区变化时才移动或隐藏预览框"""
+        entry = ScreenIndex.instance().entry_at(pos)
+        if entry is None:
+            return None
+        zones = self._zones_for(entry)
+        zone = zones.zone_at(pos.x(), pos.y())
+        target = zones.targets[zone] if zone else None
+        if zone != self.zone or target != self._target:
+            self.zone, self._target = zone, target
+            self._show_preview(target)
+        return zone
+
+    def _show_preview(self, target):
+        if target is None:
+            if self._preview is not None:
+                self._preview.hide()
+            return
+        if self._preview is None:
+            self._preview = SnapPreview()
+        self._preview.setGeometry(target)
+        self._preview.show()
+
+    def commit(self):
+        """结束拖动，返回 (吸附区, 目标几何)，未进入热区时返回 (None, None)"""
+        result = (self.zone, self._target)
+        self.cancel()
+        return result
+
+    def cancel(self):
+        self.zone = self._target = None
+        if self._preview is not None:
+            self._preview.hide()
@@ -0,0 +1,109 @@
+"""模糊背景快照的磁盘缓存
+
+窗口关闭时把最后一帧模糊背景缩小压缩后写入缓存目录，下次启动先绘制它，
+再在事件循环空闲时用真实截图刷新。快照按窗口的键（objectName 或显式指定）区分，
+屏幕几何或缩放比例变化后旧快照作废，窗口位置或尺寸与保存时不同则不使用。
+"""
+import json
+import os
+import time
+
+from PySide6.QtCore import QStandardPaths, Qt
+from PySide6.QtGui import QImage
+
+
+class SnapshotCache:
+    def __init__(self, directory=None, max_bytes=2 * 1024 * 1024, max_side=320):
+        if directory is None:
+            base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+            directory = os.path.join(base or os.path.expanduser("~/.cache"), "acrylic")
+        self.directory = directory
+        self.max_bytes = max_bytes  # 缓存目录总大小上限
+        self.max_side = max_side  # 快照最长边像素，模糊图缩小后几乎无损
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".jpg", base + ".json"
+
+    @staticmethod
+    def _screen_info(widget):
+        screen = widget.screen()
+        geo = screen.geometry()
+        return [geo.x(), geo.y(), geo.width(), geo.height()], screen.devicePixelRatio()
+
+    def save(self, key, widget, image):
+        """保存快照及其几何信息"""
+        if image is None or image.isNull():
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        image_path, meta_path = self._paths(key)
+
+        small = image
+        if max(image.width(), image.height()) > self.max_side:
+            small = image.scaled(self.max_side, self.max_side,
+                                 Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if not small.save(image_path, "JPG", 70):
+            return False
+
+        screen_geo, dpr = self._screen_info(widget)
+        geo = widget.geometry()
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "geometry": [geo.x(), geo.y(), geo.width(), geo.height()],
+                "screen": screen_geo,
+                "dpr": dpr,
+                "saved": time.time(),
+            }, f)
+        self._prune()
+        return True
+
+    def load(self, key, widget):
+        """读取仍然有效的快照
+
+        屏幕或分辨率变化时删除并返回 None；窗口几何与保存时不同（背后的内容不同）时返回 None。
+        """
+        image_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        screen_geo, dpr = self._screen_info(widget)
+        if meta.get("screen") != screen_geo or meta.get("dpr") != dpr:
+            self.discard(key)
+            return None
+        geo = widget.geometry()
+        if meta.get("geometry") != [geo.x(), geo.y(), geo.width(), geo.height()]:
+            return None
+
+        image = QImage(image_path)
+        return None if image.isNull() else image
+
+    def discard(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _prune(self):
+        """按保存时间淘汰最旧的快照，直到目录总大小不超过上限"""
+        entries = {}
+        for name in os.listdir(self.directory):
+            key, ext = os.path.splitext(name)
+            if ext not in (".jpg", ".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            mtime, size = entries.get(key, (0, 0))
+            entries[key] = (max(mtime, stat.st_mtime), size + stat.st_size)
+
+        total = sum(size for _, size in entries.values())
+        for key, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            self.discard(key)
+            total -= size
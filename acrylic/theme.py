@@ -0,0 +1,87 @@
+"""应用级主题引擎
+
+各组件把自己的样式片段注册到这里，合并成一份 QApplication 级样式表，只在片段变化时解析一次。
+应用自己设置的样式表会被保留并排在组件样式之后，同等优先级时以应用的规则为准。
+控件通过 objectName 与动态属性匹配规则，状态切换用 set_state 修改属性并重新 polish，
+不再为每个控件、每次状态变化调用 setStyleSheet。
+"""
+from PySide6.QtWidgets import QApplication
+
+BASE_STYLE = """
+AcrylicWindow QWidget#AcrylicContent {
+    background: transparent;
+}
+AcrylicWindow QSizeGrip {
+    width: 16px;
+    height: 16px;
+}
+TitleBar {
+    background-color: rgba(30, 30, 30, 0.6);
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+}
+TitleBar QLabel {
+    color: white;
+    padding-left: 6px;
+}
+TitleButton {
+    background: transparent;
+    border: none;
+}
+"""
+
+
+class ThemeEngine:
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """返回进程内唯一的主题引擎，首次调用时注册基础样式"""
+        if cls._instance is None:
+            cls._instance = cls()
+            cls._instance.register("acrylic", BASE_STYLE)
+        return cls._instance
+
+    def __init__(self):
+        self._fragments = {}
+        self._compiled = None
+        self._external = ""  # 引擎之外设置的应用样式表
+        self._applied = None  # 上次设置到 QApplication 的完整样式表
+        self._own = None  # 其中由引擎生成的部分
+        self.compiles = 0  # 实际调用 QApplication.setStyleSheet 的次数
+
+    def register(self, name, qss):
+        """注册或替换一段样式，内容未变化时不会触发重新解析"""
+        if self._fragments.get(name) == qss:
+            return
+        self._fragments[name] = qss
+        self._compiled = None
+        self.apply()
+
+    def apply(self):
+        """把合并后的样式表与应用已有的样式表一起设置到 QApplication"""
+        app = QApplication.instance()
+        if app is None:
+            return
+        if self._compiled is None:
+            self._compiled = "\n".join(self._fragments.values())
+        current = app.styleSheet()
+        if current != self._applied:
+            # 样式表被外部修改过：去掉其中上次由引擎写入的部分，其余作为应用样式保留
+            self._external = current.replace(self._own, "", 1).strip() if self._own else current
+        sheet = "\n".join(part for part in (self._compiled, self._external) if part)
+        if sheet != current:
+            self.compiles += 1
+            app.setStyleSheet(sheet)
+        self._applied, self._own = sheet, self._compiled
+
+    @staticmethod
+    def set_state(widget, name, value):
+        """切换动态属性并重新应用样式，属性值不变时什么也不做"""
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
@@ -0,0 +1,233 @@
+from PySide6.QtCore import (Qt, QPropertyAnimation, Property,
+                            Signal, QEvent, QEasingCurve)
+from PySide6.QtGui import QColor, QPainter, QFont
+from PySide6.QtWidgets import (QWidget, QPushButton, QLabel, QHBoxLayout,
+                              QSizePolicy, QMenu)
+
+from .glyph_cache import best_icon_font, glyph_pixmap, rounded_background
+from .snap import SnapEngine
+from .theme import ThemeEngine
+
+
+def parse_color(value):
+    """解析颜色配置：QColor 能识别的名称或 #rrggbb，以及 CSS 风格的 rgba(r, g, b, 0~1)"""
+    if isinstance(value, QColor):
+        return QColor(value)
+    text = value.strip()
+    if text.startswith("rgba(") and text.endswith(")"):
+        r, g, b, a = (part.strip() for part in text[5:-1].split(","))
+        alpha = float(a)
+        return QColor(int(r), int(g), int(b), round(alpha * 255) if alpha <= 1 else int(alpha))
+    return QColor(text)
+
+
+class TitleButton(QPushButton):
+    bgColorChanged = Signal(QColor)
+
+    def __init__(self, icon_code, config=None, parent=None):
+        super().__init__(parent)
+        self._icon_code = icon_code
+        self._bg_color = QColor(0, 0, 0, 0)
+        self._config = {
+            'size': 32,
+            'radius': 4,
+            'color': 'white',
+            'hover_color': 'rgba(255, 255, 255, 0.15)',
+            'press_color': 'rgba(255, 255, 255, 0.25)',
+            'font_size': 10,
+            'font_family': self._best_icon_font()
+        }
+        if config:
+            self._config.update(config)
+        self._hover_color = parse_color(self._config['hover_color'])
+        self._press_color = parse_color(self._config['press_color'])
+
+        self._setup_ui()
+        self._setup_animation()
+
+    def _best_icon_font(self):
+        return best_icon_font()
+
+    def _setup_ui(self):
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setCursor(Qt.ArrowCursor)
+        self.setFixedSize(self._config['size'], self._config['size'])
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+
+    def _setup_animation(self):
+        self._anim = QPropertyAnimation(self, b"bgColor")
+        self._anim.setDuration(150)
+        self._anim.setEasingCurve(QEasingCurve.OutQuad)
+
+    def get_bg_color(self):
+        return self._bg_color
+
+    def set_bg_color(self, color):
+        if self._bg_color != color:
+            self._bg_color = color
+            self.bgColorChanged.emit(color)
+            self.update()
+
+    bgColor = Property(QColor, get_bg_color, set_bg_color, notify=bgColorChanged)
+
+    def enterEvent(self, event):
+        self._anim.stop()
+        self._anim.setStartValue(self.bgColor)
+        self._anim.setEndValue(self._hover_color)
+        self._anim.start()
+
+    def leaveEvent(self, event):
+        self._anim.stop()
+        self._anim.setStartValue(self.bgColor)
+        self._anim.setEndValue(QColor(0, 0, 0, 0))
+        self._anim.start()
+
+    def mousePressEvent(self, event):
+        self._anim.stop()
+        self.bgColor = QColor(self._press_color)
+        super().mousePressEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        w, h, dpr = self.width(), self.height(), self.devicePixelRatioF()
+
+        # 绘制背景
+        if self.bgColor.alpha() > 0:
+            painter.setOpacity(self.bgColor.alphaF())
+            painter.drawPixmap(0, 0, rounded_background(w, h, self._config['radius'], self.bgColor, dpr))
+            painter.setOpacity(1.0)
+
+        # 绘制图标
+        painter.drawPixmap(0, 0, glyph_pixmap(self._icon_code, self._config['font_family'],
+                                              self._config['font_size'], self._config['color'],
+                                              w, h, dpr))
+
+
+class TitleBar(QWidget):
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.window = parent
+        self.drag_pos = None
+        self._drag_offset = None
+        self._snap_margin = 20
+        self._snap = SnapEngine(self._snap_margin, parent=self)
+        self._init_ui()
+        self._init_style()
+
+    def _init_ui(self):
+        self.setFixedHeight(36)
+        self.setMouseTracking(True)
+        self.layout = QHBoxLayout(self)
+        self.layout.setContentsMargins(8, 0, 8, 0)
+        self.layout.setSpacing(4)
+
+        # 窗口图标
+        self.icon_label = QLabel()
+        self.icon_label.setFixedSize(20, 20)
+        self._update_window_icon()
+
+        # 窗口标题
+        self.title_label = QLabel(self.window.windowTitle())
+        self.title_label.setFont(QFont("Segoe UI", 9))
+        self.title_label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.title_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+
+        # 窗口控制按钮
+        btn_config = {
+            'size': 32,
+            'radius': 4,
+            'color': '#ffffff',
+            'hover_color': 'rgba(255,255,255,0.15)',
+            'press_color': 'rgba(255,255,255,0.25)'
+        }
+        self.min_btn = TitleButton("\uE921", config=btn_config)
+        self.max_btn = TitleButton("\uE922", config=btn_config)
+        self.close_btn = TitleButton("\uE8BB", config={
+            **btn_config,
+            'color': '#ff5f57',
+            'hover_color': 'rgba(255, 95, 87, 0.3)',
+            'press_color': 'rgba(255, 59, 48, 0.45)'
+        })
+
+        # 按钮功能
+        self.min_btn.clicked.connect(self.window.showMinimized)
+        self.max_btn.clicked.connect(self.toggle_maximize)
+        self.close_btn.clicked.connect(self.window.close)
+
+        # 布局
+        self.layout.addWidget(self.icon_label)
+        self.layout.addWidget(self.title_label)
+        self.layout.addWidget(self.min_btn)
+        self.layout.addWidget(self.max_btn)
+        self.layout.addWidget(self.close_btn)
+
+        # 事件绑定
+        self.window.windowTitleChanged.connect(self.title_label.setText)
+        self.installEventFilter(self)
+
+    def _init_style(self):
+        # 样式规则见 theme.BASE_STYLE
+        self.setAttribute(Qt.WA_StyledBackground)
+        ThemeEngine.instance()
+
+    def toggle_maximize(self):
+        if self.window.isMaximized():
+            self.window.showNormal()
+            self.max_btn._icon_code = "\uE922"
+        else:
+            self.window.showMaximized()
+            self.max_btn._icon_code = "\uE923"
+        self.max_btn.update()
+
+    def _update_window_icon(self):
+        icon = self.window.windowIcon()
+        if not icon.isNull():
+            self.icon_label.setPixmap(icon.pixmap(20, 20))
+
+    def contextMenuEvent(self, event):
+        menu = QMenu()
+        menu.addAction("最小化", self.window.showMinimized)
+        menu.addAction("最大化" if not self.window.isMaximized() else "还原",
+                       self.toggle_maximize)
+        menu.addAction("关闭", self.window.close)
+        menu.exec(event.globalPosition().toPoint())
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.drag_pos = event.globalPosition().toPoint()
+            self._drag_offset = self.drag_pos - self.window.pos()
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() == Qt.LeftButton and self.drag_pos:
+            current_pos = event.globalPosition().toPoint()
+            target = current_pos - self._drag_offset
+            resizer = getattr(self.window, "window_resizer", None)
+            if resizer is not None:
+                # 与边框调整共用按帧合并的几何更新
+                resizer.request_geometry(target)
+            else:
+                self.window.move(target)
+            self.drag_pos = current_pos
+            self._snap.update(current_pos)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton and self.drag_pos:
+            self.drag_pos = None
+            resizer = getattr(self.window, "window_resizer", None)
+            if resizer is not None:
+                resizer.finish_geometry()
+            self._apply_snap(*self._snap.commit())
+
+    def _apply_snap(self, zone, target):
+        """拖动结束时按吸附区对窗口做一次几何变更"""
+        if zone == "maximize":
+            if not self.window.isMaximized():
+                self.toggle_maximize()
+        elif target is not None:
+            self.window.setGeometry(target)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonDblClick:
+            self.toggle_maximize()
+            return True
+        return super().eventFilter(obj, event)
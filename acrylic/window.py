@@ -0,0 +1,127 @@
+import time
+
+from PySide6.QtCore import Qt, QEvent
+from PySide6.QtGui import QPainter
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizeGrip
+
+from .effect import AcrylicEffect
+from .title_bar import TitleBar
+from .resizer import WindowResizer
+from .theme import ThemeEngine
+
+
+class AcrylicWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowMinMaxButtonsHint)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setMinimumSize(400, 300)
+        ThemeEngine.instance()
+
+        # 亚克力效果
+        self.acrylic = AcrylicEffect(self)
+        self.acrylic.apply_effect()
+
+        self.main_content = QWidget()
+        self.main_content.setObjectName("AcrylicContent")
+        self.main_content.setAttribute(Qt.WA_TranslucentBackground)
+
+        # 使用垂直布局包裹内容
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.title_bar = TitleBar(self)
+        self.main_layout.addWidget(self.title_bar)
+        self.main_layout.setAlignment(self.title_bar, Qt.AlignTop)
+        self.main_layout.addWidget(self.main_content)
+
+        # 窗口调整功能
+        self.window_resizer = WindowResizer(self)
+
+        # 右下角调整手柄
+        self.size_grip = QSizeGrip(self)
+
+        # 停靠等场景下用缓存图代替完整渲染
+        self._frozen_pixmap = None
+        self._frozen_children = []
+
+    def mousePressEvent(self, event):
+        self.window_resizer.handle_mouse_press(event)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self.window_resizer.handle_mouse_move(event)
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self.window_resizer.handle_mouse_release(event)
+        super().mouseReleaseEvent(event)
+
+    def enterEvent(self, event):
+        self.window_resizer.handle_enter_event(event)
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.window_resizer.handle_leave_event(event)
+        super().leaveEvent(event)
+
+    def suspend_rendering(self, pixmap):
+        """冻结子控件布局与重绘、暂停亚克力背景，窗口只绘制 pixmap"""
+        if self._frozen_pixmap is not None:
+            self._frozen_pixmap = pixmap
+            return
+        self._frozen_pixmap = pixmap
+        self.acrylic.suspend()
+        self.main_layout.setEnabled(False)
+        self._frozen_children = [
+            child for child in self.findChildren(QWidget, options=Qt.FindDirectChildrenOnly)
+            if child.updatesEnabled()
+        ]
+        for child in self._frozen_children:
+            child.setUpdatesEnabled(False)
+        self.update()
+
+    def resume_rendering(self):
+        """恢复完整渲染"""
+        if self._frozen_pixmap is None:
+            return
+        self._frozen_pixmap = None
+        for child in self._frozen_children:
+            child.setUpdatesEnabled(True)
+        self._frozen_children = []
+        self.main_layout.setEnabled(True)
+        self.main_layout.activate()
+        self.acrylic.resume()
+        self.update()
+
+    def event(self, event):
+        if event.type() == QEvent.UpdateRequest and self.window_resizer.active_mode:
+            # 调整大小期间统计实际重绘耗时，auto 模式据此选择策略
+            start = time.perf_counter()
+            result = super().event(event)
+            self.window_resizer.add_frame_cost(time.perf_counter() - start)
+            return result
+        return super().event(event)
+
+    def closeEvent(self, event):
+        self.acrylic.save_snapshot()
+        super().closeEvent(event)
+
+    def resizeEvent(self, event):
+        """优化手柄位置更新"""
+        self.size_grip.move(
+            self.width() - self.size_grip.width(),
+            self.height() - self.size_grip.height()
+        )
+        self.acrylic._invalidate_cache()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        if self.window_resizer.is_suspended():
+            return
+        painter = QPainter(self)
+        if self._frozen_pixmap is not None:
+            # 只重绘暴露区域，停靠时即屏幕上可见的那一条
+            painter.drawPixmap(event.rect(), self._frozen_pixmap, event.rect())
+            return
+        self.acrylic.paint(painter)
+        super().paintEvent(event)
@@ -0,0 +1,101 @@
+"""冷启动基准：测量 acrylic 包导入耗时与窗口首帧绘制耗时
+
+用法：
+    python benchmarks/startup.py [--runs N] [--app knowledge]
+
+每轮在独立子进程中运行，保证模块缓存为冷状态。无显示环境下可设置 QT_QPA_PLATFORM=offscreen。
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _measure(app_name):
+    """在当前进程内测量一次，返回各阶段耗时（毫秒）"""
+    t0 = time.perf_counter()
+    from PySide6.QtCore import QEvent, QObject, QTimer
+    from PySide6.QtWidgets import QApplication
+    t_qt = time.perf_counter()
+
+    if app_name == "knowledge":
+        from test_pyside import KnowledgeManager as window_cls
+    else:
+        from acrylic import AcrylicWindow as window_cls
+    t_import = time.perf_counter()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    if app_name == "knowledge":
+        # 使用临时数据库，不读写用户的笔记库
+        temp_dir = tempfile.TemporaryDirectory()
+        window = window_cls(os.path.join(temp_dir.name, "notes.db"))
+    else:
+        window = window_cls()
+    t_construct = time.perf_counter()
+
+    timings = {}
+
+    def on_painted():
+        timings["first_paint"] = time.perf_counter()
+        app.exit()  # quit() 会先关闭窗口，之后排队的截图模糊可能在已关闭的窗口上启动
+
+    class FirstPaint(QObject):
+        seen = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and not self.seen:
+                # 排到绘制完成之后再计时
+                self.seen = True
+                QTimer.singleShot(0, on_painted)
+            return False
+
+    watcher = FirstPaint()
+    window.installEventFilter(watcher)
+    window.show()
+    QTimer.singleShot(5000, app.exit)  # 兜底，防止无绘制时挂起
+    app.exec()
+
+    first_paint = timings.get("first_paint", time.perf_counter())
+    window.close()  # 停止后台线程，避免退出时销毁仍在运行的 QThread
+    return {
+        "import_qt": (t_qt - t0) * 1000,
+        "import_acrylic": (t_import - t_qt) * 1000,
+        "construct": (t_construct - t_import) * 1000,
+        "first_paint": (first_paint - t0) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--app", choices=("window", "knowledge"), default="window")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, ROOT)
+        print(json.dumps(_measure(args.app)))
+        return
+
+    samples = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", "--app", args.app],
+            check=True, capture_output=True, text=True, cwd=ROOT,
+        ).stdout
+        samples.append(json.loads(out.strip().splitlines()[-1]))
+
+    print(f"{args.app}: {args.runs} 次冷启动（中位数 / 最小值，毫秒）")
+    for key in samples[0]:
+        values = [s[key] for s in samples]
+        print(f"  {key:<16}{statistics.median(values):9.1f}{min(values):9.1f}")
+
+
+if __name__ == "__main__":
+    main()
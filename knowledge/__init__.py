@@ -0,0 +1,53 @@
+"""知库管理（KnowledgeManager）使用的笔记数据与视图组件
+
+公开类在首次访问时才导入对应子模块，与 acrylic 包保持一致。
+"""
+import importlib
+
+__all__ = [
+    "NoteListModel",
+    "NoteDelegate",
+    "Note",
+    "NoteStore",
+    "NoteDatabase",
+    "SearchIndex",
+    "AsyncSearch",
+    "DocumentCache",
+    "LargeNoteView",
+    "PieceTable",
+    "AutosaveJournal",
+    "ExportWorker",
+    "ImportWorker",
+    "PreviewCache",
+]
+
+# 公开名称 -> 定义它的子模块
+_EXPORTS = {
+    "NoteListModel": ".note_list",
+    "NoteDelegate": ".note_list",
+    "Note": ".store",
+    "NoteStore": ".store",
+    "NoteDatabase": ".storage",
+    "SearchIndex": ".search",
+    "AsyncSearch": ".async_search",
+    "DocumentCache": ".document_cache",
+    "LargeNoteView": ".large_file",
+    "PieceTable": ".large_file",
+    "AutosaveJournal": ".journal",
+    "ExportWorker": ".export",
+    "ImportWorker": ".importer",
+    "PreviewCache": ".preview",
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # 之后的访问不再经过 __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,167 @@
+"""边输入边搜索
+
+输入先经过防抖，查询在独立线程中用自己的 SQLite 连接执行；新查询到来时递增代号并
+中断正在执行的旧查询，线程只回传最新代号的结果。结果按批发出，界面逐批插入；
+按 BM25 排序的查询要等 SQLite 对全部命中打分排序后才产出第一行，分批并不缩短
+首批结果的等待，只有不排序的单字查询是边取边发。
+"""
+import sqlite3
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+from PySide6.QtGui import QColor, QTextCursor
+from PySide6.QtWidgets import QTextEdit
+
+from .search import SearchIndex
+
+
+class _SearchWorker(QObject):
+    results = Signal(int, list, bool)  # 代号, 本批笔记 ID, 是否已结束
+    failed = Signal(int, str)  # 代号, 错误信息
+
+    def __init__(self, path, batch):
+        super().__init__()
+        self._path = path
+        self._batch = batch
+        self._conn = None
+        self._index = None
+        self.generation = 0  # 最新代号，由界面线程写入
+
+    def interrupt(self):
+        """中断正在执行的查询，可在任意线程调用"""
+        conn = self._conn
+        if conn is not None:
+            conn.interrupt()
+
+    @Slot()
+    def prepare(self):
+        """线程启动后提前打开连接，首次查询不必等待；出错时留给查询报告"""
+        try:
+            self.open()
+        except sqlite3.Error:
+            pass
+
+    def open(self):
+        if self._conn is None:
+            # 线程结束后由界面线程关闭，因此关闭同线程检查
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            try:
+                self._index = SearchIndex(conn)
+            except sqlite3.Error:
+                conn.close()
+                raise
+            self._conn = conn
+
+    @Slot(int, str, int)
+    def run(self, generation, text, limit):
+        if generation != self.generation:
+            return  # 排队期间已被新查询取代
+        batch = []
+        try:
+            self.open()
+            for note_id, _ in self._index.query(text, limit):
+                if generation != self.generation:
+                    return
+                batch.append(note_id)
+                if len(batch) >= self._batch:
+                    self.results.emit(generation, batch, False)
+                    batch = []
+        except sqlite3.Error as e:
+            if generation != self.generation:
+                return  # 被新查询 interrupt 中断
+            self.failed.emit(generation, str(e))
+            return
+        self.results.emit(generation, batch, True)
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class AsyncSearch(QObject):
+    """界面线程一侧的防抖与结果过滤"""
+
+    starting = Signal(str)  # 即将派发查询
+    results = Signal(list, bool)  # 本批笔记 ID, 是否已结束
+    failed = Signal(str)  # 当前查询出错（不含被新查询中断）
+    cleared = Signal()
+    _dispatch = Signal(int, str, int)
+
+    def __init__(self, path, delay=150, limit=50, batch=10, parent=None):
+        super().__init__(parent)
+        self.limit = limit
+        self._text = ""
+        self._generation = 0
+
+        self._thread = QThread(self)
+        self._worker = _SearchWorker(path, batch)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.prepare)
+        self._dispatch.connect(self._worker.run)
+        self._worker.results.connect(self._on_results)
+        self._worker.failed.connect(self._on_failed)
+        self._thread.start()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self._run)
+
+    def text(self):
+        return self._text
+
+    def request(self, text, immediate=False):
+        """更新搜索词；空白文本立即清除结果，其余在防抖后查询"""
+        self._text = text.strip()
+        self._cancel()
+        if not self._text:
+            self._timer.stop()
+            self.cleared.emit()
+        elif immediate:
+            self._timer.stop()
+            self._run()
+        else:
+            self._timer.start()
+
+    def _cancel(self):
+        self._generation += 1
+        self._worker.generation = self._generation
+        self._worker.interrupt()
+
+    def _run(self):
+        self.starting.emit(self._text)
+        self._dispatch.emit(self._generation, self._text, self.limit)
+
+    def _on_results(self, generation, note_ids, finished):
+        if generation == self._generation:
+            self.results.emit(note_ids, finished)
+
+    def _on_failed(self, generation, message):
+        if generation == self._generation:
+            self.failed.emit(message)
+
+    def stop(self):
+        """结束工作线程，窗口关闭时调用"""
+        self._timer.stop()
+        self._cancel()
+        self._thread.quit()
+        self._thread.wait()
+        self._worker.close()
+
+
+def highlight_matches(editor, text, color=QColor(255, 213, 79, 160), limit=500):
+    """用 extraSelections 标出编辑器中与搜索词匹配的片段，返回匹配数"""
+    selections = []
+    document = editor.document()
+    for word in text.split():
+        cursor = QTextCursor(document)
+        while len(selections) < limit:
+            cursor = document.find(word, cursor)
+            if cursor.isNull():
+                break
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format.setBackground(color)
+            selections.append(selection)
+    editor.setExtraSelections(selections)
+    return len(selections)
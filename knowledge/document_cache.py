@@ -0,0 +1,113 @@
+"""最近使用笔记的 QTextDocument 缓存
+
+切换笔记时直接把缓存的文档交给编辑器，不再复制全文、重新解析和排版，
+撤销历史、光标与滚动位置随文档保留。缓存按总字符数限制大小，
+淘汰最久未用的文档前发出 evicted 信号，由使用方把修改写回存储。
+所有文档（包括没有打开笔记时显示的空白文档）都由缓存持有，编辑器换文档时不会删除它们。
+"""
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QTextCursor, QTextDocument
+
+
+class _Entry:
+    __slots__ = ("document", "chars", "anchor", "position", "scroll")
+
+    def __init__(self, document):
+        self.document = document
+        self.chars = document.characterCount()
+        self.anchor = 0
+        self.position = 0
+        self.scroll = 0
+
+
+class DocumentCache(QObject):
+    evicted = Signal(int, QTextDocument)  # 笔记 ID, 即将销毁的文档
+
+    def __init__(self, max_chars=4_000_000, parent=None):
+        super().__init__(parent)
+        self.max_chars = max_chars
+        self.total_chars = 0
+        self._entries = OrderedDict()
+        self._blank = None
+
+    def blank(self):
+        """没有打开笔记时交给编辑器的空白文档，不计入缓存也不会被淘汰"""
+        if self._blank is None:
+            self._blank = QTextDocument(self)
+        return self._blank
+
+    def __contains__(self, note_id):
+        return note_id in self._entries
+
+    def document(self, note_id):
+        """取出缓存的文档并标记为最近使用，没有时返回 None"""
+        entry = self._entries.get(note_id)
+        if entry is None:
+            return None
+        self._entries.move_to_end(note_id)
+        return entry.document
+
+    def add(self, note_id, text, font=None):
+        """为笔记创建文档并放入缓存"""
+        document = QTextDocument(self)
+        if font is not None:
+            document.setDefaultFont(font)
+        document.setPlainText(text)
+        document.setModified(False)
+        # 建立布局时文档会把全文作为一次插入发出 contentsChange，在调用方连接信号前完成
+        document.documentLayout()
+        self.discard(note_id)
+        entry = self._entries[note_id] = _Entry(document)
+        self.total_chars += entry.chars
+        self._evict(note_id)
+        return document
+
+    def modified(self):
+        """返回有未保存修改的 (笔记 ID, 文档)"""
+        return [(note_id, entry.document) for note_id, entry in self._entries.items()
+                if entry.document.isModified()]
+
+    def save_view(self, note_id, editor):
+        """记录编辑器在该笔记中的光标与滚动位置，并按当前长度重新计入大小"""
+        entry = self._entries.get(note_id)
+        if entry is None:
+            return
+        cursor = editor.textCursor()
+        entry.anchor = cursor.anchor()
+        entry.position = cursor.position()
+        entry.scroll = editor.verticalScrollBar().value()
+        chars = entry.document.characterCount()
+        self.total_chars += chars - entry.chars
+        entry.chars = chars
+        self._evict(note_id)
+
+    def restore_view(self, note_id, editor):
+        entry = self._entries.get(note_id)
+        if entry is None:
+            return
+        cursor = QTextCursor(entry.document)
+        cursor.setPosition(entry.anchor)
+        cursor.setPosition(entry.position, QTextCursor.KeepAnchor)
+        editor.setTextCursor(cursor)
+        editor.verticalScrollBar().setValue(entry.scroll)
+
+    def discard(self, note_id):
+        """丢弃文档，不发出 evicted"""
+        entry = self._entries.pop(note_id, None)
+        if entry is not None:
+            self.total_chars -= entry.chars
+            entry.document.deleteLater()
+
+    def _evict(self, keep):
+        """超出上限时从最久未用的一端淘汰，keep 指定的文档（编辑器正在使用）除外"""
+        while self.total_chars > self.max_chars and len(self._entries) > 1:
+            note_id = next(iter(self._entries))
+            if note_id == keep:
+                self._entries.move_to_end(note_id)
+                continue
+            entry = self._entries.pop(note_id)
+            self.total_chars -= entry.chars
+            self.evicted.emit(note_id, entry.document)
+            entry.document.deleteLater()
@@ -0,0 +1,152 @@
+"""批量导出笔记
+
+导出在后台线程中用独立的 SQLite 连接进行，按批读取正文，写完一批即丢弃，
+内存中最多只有一批笔记；每条笔记写为一个 .txt / .md 文件，或作为条目流式写入 zip。
+调用方应先把未保存的修改写入数据库。
+"""
+import os
+import re
+import shutil
+import sqlite3
+import time
+import zipfile
+
+from PySide6.QtCore import QThread, Signal
+
+FORMATS = ("txt", "md", "zip")
+
+_UNSAFE_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+
+def file_name(note_id, title, used, suffix):
+    """把标题转换为合法且不重复的文件名，used 为已用名称的小写集合"""
+    stem = _UNSAFE_RE.sub("_", title).strip(" .")[:100] or f"笔记 {note_id}"
+    name = f"{stem}.{suffix}"
+    if name.lower() in used:
+        name = f"{stem} ({note_id}).{suffix}"
+    used.add(name.lower())
+    return name
+
+
+class ExportWorker(QThread):
+    """把笔记导出到目录（txt / md）或单个 zip 文件
+
+    note_ids 为 None 时按侧边栏顺序导出全部笔记。cancel() 可在任意线程调用，
+    未完成的 zip 文件会被删除，已写出的单个文件保留。
+    """
+
+    progress = Signal(int, int)  # 已导出数, 总数
+    failed = Signal(str)
+
+    BATCH = 200
+    PROGRESS_INTERVAL = 0.1  # 进度通知的最短间隔（秒）
+
+    def __init__(self, db_path, target, fmt="zip", note_ids=None, parent=None):
+        super().__init__(parent)
+        if fmt not in FORMATS:
+            raise ValueError(f"未知的导出格式：{fmt}")
+        self.db_path = db_path
+        self.target = target
+        self.fmt = fmt
+        self.note_ids = None if note_ids is None else list(note_ids)
+        self.total = 0
+        self.exported = 0
+        self.cancelled = False
+        self.error = None
+        self._cancel = False  # 由界面线程写入，逐条检查
+
+    def cancel(self):
+        self._cancel = True
+
+    def run(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if self.note_ids is None:
+                self.total = conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+            else:
+                self.total = len(self.note_ids)
+            self.progress.emit(0, self.total)
+            if self.fmt == "zip":
+                self._export_zip(conn)
+            else:
+                os.makedirs(self.target, exist_ok=True)
+                self._export_files(conn)
+        except (OSError, sqlite3.Error, zipfile.LargeZipFile) as e:
+            self.error = str(e)
+            self.failed.emit(self.error)
+        finally:
+            conn.close()
+
+    def _batches(self, conn):
+        """逐批产出 [(id, title, content, path)]"""
+        if self.note_ids is None:
+            key = (float("-inf"), -1)
+            while True:
+                rows = conn.execute(
+                    "SELECT id, title, content, path, position FROM notes "
+                    "WHERE (position, id) > (?, ?) ORDER BY position, id LIMIT ?",
+                    (*key, self.BATCH)).fetchall()
+                if not rows:
+                    return
+                key = (rows[-1][4], rows[-1][0])
+                yield [row[:4] for row in rows]
+        else:
+            ids = self.note_ids
+            for start in range(0, len(ids), self.BATCH):
+                chunk = ids[start:start + self.BATCH]
+                rows = conn.execute(
+                    f"SELECT id, title, content, path FROM notes "
+                    f"WHERE id IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+                by_id = {row[0]: row for row in rows}
+                yield [by_id[note_id] for note_id in chunk if note_id in by_id]
+
+    def _notes(self, conn):
+        """逐条产出笔记，批次之间按间隔报告进度；取消后停止"""
+        reported = time.monotonic()
+        for batch in self._batches(conn):
+            for row in batch:
+                if self._cancel:
+                    self.cancelled = True
+                    return
+                yield row
+                self.exported += 1
+            now = time.monotonic()
+            if now - reported >= self.PROGRESS_INTERVAL:
+                self.progress.emit(self.exported, self.total)
+                reported = now
+        self.progress.emit(self.exported, self.total)
+
+    def _export_files(self, conn):
+        used = set()
+        for note_id, title, content, path in self._notes(conn):
+            name = os.path.join(self.target, file_name(note_id, title, used, self.fmt))
+            if path is not None:
+                shutil.copyfile(path, name)
+                continue
+            with open(name, "w", encoding="utf-8", newline="") as f:
+                if self.fmt == "md":
+                    f.write(f"# {title}\n\n")
+                f.write(content)
+
+    def _export_zip(self, conn):
+        used = set()
+        temp_path = self.target + ".part"
+        try:
+            with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+                for note_id, title, content, path in self._notes(conn):
+                    name = file_name(note_id, title, used, "txt")
+                    # 条目以流方式写入，大文件笔记按块复制，不整体读入内存
+                    with archive.open(name, "w", force_zip64=path is not None) as entry:
+                        if path is not None:
+                            with open(path, "rb") as source:
+                                shutil.copyfileobj(source, entry, 1024 * 1024)
+                        else:
+                            entry.write(content.encode("utf-8"))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        if self.cancelled:
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, self.target)
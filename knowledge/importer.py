@@ -0,0 +1,196 @@
+"""批量导入文本文件夹
+
+后台线程遍历目录树，把文件交给进程池并行读取、解码（自动识别 UTF-8 / GBK 中文文件）
+并切分全文索引词；工作线程用自己的连接每批一个事务写入数据库，界面线程每批只追加一次侧边栏。
+超过大文件阈值的文件不读入，由工作线程复制到笔记库目录后作为大文件笔记，不引用用户的原文件。
+"""
+import codecs
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+from PySide6.QtCore import QThread, Signal
+
+from .large_file import LARGE_NOTE_BYTES, large_note_path
+from .search import index_text
+from .storage import NoteDatabase
+from .store import Note
+
+EXTENSIONS = (".txt", ".md", ".markdown", ".log")
+
+_BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"),
+         (codecs.BOM_UTF16_BE, "utf-16"))
+
+
+def decode_text(data):
+    """按 BOM、UTF-8、GB18030（GBK 的超集）的顺序尝试解码"""
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return data.decode(encoding, errors="replace")
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    try:
+        return data.decode("gb18030")
+    except UnicodeDecodeError:
+        return data.decode("utf-8", errors="replace")
+
+
+def read_note_file(path):
+    """在子进程中读取一个文件
+
+    返回 (标题, 正文, 大文件路径, 标题索引文本, 正文索引文本)，读取失败时返回 None。
+    """
+    title = os.path.splitext(os.path.basename(path))[0]
+    try:
+        if os.path.getsize(path) >= LARGE_NOTE_BYTES:
+            return title, None, path, index_text(title), ""
+        with open(path, "rb") as f:
+            text = decode_text(f.read()).replace("\r\n", "\n")
+    except OSError:
+        return None
+    return title, text, None, index_text(title), index_text(text)
+
+
+def walk_text_files(root, extensions=EXTENSIONS):
+    """深度优先产出目录树中的文本文件，按名称排序以保持导入顺序稳定"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.is_file() and entry.name.lower().endswith(extensions):
+                    yield entry.path
+            except OSError:
+                continue
+        stack.extend(reversed(subdirectories))
+
+
+class ImportWorker(QThread):
+    """遍历 root，用进程池解码文件并按批写入数据库
+
+    扫描完成后发出 scanned，界面线程据此预留 ID 与排序位置并调用 begin()；
+    之后每批在工作线程自己的连接中用一个事务写入，再发出一次 batch 供侧边栏追加。
+    打开或写入数据库出错时发出 failed 并停止，已写入的批次保留。
+    """
+
+    scanned = Signal(int)  # 文件总数
+    batch = Signal(list)  # 已写入的笔记，正文未加载
+    progress = Signal(int, int, float)  # 已处理文件数, 文件总数, 每秒文件数
+    failed = Signal(str)
+
+    BATCH = 500
+    CHUNK = 32  # 每次派给子进程的文件数，减少进程间往返
+
+    def __init__(self, root, db_path, processes=None, parent=None):
+        super().__init__(parent)
+        self.root = root
+        self.db_path = db_path
+        self.processes = processes or os.cpu_count() or 1
+        self.total = 0
+        self.processed = 0
+        self.imported = 0
+        self.unreadable = 0  # 无法读取的文件数
+        self.elapsed = 0.0
+        self.cancelled = False
+        self.error = None
+        self._cancel = False  # 由界面线程写入
+        self._reserved = threading.Event()
+        self._next_id = 0
+        self._next_position = 0
+
+    def cancel(self):
+        self._cancel = True
+
+    def begin(self, first_id, first_position):
+        """界面线程预留了 total 个 ID 与位置后调用"""
+        self._next_id = first_id
+        self._next_position = first_position
+        self._reserved.set()
+
+    def files_per_second(self):
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def run(self):
+        start = time.perf_counter()
+        paths = list(walk_text_files(self.root))
+        self.total = len(paths)
+        self.scanned.emit(self.total)
+        if not paths:
+            return
+        while not self._reserved.wait(0.05):
+            if self._cancel:
+                self.cancelled = True
+                return
+
+        # 界面进程有多个线程，fork 出的子进程可能继承被锁住的状态，统一用 spawn
+        context = multiprocessing.get_context("spawn")
+        processes = min(self.processes, max(1, len(paths) // self.CHUNK))
+        database = None
+        try:
+            database = NoteDatabase(self.db_path)
+            with context.Pool(processes) as pool:
+                pending = []
+                for result in pool.imap(read_note_file, paths, self.CHUNK):
+                    if self._cancel:
+                        self.cancelled = True
+                        pool.terminate()
+                        break
+                    self.processed += 1
+                    if result is None:
+                        self.unreadable += 1
+                    else:
+                        pending.append(result)
+                    if len(pending) >= self.BATCH:
+                        self._write(database, pending, start)
+                        pending = []
+                if pending and not self.cancelled:
+                    self._write(database, pending, start)
+        except (OSError, sqlite3.Error) as e:
+            self.error = str(e)
+            self.failed.emit(self.error)
+        finally:
+            if database is not None:
+                database.close()
+        self.elapsed = time.perf_counter() - start
+
+    def _write(self, database, results, start):
+        notes = []
+        indexed = []
+        for title, content, path, indexed_title, indexed_body in results:
+            note_id = self._next_id
+            self._next_id += 1
+            if path is not None:
+                try:
+                    path = self._copy_large(path, note_id)
+                except OSError:
+                    self.unreadable += 1
+                    continue
+            notes.append(Note(note_id, title, content, time.time(), path))
+            indexed.append((indexed_title, indexed_body))
+        database.insert_indexed(notes, indexed, self._next_position)
+        self._next_position += len(notes)
+        for note in notes:
+            note.content = None  # 打开时再从数据库读取
+        self.imported += len(notes)
+        self.elapsed = time.perf_counter() - start
+        self.batch.emit(notes)
+        self.progress.emit(self.processed, self.total, self.files_per_second())
+
+    def _copy_large(self, source, note_id):
+        """把大文件复制到笔记库目录，返回副本路径"""
+        path = large_note_path(self.db_path, note_id)
+        shutil.copyfile(source, path + ".saving")
+        os.replace(path + ".saving", path)
+        return path
@@ -0,0 +1,212 @@
+"""追加写入的自动保存日志
+
+编辑器每次改动（QTextDocument.contentsChange）记为一条增量，由后台线程追加到日志文件，
+多条记录合并为一次 fsync。笔记正文写入数据库时在同一事务中记下已包含的最后一个序号，
+启动时只把序号更大的增量重放到数据库中的正文上，找回崩溃前未保存的修改。
+日志中的检查点记录只用于压缩：定期重写日志，只保留尚未写入数据库的增量。
+序号在日志清空后继续递增，数据库中记录的序号始终有效。
+
+每行格式为 "crc32 JSON"，校验失败或不完整的行（写到一半崩溃）及其后内容在重放时忽略。
+"""
+import json
+import os
+import queue
+import time
+import zlib
+
+from PySide6.QtCore import QThread
+from PySide6.QtGui import QTextCursor, QTextDocument
+
+DELTA, CHECKPOINT, DELETED = "d", "k", "x"
+
+_STOP = object()
+_COMPACT = object()
+
+
+def _encode(record):
+    payload = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    return f"{zlib.crc32(payload.encode('utf-8')):08x} {payload}\n"
+
+
+def read_records(path):
+    """按顺序读出完好的记录，遇到损坏的行即停止"""
+    records = []
+    try:
+        f = open(path, "r", encoding="utf-8", errors="replace", newline="\n")
+    except FileNotFoundError:
+        return records
+    with f:
+        for line in f:
+            if not line.endswith("\n") or len(line) < 10:
+                break
+            crc, _, payload = line[:-1].partition(" ")
+            try:
+                if int(crc, 16) != zlib.crc32(payload.encode("utf-8")):
+                    break
+                records.append(json.loads(payload))
+            except ValueError:
+                break
+    return records
+
+
+def live_records(records):
+    """返回最后一个检查点之后、未被删除的增量记录，按写入顺序排列"""
+    live = {}
+    for record in records:
+        kind, seq, note_id = record[0], record[1], record[2]
+        if kind == DELTA:
+            live.setdefault(note_id, []).append(record)
+        elif kind == CHECKPOINT:
+            kept = [item for item in live.get(note_id, ()) if item[1] > seq]
+            if kept:
+                live[note_id] = kept
+            else:
+                live.pop(note_id, None)
+        elif kind == DELETED:
+            live.pop(note_id, None)
+    return sorted((record for items in live.values() for record in items), key=lambda r: r[1])
+
+
+def pending_deltas(records, checkpoints=None):
+    """返回 {笔记 ID: [(位置, 删除数, 插入文本)]}，跳过 checkpoints 中序号及之前的增量"""
+    checkpoints = checkpoints or {}
+    deltas = {}
+    for record in live_records(records):
+        if record[1] > checkpoints.get(record[2], 0):
+            deltas.setdefault(record[2], []).append((record[3], record[4], record[5]))
+    return deltas
+
+
+def apply_deltas(text, deltas):
+    """在 QTextDocument 上按记录时的位置语义重放增量"""
+    document = QTextDocument()
+    document.setPlainText(text)
+    cursor = QTextCursor(document)
+    for position, removed, added in deltas:
+        end = min(position + removed, document.characterCount() - 1)
+        cursor.setPosition(min(position, end))
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.insertText(added)
+    return document.toPlainText()
+
+
+class _JournalWriter(QThread):
+    def __init__(self, path, records, fsync_interval, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.records = records
+        self.fsync_interval = fsync_interval
+        self.fsyncs = 0
+
+    def run(self):
+        f = open(self.path, "a", encoding="utf-8", newline="\n")
+        unsynced = False
+        last_sync = time.monotonic()
+        stop = False
+        while not stop:
+            try:
+                item = self.records.get(timeout=self.fsync_interval if unsynced else None)
+            except queue.Empty:
+                item = None
+            batch = [] if item is None else [item]
+            while len(batch) < 1000:
+                try:
+                    batch.append(self.records.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = []
+            compact = False
+            for entry in batch:
+                if entry is _STOP:
+                    stop = True
+                elif entry is _COMPACT:
+                    compact = True
+                else:
+                    lines.append(_encode(entry))
+            if lines:
+                f.write("".join(lines))
+                f.flush()
+                unsynced = True
+            # 一批记录只做一次 fsync，且两次 fsync 至少间隔 fsync_interval
+            now = time.monotonic()
+            if unsynced and (stop or compact or now - last_sync >= self.fsync_interval):
+                os.fsync(f.fileno())
+                self.fsyncs += 1
+                unsynced = False
+                last_sync = now
+            if compact:
+                f.close()
+                self._compact()
+                f = open(self.path, "a", encoding="utf-8", newline="\n")
+        f.close()
+
+    def _compact(self):
+        """重写日志，只保留检查点之后的增量"""
+        records = read_records(self.path)
+        live = live_records(records)
+        temp_path = self.path + ".compact"
+        with open(temp_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write("".join(_encode(record) for record in live))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+
+class AutosaveJournal:
+    """界面线程使用的日志入口，记录只入队，由写线程落盘"""
+
+    def __init__(self, path, fsync_interval=0.5, compact_bytes=4 * 1024 * 1024):
+        self.path = path
+        self.compact_bytes = compact_bytes
+        self.seq = 0
+        self._records = queue.SimpleQueue()
+        self._writer = None
+        self._fsync_interval = fsync_interval
+
+    def recover(self, checkpoints=None):
+        """读取日志中尚未写入数据库的增量，写线程启动前调用
+
+        checkpoints 为数据库中记录的 {笔记 ID: 序号}，新的序号从两者的最大值之后开始。
+        """
+        records = read_records(self.path)
+        checkpoints = checkpoints or {}
+        self.seq = max([self.seq, *checkpoints.values(), *(record[1] for record in records)])
+        return pending_deltas(records, checkpoints)
+
+    def reset(self):
+        """恢复的内容写入数据库后清空日志，序号继续递增"""
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+
+    def start(self):
+        self._writer = _JournalWriter(self.path, self._records, self._fsync_interval)
+        self._writer.start()
+
+    def record(self, note_id, position, removed, added):
+        self.seq += 1
+        self._records.put((DELTA, self.seq, note_id, position, removed, added))
+        return self.seq
+
+    def checkpoint(self, note_id, seq):
+        """seq 及之前的增量已包含在数据库的正文中，压缩时丢弃"""
+        self._records.put((CHECKPOINT, seq, note_id))
+
+    def deleted(self, note_id):
+        self.seq += 1
+        self._records.put((DELETED, self.seq, note_id))
+
+    def compact(self, force=False):
+        """日志超过 compact_bytes 时让写线程压缩"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if force or size > self.compact_bytes:
+            self._records.put(_COMPACT)
+
+    def stop(self):
+        if self._writer is not None:
+            self._records.put(_STOP)
+            self._writer.wait()
+            self._writer = None
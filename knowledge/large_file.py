@@ -0,0 +1,454 @@
+"""大文件笔记
+
+超过 LARGE_NOTE_BYTES 的笔记不放进数据库和 QTextEdit，而是保存为笔记库目录下的独立文件
+（打开或导入的外部文件先复制进来，保存时不会改写用户的原文件），打开时用 mmap 映射：
+后台线程建立行首偏移索引，编辑器只装入可见的若干行；修改记录在以映射文件为原始缓冲的
+片段表上，保存时在后台线程顺序写出新文件再替换。页面按原有的换行符（LF / CRLF）写回。
+"""
+import mmap
+import os
+from array import array
+
+from PySide6.QtCore import Qt, QEvent, QThread, Signal
+from PySide6.QtGui import QTextCursor, QTextOption
+from PySide6.QtWidgets import QHBoxLayout, QPlainTextEdit, QScrollBar, QTextEdit, QWidget
+
+LARGE_NOTE_BYTES = 8 * 1024 * 1024
+WRITE_CHUNK = 1024 * 1024
+
+
+def large_note_path(db_path, note_id):
+    """笔记库中大文件笔记的存放路径，目录不存在时创建"""
+    directory = os.path.join(os.path.dirname(os.path.abspath(db_path)), "large")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{note_id}.txt")
+
+
+def file_chunks(path, size=WRITE_CHUNK):
+    """按块读取文件，供后台写入复制外部文件"""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def text_chunks(text, size=WRITE_CHUNK):
+    """按块编码文本，编码在后台写入线程中进行"""
+    for start in range(0, len(text), size):
+        yield text[start:start + size].encode("utf-8")
+
+
+class PieceTable:
+    """以只读原始缓冲和追加缓冲拼接出的可编辑字节序列"""
+
+    ORIGINAL, ADDED = 0, 1
+
+    def __init__(self, original):
+        self._buffers = (original, bytearray())
+        self._pieces = [(self.ORIGINAL, 0, len(original))] if len(original) else []
+        self.length = len(original)
+        self.modified = False
+
+    def read(self, offset, size):
+        parts = []
+        end = offset + size
+        position = 0
+        for buffer, start, length in self._pieces:
+            piece_end = position + length
+            if piece_end > offset and position < end:
+                lo = max(offset - position, 0)
+                hi = min(end - position, length)
+                parts.append(self._buffers[buffer][start + lo:start + hi])
+            elif position >= end:
+                break
+            position = piece_end
+        return b"".join(parts)
+
+    def replace(self, offset, length, data):
+        """把 [offset, offset + length) 替换为 data"""
+        added = self._buffers[self.ADDED]
+        insert = (self.ADDED, len(added), len(data)) if data else None
+        added += data
+
+        pieces = []
+        end = offset + length
+        position = 0
+        for piece in self._pieces:
+            buffer, start, piece_length = piece
+            piece_end = position + piece_length
+            if piece_end <= offset or position >= end:
+                if position >= end and insert is not None:
+                    pieces.append(insert)
+                    insert = None
+                pieces.append(piece)
+            else:
+                if position < offset:
+                    pieces.append((buffer, start, offset - position))
+                if insert is not None:
+                    pieces.append(insert)
+                    insert = None
+                if piece_end > end:
+                    pieces.append((buffer, start + end - position, piece_end - end))
+            position = piece_end
+        if insert is not None:
+            pieces.append(insert)
+
+        self._pieces = pieces
+        self.length += len(data) - length
+        self.modified = True
+
+    def chunks(self, size=1024 * 1024):
+        """按顺序产出不超过 size 的字节块"""
+        for buffer, start, length in self._pieces:
+            source = self._buffers[buffer]
+            for lo in range(start, start + length, size):
+                yield source[lo:min(lo + size, start + length)]
+
+
+class LineIndexer(QThread):
+    """在后台扫描映射文件，把行首偏移追加到共享的 array 中"""
+
+    progress = Signal(int, bool)  # 已知行数, 是否扫描完毕
+
+    FIRST_CHUNK = 256 * 1024  # 第一块较小，尽快显示首屏
+    CHUNK = 8 * 1024 * 1024
+
+    def __init__(self, buffer, offsets, parent=None):
+        super().__init__(parent)
+        self._buffer = buffer
+        self._offsets = offsets
+
+    def run(self):
+        buffer = self._buffer
+        size = len(buffer)
+        position = 0
+        chunk_size = self.FIRST_CHUNK
+        while position < size:
+            if self.isInterruptionRequested():
+                return
+            chunk = buffer[position:position + chunk_size]
+            starts = array("q")
+            found = chunk.find(b"\n")
+            while found >= 0:
+                starts.append(position + found + 1)
+                found = chunk.find(b"\n", found + 1)
+            self._offsets.extend(starts)
+            position += len(chunk)
+            chunk_size = self.CHUNK
+            self.progress.emit(len(self._offsets), position >= size)
+        if size == 0:
+            self.progress.emit(len(self._offsets), True)
+
+
+class _FileWriter(QThread):
+    """在后台把字节块顺序写入临时文件，再替换目标文件
+
+    chunks 在工作线程中迭代；release 在替换前调用，用于关闭仍映射着目标文件的 mmap。
+    """
+
+    def __init__(self, path, chunks, release=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.error = None
+        self._chunks = chunks
+        self._release = release
+
+    def run(self):
+        temp_path = self.path + ".saving"
+        try:
+            with open(temp_path, "wb") as f:
+                for chunk in self._chunks:
+                    f.write(chunk)
+        except OSError as e:
+            self.error = str(e)
+        finally:
+            # 替换前必须解除映射，Windows 上被映射的文件不能覆盖
+            if self._release is not None:
+                self._release()
+        try:
+            if self.error is None:
+                os.replace(temp_path, self.path)
+            elif os.path.exists(temp_path):
+                os.remove(temp_path)
+        except OSError as e:
+            self.error = str(e)
+
+
+class LargeNoteView(QWidget):
+    """只装入可见行的大文件查看与编辑器
+
+    编辑器关闭自动换行，每个文本块对应文件中的一行；滚动条以行为单位。
+    行索引建立完成前只读。保存与复制在后台线程写入，打开仍在写入的文件时等写完再映射。
+    """
+
+    indexed = Signal(int, bool)  # 行数, 是否完成
+    failed = Signal(str, str)  # 文件路径, 错误信息
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.path = None
+        self._file = None
+        self._map = None
+        self._table = None
+        self._offsets = None
+        self._indexer = None
+        self._complete = False
+        self._first = 0  # 当前页第一行
+        self._count = 0  # 当前页行数
+        # 编辑造成的字节平移只记下起点和大小，_shift_from 及之后的偏移读取时再加上 _shift
+        self._shift_from = 0
+        self._shift = 0
+        self._eol = b"\n"  # 文件的换行符，页内没有换行时使用
+        self._page_eol = b"\n"  # 当前页的换行符，写回时还原
+        self._writers = {}  # 路径 -> 正在写入该文件的 _FileWriter
+
+        self.editor = QPlainTextEdit()
+        self.editor.setObjectName("NoteEditor")
+        self.editor.setWordWrapMode(QTextOption.NoWrap)
+        self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.editor.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.editor.installEventFilter(self)
+        self.editor.viewport().installEventFilter(self)
+
+        self.scroll_bar = QScrollBar(Qt.Vertical)
+        self.scroll_bar.valueChanged.connect(self._load_page)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self.editor, 1)
+        layout.addWidget(self.scroll_bar)
+
+    def open(self, path):
+        """映射文件并显示开头，行索引在后台建立；文件仍在后台写入时写完后再打开"""
+        self.close()
+        self.path = path
+        self.editor.setReadOnly(True)
+        self.editor.clear()
+        self.scroll_bar.setRange(0, 0)
+        if path not in self._writers:
+            self._map_file()
+
+    def _map_file(self):
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._table = PieceTable(self._map)
+        self._offsets = array("q", [0])
+        self._complete = False
+        self._first = self._count = 0
+        self._shift_from = self._shift = 0
+        head = self._map[:64 * 1024]
+        newline = head.find(b"\n")
+        self._eol = b"\r\n" if newline > 0 and head[newline - 1:newline] == b"\r" else b"\n"
+
+        self._indexer = LineIndexer(self._map, self._offsets, self)
+        self._indexer.progress.connect(self._on_progress)
+        self._indexer.start()
+
+    def close(self):
+        """停止索引，在后台保存修改并解除映射"""
+        if self.path is None:
+            return
+        if not self.save(reopen=False):
+            self._stop_indexer()
+            self._release()
+        self.path = None
+        self.editor.clear()
+
+    def is_modified(self):
+        return self._table is not None and (self._table.modified or self.editor.document().isModified())
+
+    def save(self, reopen=True):
+        """在后台把片段表顺序写入临时文件后替换文件，未修改时不写
+
+        写入期间片段表和映射交给写入线程，编辑器只读；reopen 为 True 时写完后重新打开。
+        """
+        if not self.is_modified():
+            return False
+        self._commit_page()
+        self._stop_indexer()
+        table, buffer, file = self._table, self._map, self._file
+        self._table = self._map = self._file = None
+        self.editor.setReadOnly(True)
+
+        def release():
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+            if file is not None:
+                file.close()
+
+        self.write_file(self.path, table.chunks(), release)
+        if not reopen:
+            self.path = None
+        return True
+
+    def write_file(self, path, chunks, release=None):
+        """在后台把 chunks 写成 path（替换已有文件），写完前打开 path 会等待"""
+        writer = _FileWriter(path, chunks, release, self)
+        self._writers[path] = writer
+        writer.finished.connect(self._on_written)
+        writer.start()
+
+    def wait_writes(self):
+        """等待所有后台写入完成，导出或退出前调用"""
+        for writer in list(self._writers.values()):
+            writer.wait()
+
+    def _on_written(self):
+        writer = self.sender()
+        if self._writers.get(writer.path) is writer:
+            del self._writers[writer.path]
+        writer.deleteLater()
+        if writer.error is not None:
+            self.failed.emit(writer.path, writer.error)
+        if self.path == writer.path and self._table is None and writer.path not in self._writers:
+            try:
+                self._map_file()
+            except OSError as e:
+                self.failed.emit(writer.path, str(e))
+
+    def _stop_indexer(self):
+        if self._indexer is not None:
+            self._indexer.requestInterruption()
+            self._indexer.wait()
+            self._indexer = None
+
+    def _release(self):
+        self._table = None
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _visible_lines(self):
+        spacing = self.editor.fontMetrics().lineSpacing()
+        return max(1, self.editor.viewport().height() // max(1, spacing))
+
+    def _on_progress(self, lines, complete):
+        if self.sender() is not self._indexer:
+            return  # 已关闭或重新打开的文件的残留通知
+        self._complete = complete
+        self.scroll_bar.setRange(0, max(0, lines - self._visible_lines()))
+        self.scroll_bar.setPageStep(self._visible_lines())
+        if self._count < self._visible_lines() + 1:
+            self._load_page(self.scroll_bar.value(), force=True)
+        if complete:
+            self.editor.setReadOnly(False)
+        self.indexed.emit(lines, complete)
+
+    def _page_range(self, first, count):
+        """返回页的字节范围与实际行数；索引未完成时不越过最后一个已知行首"""
+        offsets = self._offsets
+        last = len(offsets) if self._complete else len(offsets) - 1
+        count = max(0, min(count, last - first))
+        start = self._offset(first) if first < len(offsets) else self._table.length
+        end = self._offset(first + count) if first + count < len(offsets) else self._table.length
+        return start, end, count
+
+    def _offset(self, line):
+        return self._offsets[line] + (self._shift if line >= self._shift_from else 0)
+
+    def _move_shift(self, line):
+        """把平移起点移到 line，只改写新旧起点之间的偏移"""
+        offsets, shift = self._offsets, self._shift
+        if shift and line != self._shift_from:
+            lo, hi = sorted((self._shift_from, line))
+            step = shift if self._shift_from < line else -shift
+            offsets[lo:hi] = array("q", (offset + step for offset in offsets[lo:hi]))
+        self._shift_from = line
+
+    def _load_page(self, first, force=False):
+        if self._table is None or (first == self._first and not force):
+            return
+        self._commit_page()
+        start, end, count = self._page_range(first, self._visible_lines() + 1)
+        self._first, self._count = first, count
+        data = self._table.read(start, end - start)
+        newline = data.find(b"\n")
+        if newline < 0:
+            self._page_eol = self._eol
+        else:
+            self._page_eol = b"\r\n" if data[newline - 1:newline] == b"\r" else b"\n"
+        text = data.decode("utf-8", errors="replace")
+        if self._page_eol == b"\r\n":
+            text = text.replace("\r\n", "\n")
+        self.editor.setPlainText(text[:-1] if text.endswith("\n") else text)
+        self.editor.document().setModified(False)
+
+    def _commit_page(self):
+        """把当前页的修改写入片段表，并更新其后的行首偏移"""
+        document = self.editor.document()
+        if self._table is None or not document.isModified():
+            return
+        start, end, _ = self._page_range(self._first, self._count)
+        data = self.editor.toPlainText().encode("utf-8")
+        if self._page_eol != b"\n":
+            data = data.replace(b"\n", self._page_eol)
+        if end > start and self._table.read(end - 1, 1) == b"\n":
+            data += self._page_eol  # 装入时去掉的页尾换行
+        self._table.replace(start, end - start, data)
+        document.setModified(False)
+
+        offsets = self._offsets
+        starts = array("q")
+        found = data.find(b"\n")
+        while found >= 0:
+            starts.append(start + found + 1)
+            found = data.find(b"\n", found + 1)
+        # 页内行首整体替换；其后的偏移不逐个改写，只累加平移量，代价与页和滚动距离成正比
+        self._move_shift(self._first + self._count + 1)
+        offsets[self._first + 1:self._first + self._count + 1] = starts
+        self._shift_from = self._first + len(starts) + 1
+        self._shift += len(data) - (end - start)
+        self._count = len(starts) + (0 if data.endswith(b"\n") else 1)
+        self.scroll_bar.setRange(0, max(0, len(offsets) - self._visible_lines()))
+
+    def eventFilter(self, obj, event):
+        if self._table is None:
+            return super().eventFilter(obj, event)
+        if event.type() == QEvent.Wheel and obj is self.editor.viewport():
+            steps = event.angleDelta().y() // 40
+            self.scroll_bar.setValue(self.scroll_bar.value() - steps)
+            return True
+        if event.type() == QEvent.KeyPress and obj is self.editor:
+            block = self.editor.textCursor().blockNumber()
+            key = event.key()
+            if key == Qt.Key_PageDown or (key == Qt.Key_Down and block >= self._visible_lines() - 1):
+                self._scroll_by(self._visible_lines() if key == Qt.Key_PageDown else 1, block)
+                return True
+            if key == Qt.Key_PageUp or (key == Qt.Key_Up and block == 0 and self._first > 0):
+                self._scroll_by(-self._visible_lines() if key == Qt.Key_PageUp else -1, block)
+                return True
+        return super().eventFilter(obj, event)
+
+    def _scroll_by(self, lines, block):
+        """翻页后把光标放回同一屏幕行"""
+        column = self.editor.textCursor().positionInBlock()
+        before = self._first
+        self.scroll_bar.setValue(self._first + lines)
+        moved = self._first - before
+        target = min(max(block + lines - moved, 0), self.editor.document().blockCount() - 1)
+        cursor = self.editor.textCursor()
+        cursor.setPosition(self.editor.document().findBlockByNumber(target).position())
+        cursor.movePosition(QTextCursor.Right, QTextCursor.MoveAnchor,
+                            min(column, self.editor.document().findBlockByNumber(target).length() - 1))
+        self.editor.setTextCursor(cursor)
+
+
+class NoteTextEdit(QTextEdit):
+    """普通笔记编辑器，超大粘贴不直接插入，交给大文件笔记处理"""
+
+    oversizedPaste = Signal(str)
+
+    def insertFromMimeData(self, source):
+        if source.hasText():
+            text = source.text()
+            if len(text) >= LARGE_NOTE_BYTES // 4:  # 按最少字节数估算，避免先编码整段文本
+                self.oversizedPaste.emit(text)
+                return
+        super().insertFromMimeData(source)
@@ -0,0 +1,200 @@
+"""笔记侧边栏的模型与委托
+
+侧边栏由 QListView 虚拟化显示，只有可见行会被绘制；增删改通过
+rowsInserted / rowsRemoved / dataChanged 逐行通知，不再整体重建按钮。
+预览在绘制时才向 PreviewCache 请求，未就绪的行先只显示标题。
+"""
+from datetime import datetime
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QRectF, QSize
+from PySide6.QtGui import QColor, QFont, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate
+
+from .store import NoteStore
+
+NoteIdRole = Qt.UserRole + 1
+PreviewRole = Qt.UserRole + 2  # (摘要, 字数, 修改时间)，未就绪时为 None
+
+
+class NoteListModel(QAbstractListModel):
+    """NoteStore 的列表视图，对笔记集合的修改都经由模型以便逐行通知"""
+
+    def __init__(self, store=None, fetcher=None, previews=None, parent=None):
+        super().__init__(parent)
+        self._store = store if store is not None else NoteStore()
+        # fetcher(store) 返回下一页笔记，空列表表示已全部加载
+        self._fetcher = fetcher
+        self._fetch_row = len(self._store)  # 分页数据插入的位置，之后是本次新建的笔记
+        self._previews = previews
+        if previews is not None:
+            previews.ready.connect(self._on_previews_ready)
+
+    def store(self):
+        return self._store
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._store)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        note = self._store.at(index.row())
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return note.title
+        if role == NoteIdRole:
+            return note.id
+        if role == PreviewRole and self._previews is not None:
+            preview = self._previews.get(note)
+            return None if preview is None else (preview.snippet, preview.chars, note.modified)
+        return None
+
+    def _on_previews_ready(self, note_ids):
+        for note_id in note_ids:
+            index = self.index_of(note_id)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [PreviewRole])
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetcher is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._fetcher is None:
+            return
+        notes = self._fetcher(self._store)
+        if not notes:
+            self._fetcher = None
+            return
+        row = self._fetch_row
+        self.beginInsertRows(QModelIndex(), row, row + len(notes) - 1)
+        self._store.insert_many(notes, row)
+        self._fetch_row += len(notes)
+        self.endInsertRows()
+
+    def index_of(self, note_id):
+        row = self._store.row_of(note_id)
+        return self.index(row) if row >= 0 else QModelIndex()
+
+    def insert_note(self, note, row=None):
+        if row is None:
+            row = len(self._store)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._store.insert(note, row)
+        self.endInsertRows()
+
+    def append_notes(self, notes):
+        """在末尾批量追加，只发出一次 rowsInserted"""
+        if not notes:
+            return
+        row = len(self._store)
+        self.beginInsertRows(QModelIndex(), row, row + len(notes) - 1)
+        self._store.insert_many(notes)
+        self.endInsertRows()
+
+    def remove_note(self, note_id):
+        row = self._store.row_of(note_id)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._store.remove(note_id)
+        if row < self._fetch_row:
+            self._fetch_row -= 1
+        self.endRemoveRows()
+
+    def note_changed(self, note_id):
+        """某条笔记的标题等显示数据变化后调用"""
+        index = self.index_of(note_id)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.ToolTipRole])
+
+    def reset_store(self, store, fetcher=None):
+        """整体替换数据源，用于批量加载"""
+        self.beginResetModel()
+        self._store = store
+        self._fetcher = fetcher
+        self._fetch_row = len(store)
+        self.endResetModel()
+
+
+class NoteDelegate(QStyledItemDelegate):
+    """固定行高的笔记条目绘制，配色与 KNOWLEDGE_STYLE 中的工具按钮一致"""
+
+    ROW_HEIGHT = 36
+    PREVIEW_ROW_HEIGHT = 56  # 显示预览时的行高
+    PADDING = 16
+    RADIUS = 4
+
+    TEXT_COLOR = QColor(0, 0, 0, 204)
+    PREVIEW_COLOR = QColor(0, 0, 0, 115)
+    HOVER_COLOR = QColor(0, 0, 0, 13)
+    SELECTED_COLOR = QColor(0, 0, 0, 26)
+
+    def __init__(self, parent=None, previews=False):
+        super().__init__(parent)
+        self.previews = previews
+        self._font_key = None  # 缓存字体对应的 QFont.key()，字号、字重等变化时重建
+        self._font = None
+        self._selected_font = None
+        self._small_font = None
+
+    def _fonts(self, base):
+        key = base.key()
+        if key != self._font_key:
+            self._font_key = key
+            self._font = QFont(base)
+            self._selected_font = QFont(base)
+            self._selected_font.setWeight(QFont.Medium)
+            self._small_font = QFont(base)
+            if base.pointSizeF() > 0:
+                self._small_font.setPointSizeF(base.pointSizeF() * 0.85)
+            else:
+                self._small_font.setPixelSize(round(base.pixelSize() * 0.85))
+        return self._font, self._selected_font
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.PREVIEW_ROW_HEIGHT if self.previews else self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        rect = option.rect.adjusted(0, 2, 0, -2)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        if selected or hovered:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self.SELECTED_COLOR if selected else self.HOVER_COLOR)
+            painter.drawRoundedRect(QRectF(rect), self.RADIUS, self.RADIUS)
+
+        font, selected_font = self._fonts(option.font)
+        painter.setFont(selected_font if selected else font)
+        painter.setPen(self.TEXT_COLOR)
+        text_rect = rect.adjusted(self.PADDING, 0, -self.PADDING, 0)
+        if self.previews:
+            text_rect, preview_rect = self._split(text_rect)
+        title = option.fontMetrics.elidedText(index.data(Qt.DisplayRole) or "",
+                                              Qt.ElideRight, text_rect.width())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, title)
+        if self.previews:
+            self._paint_preview(painter, preview_rect, index.data(PreviewRole))
+        painter.restore()
+
+    @staticmethod
+    def _split(rect):
+        half = rect.height() // 2
+        return (QRect(rect.left(), rect.top() + 2, rect.width(), half),
+                QRect(rect.left(), rect.top() + half, rect.width(), rect.height() - half - 2))
+
+    def _paint_preview(self, painter, rect, preview):
+        """第二行左侧为摘要，右侧为字数与修改时间；预览未就绪时留空"""
+        if preview is None:
+            return
+        snippet, chars, modified = preview
+        painter.setFont(self._small_font)
+        painter.setPen(self.PREVIEW_COLOR)
+        metrics = painter.fontMetrics()
+        info = f"{chars} 字 · {datetime.fromtimestamp(modified):%m-%d %H:%M}" if modified else f"{chars} 字"
+        info_width = metrics.horizontalAdvance(info)
+        painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, info)
+        snippet_rect = rect.adjusted(0, 0, -(info_width + 8), 0)
+        painter.drawText(snippet_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                         metrics.elidedText(snippet, Qt.ElideRight, snippet_rect.width()))
@@ -0,0 +1,107 @@
+"""侧边栏笔记预览
+
+预览（首个非空行、字数）只在行被绘制时才请求：同一轮事件中的请求合并为一次
+按 ID 的查询，只读取正文开头和长度。结果按笔记的修改时间作为版本缓存，
+笔记被修改后版本变化，下次绘制时自动重新计算；正在编辑的笔记直接从文档更新。
+"""
+import os
+from collections import OrderedDict
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+HEAD_CHARS = 200  # 计算摘要时读取的正文开头长度
+
+
+class Preview:
+    __slots__ = ("revision", "snippet", "chars")
+
+    def __init__(self, revision, snippet, chars):
+        self.revision = revision
+        self.snippet = snippet
+        self.chars = chars
+
+
+def snippet_of(text):
+    """返回首个非空行，去掉首尾空白"""
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            return line
+    return ""
+
+
+class PreviewCache(QObject):
+    """按需计算并缓存笔记预览
+
+    loader(note_ids) 返回 {ID: (正文开头, 字数)}，由数据库提供。
+    """
+
+    ready = Signal(list)  # 预览已更新的笔记 ID
+
+    def __init__(self, loader, max_entries=5000, parent=None):
+        super().__init__(parent)
+        self._loader = loader
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._pending = {}  # ID -> Note，等待下一次合并查询
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._load)
+
+    def get(self, note):
+        """返回当前版本的预览；尚未计算时排队并返回 None，算好后发出 ready"""
+        entry = self._entries.get(note.id)
+        if entry is not None and entry.revision == note.modified:
+            self._entries.move_to_end(note.id)
+            return entry
+        if note.content is not None and note.path is None:
+            # 正文已在内存中（刚新建或刚编辑过），直接计算
+            return self._put(note.id, note.modified, note.content[:HEAD_CHARS], len(note.content))
+        self._pending[note.id] = note
+        self._timer.start()
+        return None
+
+    def update_from_document(self, note, document):
+        """编辑时用文档的当前内容更新预览，只读取开头几个文本块"""
+        lines = []
+        block = document.firstBlock()
+        while block.isValid() and sum(map(len, lines)) < HEAD_CHARS:
+            lines.append(block.text())
+            block = block.next()
+        self._put(note.id, note.modified, "\n".join(lines), document.characterCount() - 1)
+        self.ready.emit([note.id])
+
+    def invalidate(self, note_id):
+        if self._entries.pop(note_id, None) is not None:
+            self.ready.emit([note_id])
+
+    def _put(self, note_id, revision, head, chars):
+        entry = self._entries[note_id] = Preview(revision, snippet_of(head), chars)
+        self._entries.move_to_end(note_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _load(self):
+        pending, self._pending = self._pending, {}
+        stored = [note_id for note_id, note in pending.items() if note.path is None]
+        rows = self._loader(stored) if stored else {}
+        for note_id, note in pending.items():
+            if note.path is not None:
+                head, chars = self._file_head(note.path)
+            else:
+                head, chars = rows.get(note_id, ("", 0))
+            self._put(note_id, note.modified, head, chars)
+        self.ready.emit(list(pending))
+
+    @staticmethod
+    def _file_head(path):
+        """大文件笔记读取文件开头，字数以字节数代替"""
+        try:
+            with open(path, "rb") as f:
+                head = f.read(HEAD_CHARS * 4).decode("utf-8", errors="ignore")
+            return head, os.path.getsize(path)
+        except OSError:
+            return "", 0
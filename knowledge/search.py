@@ -0,0 +1,121 @@
+"""笔记全文检索
+
+倒排索引使用 SQLite FTS5，与笔记存放在同一个数据库中，随笔记写入在同一事务内
+增量更新，启动时无需重建。中文按相邻两字切分为二元词，其余文字按单词切分并转小写；
+查询时把每个词的二元序列作为短语匹配，等价于子串查找，结果按 BM25 排序。
+单字查询借助单字前缀索引匹配，命中面太广，不做排序以保证响应时间。
+"""
+import re
+
+# 中日韩统一表意文字及扩展 A、兼容表意文字
+_CJK = "㐀-䶿一-鿿豈-﫿"
+_TOKEN_RE = re.compile(rf"[{_CJK}]+|[^\W{_CJK}]+")
+_CJK_RE = re.compile(rf"[{_CJK}]")
+
+TITLE_WEIGHT = 4.0  # BM25 中标题列相对正文的权重
+
+SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(title, body, tokenize='unicode61', prefix='1');
+"""
+
+
+def tokenize(text, query=False):
+    """切分为索引词列表
+
+    中文连续片段切为二元词；文档中每段末尾再补一个单字，使单字查询也能命中。
+    查询不补单字，以保证短语中的二元词前后相接。
+    """
+    tokens = []
+    for match in _TOKEN_RE.finditer(text):
+        run = match.group()
+        if not _CJK_RE.match(run):
+            tokens.append(run.lower())
+            continue
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        if not query or len(run) == 1:
+            tokens.append(run[-1])
+    return tokens
+
+
+def index_text(text):
+    """转换为写入索引列的文本，可在其他进程中预先计算"""
+    return " ".join(tokenize(text))
+
+
+def build_query(text):
+    """把用户输入转换为 FTS5 查询表达式，空白分隔的各词之间为 AND
+
+    返回 (表达式, 是否排序)，全部由单字组成的查询不排序。
+    """
+    words = text.split()
+    parts = []
+    ranked = False
+    for position, word in enumerate(words):
+        tokens = tokenize(word, query=True)
+        if not tokens:
+            continue
+        phrase = '"' + " ".join(tokens) + '"'
+        last = tokens[-1]
+        # 单个汉字只能前缀匹配二元词；输入中的最后一个英文词按前缀匹配，便于边输入边搜索
+        single_char = len(tokens) == 1 and len(last) == 1 and _CJK_RE.match(last)
+        if single_char or (position == len(words) - 1 and not _CJK_RE.match(last)):
+            phrase += "*"
+        ranked = ranked or not single_char
+        parts.append(phrase)
+    return " AND ".join(parts), ranked
+
+
+class SearchIndex:
+    """挂在笔记数据库连接上的全文索引，写入由调用方的事务包裹"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._conn.executescript(SCHEMA)
+
+    def update(self, note_id, title, content=None):
+        """更新一条笔记的索引；content 为 None 时只更新标题"""
+        if content is None:
+            cursor = self._conn.execute("UPDATE search SET title = ? WHERE rowid = ?",
+                                        (index_text(title), note_id))
+            if cursor.rowcount:
+                return
+            content = ""
+        self.update_indexed(note_id, index_text(title), index_text(content))
+
+    def update_indexed(self, note_id, title_text, body_text):
+        """用 index_text 预先得到的文本替换一条笔记的索引"""
+        self._conn.execute("DELETE FROM search WHERE rowid = ?", (note_id,))
+        self._conn.execute("INSERT INTO search (rowid, title, body) VALUES (?, ?, ?)",
+                           (note_id, title_text, body_text))
+
+    def remove(self, note_id):
+        self._conn.execute("DELETE FROM search WHERE rowid = ?", (note_id,))
+
+    def insert_many(self, rows):
+        """写入 (id, 标题索引文本, 正文索引文本)，文本由 index_text 得到，笔记须尚未索引"""
+        self._conn.executemany("INSERT INTO search (rowid, title, body) VALUES (?, ?, ?)", rows)
+
+    def rebuild(self, rows, batch=1000):
+        """从 (id, title, content) 序列重建索引"""
+        self._conn.execute("DELETE FROM search")
+        pending = []
+        for note_id, title, content in rows:
+            pending.append((note_id, index_text(title), index_text(content)))
+            if len(pending) >= batch:
+                self.insert_many(pending)
+                pending.clear()
+        if pending:
+            self.insert_many(pending)
+
+    def query(self, text, limit=50):
+        """按相关度逐行产出 (note_id, score)，score 越小越相关"""
+        expression, ranked = build_query(text)
+        if not expression:
+            return iter(())
+        if not ranked:
+            return self._conn.execute(
+                "SELECT rowid, 0.0 FROM search WHERE search MATCH ? LIMIT ?", (expression, limit))
+        return self._conn.execute(
+            "SELECT rowid, bm25(search, ?, 1.0) AS score FROM search "
+            "WHERE search MATCH ? ORDER BY score LIMIT ?",
+            (TITLE_WEIGHT, expression, limit))
@@ -0,0 +1,260 @@
+"""笔记的 SQLite 持久化
+
+数据库使用 WAL 模式。标题和元数据按页读取（启动时只读第一页），正文在打开笔记时
+才按需查询；修改先记入待写集合，由调用方定时 flush，在同一个事务中批量写入。
+长正文的索引文本可由 IndexPreparer 在后台线程预先切分，flush 时直接写入。
+"""
+import os
+import queue
+import sqlite3
+
+from PySide6.QtCore import QCoreApplication, QStandardPaths, QThread, Signal
+
+from .search import SearchIndex, index_text
+from .store import Note, NoteStore
+
+PAGE_SIZE = 2000
+APP_NAME = "knowledge"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    position INTEGER NOT NULL,
+    modified REAL NOT NULL DEFAULT 0,
+    path TEXT
+);
+CREATE INDEX IF NOT EXISTS notes_position ON notes(position);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    note_id INTEGER PRIMARY KEY,
+    seq INTEGER NOT NULL
+);
+"""
+
+
+def default_path():
+    """默认数据库位置；应用名未设置时 AppDataLocation 会随启动方式落到 PySideApp 等目录"""
+    if QCoreApplication.applicationName() in ("", "PySideApp"):
+        QCoreApplication.setApplicationName(APP_NAME)
+    base = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    return os.path.join(base or os.path.expanduser(f"~/.local/share/{APP_NAME}"), "notes.db")
+
+
+class NoteDatabase:
+    def __init__(self, path=None):
+        if path is None:
+            path = default_path()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(notes)")}
+        if "path" not in columns:
+            self._conn.execute("ALTER TABLE notes ADD COLUMN path TEXT")
+        self.search_index = SearchIndex(self._conn)
+        if self._meta("search_version") is None:
+            self._rebuild_search()
+
+        self._dirty = {}  # ID -> Note，等待下一次 flush
+        self._prepared = {}  # ID -> (标题, 正文, 标题索引文本, 正文索引文本)
+        self._deleted = set()
+        row = self._conn.execute("SELECT MAX(position) FROM notes").fetchone()
+        self._next_position = (row[0] or 0) + 1
+        self._page_key = None  # 已读取的最后一行 (position, id)
+
+    def _meta(self, key, default=None):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+
+    def _rebuild_search(self):
+        """旧数据库首次打开时建立全文索引，之后随写入增量维护"""
+        with self._conn:
+            rows = self._conn.cursor().execute("SELECT id, title, content FROM notes")
+            self.search_index.rebuild(rows)
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('search_version', 1)")
+
+    def load_store(self, page_size=PAGE_SIZE):
+        """创建笔记集合并读入第一页，其余页由 fetch_page 按需读取"""
+        # ID 不回收：取记录的计数与库中最大 ID 两者中较大的
+        max_id = self._conn.execute("SELECT MAX(id) FROM notes").fetchone()[0] or 0
+        store = NoteStore(max(self._meta("next_id", 1), max_id + 1))
+        self._page_key = None
+        store.insert_many(self.fetch_page(store, page_size))
+        return store
+
+    def fetch_page(self, store, count=PAGE_SIZE):
+        """按 (position, id) 顺序读取下一页笔记，正文保持未加载；读完时返回空列表"""
+        if self._page_key is None:
+            cursor = self._conn.execute(
+                "SELECT id, title, modified, path, position FROM notes "
+                "ORDER BY position, id LIMIT ?", (count,))
+        else:
+            cursor = self._conn.execute(
+                "SELECT id, title, modified, path, position FROM notes "
+                "WHERE (position, id) > (?, ?) ORDER BY position, id LIMIT ?",
+                (*self._page_key, count))
+        rows = cursor.fetchall()
+        if rows:
+            self._page_key = (rows[-1][4], rows[-1][0])
+        # 本次运行中新建并已写入的笔记已经在集合里
+        return [Note(note_id, title, None, modified, path)
+                for note_id, title, modified, path, _ in rows if note_id not in store]
+
+    def load_note(self, note_id):
+        """读取单条笔记的标题与元数据，用于尚未分页加载到的笔记"""
+        row = self._conn.execute("SELECT title, modified, path FROM notes WHERE id = ?",
+                                 (note_id,)).fetchone()
+        return None if row is None else Note(note_id, row[0], None, row[1], row[2])
+
+    def load_previews(self, note_ids, head=200):
+        """读取若干笔记的正文开头与字数，返回 {ID: (开头, 字数)}，不读入完整正文"""
+        previews = {}
+        for start in range(0, len(note_ids), 500):
+            chunk = note_ids[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT id, substr(content, 1, ?), length(content) FROM notes "
+                f"WHERE id IN ({','.join('?' * len(chunk))})", (head, *chunk))
+            previews.update((note_id, (text, chars)) for note_id, text, chars in rows)
+        return previews
+
+    def load_content(self, note):
+        """确保笔记正文已加载并返回"""
+        if note.content is None:
+            row = self._conn.execute("SELECT content FROM notes WHERE id = ?", (note.id,)).fetchone()
+            note.content = row[0] if row else ""
+        return note.content
+
+    def save(self, note):
+        """标记笔记待写入"""
+        self._deleted.discard(note.id)
+        self._dirty[note.id] = note
+
+    def delete(self, note_id):
+        self._dirty.pop(note_id, None)
+        self._prepared.pop(note_id, None)
+        self._deleted.add(note_id)
+
+    def set_prepared(self, note_id, title, content, title_text, body_text):
+        """记下后台切分好的索引文本，flush 时笔记的标题与正文仍是这一份才使用"""
+        if note_id in self._dirty:  # 已经写入的笔记不再需要
+            self._prepared[note_id] = (title, content, title_text, body_text)
+
+    def is_pending(self, note_id):
+        return note_id in self._dirty
+
+    def has_pending(self):
+        return bool(self._dirty or self._deleted)
+
+    def checkpoints(self):
+        """返回 {笔记 ID: 自动保存日志序号}，该序号及之前的增量已包含在库中的正文里"""
+        return dict(self._conn.execute("SELECT note_id, seq FROM checkpoints"))
+
+    def flush(self, next_id=None, checkpoints=None):
+        """在一个事务中写入所有待保存的修改
+
+        checkpoints 为 {笔记 ID: 日志序号}，与正文在同一事务中记录，崩溃后重放日志时据此跳过已写入的增量。
+        """
+        if not self.has_pending():
+            return 0
+        rows = []
+        for note in self._dirty.values():
+            rows.append((note.id, note.title, note.content, self._next_position, note.modified,
+                         note.path))
+            self._next_position += 1
+        with self._conn:
+            # 已存在的笔记保留原位置；正文未加载（None）时保留库中的正文
+            self._conn.executemany(
+                "INSERT INTO notes (id, title, content, position, modified, path) "
+                "VALUES (?, ?, COALESCE(?, ''), ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET title = excluded.title, "
+                "content = CASE WHEN ?3 IS NULL THEN notes.content ELSE excluded.content END, "
+                "modified = excluded.modified, path = excluded.path",
+                rows)
+            self._conn.executemany("DELETE FROM notes WHERE id = ?",
+                                   [(note_id,) for note_id in self._deleted])
+            self._conn.executemany("DELETE FROM checkpoints WHERE note_id = ?",
+                                   [(note_id,) for note_id in self._deleted])
+            if checkpoints:
+                self._conn.executemany("INSERT OR REPLACE INTO checkpoints (note_id, seq) VALUES (?, ?)",
+                                       checkpoints.items())
+            for note in self._dirty.values():
+                prepared = self._prepared.pop(note.id, None)
+                if prepared is not None and prepared[0] == note.title and prepared[1] == note.content:
+                    self.search_index.update_indexed(note.id, prepared[2], prepared[3])
+                else:
+                    self.search_index.update(note.id, note.title, note.content)
+            for note_id in self._deleted:
+                self.search_index.remove(note_id)
+            if next_id is not None:
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('next_id', ?)",
+                                   (next_id,))
+        count = len(rows) + len(self._deleted)
+        self._dirty.clear()
+        self._deleted.clear()
+        return count
+
+    def reserve_positions(self, count):
+        """为其他连接写入的笔记预留 count 个连续排序位置，返回第一个"""
+        first = self._next_position
+        self._next_position += count
+        return first
+
+    def insert_indexed(self, notes, indexed, position):
+        """在一个事务中写入一批新笔记，从 position 起依次排序
+
+        indexed 为对应的 (标题, 正文) 索引文本。用于批量导入：切分由导入进程完成，
+        ID 与位置由界面线程的集合与数据库预留，这里只做插入。
+        """
+        rows = [(note.id, note.title, note.content or "", position + offset, note.modified,
+                 note.path) for offset, note in enumerate(notes)]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO notes (id, title, content, position, modified, path) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.search_index.insert_many(
+                [(note.id, title, body) for note, (title, body) in zip(notes, indexed)])
+        return len(rows)
+
+    def search(self, text, limit=50):
+        """全文检索，返回按相关度排序的笔记 ID"""
+        return [note_id for note_id, _ in self.search_index.query(text, limit)]
+
+    def close(self):
+        self._conn.close()
+
+
+class IndexPreparer(QThread):
+    """在后台线程把笔记的标题与正文切分为索引文本，避免写入长正文时在界面线程分词"""
+
+    prepared = Signal(object)  # (ID, 标题, 正文, 标题索引文本, 正文索引文本)，不复制长正文
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._requests = queue.SimpleQueue()
+        self._stopping = False
+
+    def request(self, note):
+        if not self._stopping:
+            self._requests.put((note.id, note.title, note.content))
+
+    def run(self):
+        while True:
+            item = self._requests.get()
+            if item is None or self._stopping:
+                return
+            note_id, title, content = item
+            self.prepared.emit((note_id, title, content, index_text(title), index_text(content)))
+
+    def stop(self):
+        """丢弃排队的请求并结束线程"""
+        self._stopping = True
+        self._requests.put(None)
+        self.wait()
@@ -0,0 +1,116 @@
+"""内存中的笔记索引
+
+笔记以紧凑的 __slots__ 记录保存，按单调递增的稳定 ID 建立字典索引；
+侧边栏顺序单独用 array 保存，删除或移动笔记不会改变其他笔记的 ID。
+"""
+import time
+from array import array
+
+
+class Note:
+    """单条笔记记录"""
+
+    __slots__ = ("id", "title", "content", "modified", "path")
+
+    def __init__(self, note_id, title, content="", modified=0.0, path=None):
+        self.id = note_id
+        self.title = title
+        self.content = content  # None 表示正文尚未从存储加载
+        self.modified = modified
+        self.path = path  # 大文件笔记的正文保存在该文件中，不进数据库
+
+    def __repr__(self):
+        return f"Note({self.id}, {self.title!r})"
+
+
+class NoteStore:
+    """按 ID O(1) 查找、按行号保持顺序的笔记集合"""
+
+    def __init__(self, next_id=1):
+        self._notes = {}
+        self._order = array("q")
+        self._rows = {}  # ID -> 行号，中间插入或删除后惰性重建
+        self._rows_valid = True
+        self._next_id = next_id
+
+    def __len__(self):
+        return len(self._order)
+
+    def __contains__(self, note_id):
+        return note_id in self._notes
+
+    def __iter__(self):
+        notes = self._notes
+        return (notes[note_id] for note_id in self._order)
+
+    def new_note(self, title=None, content=""):
+        """分配新 ID 并创建记录，尚未加入顺序"""
+        note_id = self._next_id
+        self._next_id += 1
+        if title is None:
+            title = f"未命名笔记 {note_id}"
+        return Note(note_id, title, content, time.time())
+
+    def reserve(self, count):
+        """预留 count 个连续 ID 供其他线程使用，返回第一个"""
+        first = self._next_id
+        self._next_id += count
+        return first
+
+    @property
+    def next_id(self):
+        return self._next_id
+
+    def get(self, note_id):
+        return self._notes.get(note_id)
+
+    def at(self, row):
+        return self._notes[self._order[row]]
+
+    def row_of(self, note_id):
+        """返回笔记所在行号，不存在时返回 -1"""
+        if not self._rows_valid:
+            self._rows = {note_id: row for row, note_id in enumerate(self._order)}
+            self._rows_valid = True
+        return self._rows.get(note_id, -1)
+
+    def insert(self, note, row=None):
+        """把记录插入到 row 行，默认追加到末尾"""
+        if note.id in self._notes:
+            raise ValueError(f"笔记 {note.id} 已存在")
+        self._next_id = max(self._next_id, note.id + 1)
+        self._notes[note.id] = note
+        if row is None or row >= len(self._order):
+            self._order.append(note.id)
+            if self._rows_valid:
+                self._rows[note.id] = len(self._order) - 1
+        else:
+            self._order.insert(row, note.id)
+            self._rows_valid = False
+
+    def insert_many(self, notes, row=None):
+        """按顺序批量插入到 row 行（默认末尾），用于分页加载"""
+        ids = array("q")
+        for note in notes:
+            self._notes[note.id] = note
+            ids.append(note.id)
+            if note.id >= self._next_id:
+                self._next_id = note.id + 1
+        if row is None or row >= len(self._order):
+            self._order.extend(ids)
+        else:
+            self._order[row:row] = ids
+        self._rows_valid = False
+
+    def remove(self, note_id):
+        """删除笔记并返回它原来的行号"""
+        row = self.row_of(note_id)
+        if row < 0:
+            return row
+        del self._notes[note_id]
+        self._order.pop(row)
+        if row == len(self._order):
+            del self._rows[note_id]
+        else:
+            self._rows_valid = False
+        return row
@@ -1,14 +1,94 @@
-from acrylic_window import AcrylicWindow, AcrylicEffect
+import os
+import shutil
+import time
+
+from acrylic import AcrylicWindow
+from acrylic.theme import ThemeEngine
+from knowledge.async_search import AsyncSearch, highlight_matches
+from knowledge.document_cache import DocumentCache
+from knowledge.export import ExportWorker
+from knowledge.importer import ImportWorker
+from knowledge.journal import AutosaveJournal, apply_deltas
+from knowledge.large_file import (LARGE_NOTE_BYTES, LargeNoteView, NoteTextEdit,
+                                  file_chunks, large_note_path, text_chunks)
+from knowledge.note_list import NoteListModel, NoteDelegate, NoteIdRole
+from knowledge.preview import PreviewCache
+from knowledge.storage import APP_NAME, IndexPreparer, NoteDatabase
+from knowledge.store import Note, NoteStore
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, QLineEdit,
-                               QPushButton, QScrollArea, QTextEdit, QMenu, QFileDialog,
-                               QApplication, QInputDialog, QMessageBox)
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QFont, QColor, QIcon, QAction
+                               QPushButton, QListView, QMenu, QFileDialog, QStackedWidget,
+                               QApplication, QInputDialog, QMessageBox, QAbstractItemView,
+                               QProgressDialog)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont, QColor, QAction, QTextCursor
+
+KNOWLEDGE_STYLE = """
+QWidget#NoteRoot, QWidget#NoteContent {
+    background: transparent;
+}
+QWidget#NoteTitleBar, QWidget#NoteSidebar {
+    background: rgba(255,255,255,0.1);
+}
+QWidget#NoteTitleBar {
+    border-bottom: 1px solid rgba(0,0,0,0.1);
+}
+QWidget#NoteSidebar {
+    border-right: 1px solid rgba(0,0,0,0.1);
+}
+QLabel#NoteTitle {
+    color: rgba(0,0,0,0.8);
+    font: 14px 'Microsoft Yahei';
+    qproperty-alignment: AlignCenter;
+}
+QLineEdit#NoteSearch {
+    background: rgba(255,255,255,0.2);
+    border: 1px solid rgba(0,0,0,0.1);
+    border-radius: 4px;
+    padding: 4px 12px;
+    min-width: 200px;
+}
+QListView#NoteTabList {
+    border: none;
+    background: transparent;
+}
+QTextEdit#NoteEditor, QPlainTextEdit#NoteEditor {
+    background: transparent;
+    color: rgba(0,0,0,0.8);
+    font: 14px 'Microsoft Yahei';
+    padding: 24px;
+    border: none;
+}
+QLabel#NoteStatus {
+    color: rgba(0,0,0,0.6);
+    padding: 8px 16px;
+    border-top: 1px solid rgba(0,0,0,0.1);
+}
+QLabel#NoteStatus[tone="info"] {
+    color: #64B5F6;
+}
+QPushButton#NoteToolButton {
+    background: transparent;
+    color: rgba(0,0,0,0.7);
+    padding: 6px 12px;
+    border-radius: 4px;
+    border: none;
+}
+QPushButton#NoteToolButton:hover {
+    background: rgba(0,0,0,0.05);
+}
+QPushButton#NoteToolButton:pressed {
+    background: rgba(0,0,0,0.1);
+}
+"""
 
 
 class KnowledgeManager(AcrylicWindow):
-    def __init__(self):
+    FLUSH_DELAY = 1000  # 修改合并写入数据库的间隔（毫秒）
+    CAPTURE_DELAY = 30000  # 停止输入多久后把编辑中的文档写回数据库（毫秒），此前由日志保证不丢失
+
+    def __init__(self, db_path=None):
         super().__init__()
+        self.setObjectName("KnowledgeManager")  # 同时作为启动快照的键
         self.setWindowTitle("知库管理")
         self.resize(1000, 600)
 
@@ -17,15 +97,54 @@ class KnowledgeManager(AcrylicWindow):
         self.acrylic.set_tint_color(QColor(255, 255, 255, 200))
         self.acrylic.set_opacity(100)
 
-        # 初始化数据
-        self.tabs = []
-        self.current_tab_id = -1
+        ThemeEngine.instance().register("knowledge", KNOWLEDGE_STYLE)
+
+        # 初始化数据：标题随滚动分页加载，正文在打开笔记时读取
+        self.database = NoteDatabase(db_path)
+        self.store = self.database.load_store()
+        # 侧边栏预览只为绘制到的行读取正文开头，按修改时间缓存
+        self.previews = PreviewCache(self.database.load_previews, parent=self)
+        self.tab_model = NoteListModel(self.store, self.database.fetch_page, self.previews)
+        self.result_model = NoteListModel(previews=self.previews)  # 搜索结果，有搜索词时替换侧边栏的模型
+        self._fresh_results = False  # 下一批结果属于新查询，需先清空结果列表
+
+        # 搜索在后台线程执行，输入框只负责重启防抖计时器
+        self.searcher = AsyncSearch(self.database.path, parent=self)
+        self.searcher.starting.connect(self._on_search_starting)
+        self.searcher.results.connect(self._on_search_results)
+        self.searcher.failed.connect(self._on_search_failed)
+        self.searcher.cleared.connect(self._show_all_notes)
+        self.current_tab_id = -1  # 当前笔记 ID，-1 表示没有打开的笔记
+
+        # 最近打开的笔记保留为独立文档，切换时直接交给编辑器
+        self.documents = DocumentCache(parent=self)
+        self.documents.evicted.connect(self._on_document_evicted)
+
+        # 编辑增量先写入自动保存日志，正文写入数据库后记检查点
+        self.journal = AutosaveJournal(os.path.splitext(self.database.path)[0] + ".autosave")
+        self._checkpoints = {}  # 笔记 ID -> 已写回笔记的最后一条增量序号
+        # 写回的正文在后台线程切分索引文本，flush 时直接写入
+        self.index_preparer = IndexPreparer(self)
+        self.index_preparer.prepared.connect(lambda prepared: self.database.set_prepared(*prepared))
+        self.index_preparer.start()
+        self.exporter = None  # 正在运行的批量导出
+        self.importer = None  # 正在运行的文件夹导入
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush_notes)
+        # 输入停顿只靠日志保存；切换、淘汰、关闭或长时间空闲时才取出全文写回
+        self.capture_timer = QTimer(self)
+        self.capture_timer.setSingleShot(True)
+        self.capture_timer.timeout.connect(self._capture_documents)
         self._init_ui()
+        self._recover_journal()
+        self.journal.start()
 
     def _init_ui(self):
         # 主布局
         main_widget = QWidget()
-        main_widget.setStyleSheet("background: transparent;")
+        main_widget.setObjectName("NoteRoot")
         layout = self.layout()  # 获取AcrylicWindow的布局
         layout.addWidget(main_widget)
 
@@ -52,11 +171,8 @@ class KnowledgeManager(AcrylicWindow):
     def _init_title_bar(self, parent_layout):
         # 标题栏容器
         title_bar = QWidget()
+        title_bar.setObjectName("NoteTitleBar")
         title_bar.setFixedHeight(48)
-        title_bar.setStyleSheet("""
-            background: rgba(255,255,255,0.1);
-            border-bottom: 1px solid rgba(0,0,0,0.1);
-        """)
 
         # 标题栏布局
         title_layout = QHBoxLayout(title_bar)
@@ -65,33 +181,27 @@ class KnowledgeManager(AcrylicWindow):
         # 左侧操作按钮
         btn_group = QHBoxLayout()
         self.new_btn = self._create_tool_btn("＋ 新建", self.create_note_tab)
+        self.open_btn = self._create_tool_btn("📂 打开", self.open_file)
+        self.import_btn = self._create_tool_btn("📥 导入", self.import_folder)
+        self.export_btn = self._create_tool_btn("📦 导出", lambda: self.export_notes())
         # self.save_btn = self._create_tool_btn("💾 保存", self.save_content)
         btn_group.addWidget(self.new_btn)
+        btn_group.addWidget(self.open_btn)
+        btn_group.addWidget(self.import_btn)
+        btn_group.addWidget(self.export_btn)
         # btn_group.addWidget(self.save_btn)
 
         # 中间标题
         self.title_label = QLabel("未命名文档")
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: rgba(0,0,0,0.8);
-                font: 14px 'Microsoft Yahei';
-                qproperty-alignment: AlignCenter;
-            }
-        """)
+        self.title_label.setObjectName("NoteTitle")
 
         # 右侧工具
         tool_group = QHBoxLayout()
         self.search_bar = QLineEdit()
+        self.search_bar.setObjectName("NoteSearch")
         self.search_bar.setPlaceholderText("搜索内容...")
-        self.search_bar.setStyleSheet("""
-            QLineEdit {
-                background: rgba(255,255,255,0.2);
-                border: 1px solid rgba(0,0,0,0.1);
-                border-radius: 4px;
-                padding: 4px 12px;
-                min-width: 200px;
-            }
-        """)
+        self.search_bar.returnPressed.connect(lambda: self.search_notes(self.search_bar.text()))
+        self.search_bar.textChanged.connect(self.searcher.request)
 
         title_layout.addLayout(btn_group)
         title_layout.addWidget(self.title_label, 1)
@@ -102,22 +212,24 @@ class KnowledgeManager(AcrylicWindow):
     def _init_sidebar(self, parent_layout):
         # 左侧标签栏
         sidebar = QWidget()
+        sidebar.setObjectName("NoteSidebar")
         sidebar.setFixedWidth(240)
-        sidebar.setStyleSheet("""
-            background: rgba(255,255,255,0.1);
-            border-right: 1px solid rgba(0,0,0,0.1);
-        """)
-
-        # 标签列表
-        self.tab_list = QScrollArea()
-        self.tab_list.setWidgetResizable(True)
-        self.tab_list.setStyleSheet("border: none; background: transparent;")
 
-        tab_container = QWidget()
-        self.tab_layout = QVBoxLayout(tab_container)
-        self.tab_layout.setSpacing(4)
-
-        self.tab_list.setWidget(tab_container)
+        # 标签列表：只绘制可见行，固定行高让滚动不必逐行测量
+        self.tab_list = QListView()
+        self.tab_list.setObjectName("NoteTabList")
+        self.tab_list.setModel(self.tab_model)
+        self.tab_list.setItemDelegate(NoteDelegate(self.tab_list, previews=True))
+        self.tab_list.setUniformItemSizes(True)
+        self.tab_list.setLayoutMode(QListView.Batched)
+        self.tab_list.setBatchSize(500)
+        self.tab_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.tab_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.tab_list.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tab_list.setMouseTracking(True)
+        self.tab_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.tab_list.customContextMenuRequested.connect(self.show_tab_menu)
+        self.tab_list.clicked.connect(lambda index: self.switch_tab(index.data(NoteIdRole)))
 
         # 布局
         sidebar_layout = QVBoxLayout(sidebar)
@@ -127,124 +239,65 @@ class KnowledgeManager(AcrylicWindow):
     def _init_content_area(self, parent_layout):
         # 右侧内容区
         content_area = QWidget()
-        content_area.setStyleSheet("background: transparent;")
+        content_area.setObjectName("NoteContent")
 
         # 编辑器
-        self.editor = QTextEdit()
-        self.editor.setStyleSheet("""
-            QTextEdit {
-                background: transparent;
-                color: rgba(0,0,0,0.8);
-                font: 14px 'Microsoft Yahei';
-                padding: 24px;
-                border: none;
-            }
-        """)
+        self.editor = NoteTextEdit()
+        self.editor.setObjectName("NoteEditor")
+        self.editor.oversizedPaste.connect(self._on_oversized_paste)
+        # 没有打开笔记时显示空白文档
+        self.editor.setDocument(self.documents.blank())
+
+        # 大文件笔记用映射分页的查看器，与普通编辑器叠放
+        self.large_view = LargeNoteView()
+        self.large_view.indexed.connect(self._on_large_indexed)
+        self.large_view.failed.connect(
+            lambda path, message: self._update_status(f"大文件写入失败：{message}", "info"))
+        self.editor_stack = QStackedWidget()
+        self.editor_stack.addWidget(self.editor)
+        self.editor_stack.addWidget(self.large_view)
 
         # 状态栏
         self.status_bar = QLabel("就绪")
-        self.status_bar.setStyleSheet("""
-            color: rgba(0,0,0,0.6);
-            padding: 8px 16px;
-            border-top: 1px solid rgba(0,0,0,0.1);
-        """)
+        self.status_bar.setObjectName("NoteStatus")
 
         # 布局
         layout = QVBoxLayout(content_area)
-        layout.addWidget(self.editor, 1)
+        layout.addWidget(self.editor_stack, 1)
         layout.addWidget(self.status_bar)
         parent_layout.addWidget(content_area, 1)
 
     def _create_tool_btn(self, text, callback):
         btn = QPushButton(text)
-        btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: rgba(0,0,0,0.7);
-                padding: 6px 12px;
-                border-radius: 4px;
-                border: none;
-            }
-            QPushButton:hover {
-                background: rgba(0,0,0,0.05);
-            }
-            QPushButton:pressed {
-                background: rgba(0,0,0,0.1);
-            }
-        """)
+        btn.setObjectName("NoteToolButton")
         btn.clicked.connect(callback)
         return btn
 
-    def _create_tab_widget(self):
-        """现代风格标签控件"""
-        tab = QPushButton()
-        tab.setCheckable(True)
-        tab.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: rgba(0,0,0,0.8);
-                padding: 8px 20px;
-                text-align: left;
-                border-radius: 4px;
-                font: 13px 'Microsoft Yahei';
-            }
-            QPushButton:hover {
-                background: rgba(0,0,0,0.05);
-            }
-            QPushButton:checked {
-                background: rgba(0,0,0,0.08);
-                font-weight: 500;
-                border-right: 3px solid rgba(0,120,215,0.8);
-            }
-        """)
-        return tab
-
     def create_note_tab(self):
         """创建新笔记标签"""
-        tab_id = len(self.tabs)
-        new_tab = {
-            "id": tab_id,
-            "title": f"未命名笔记 {tab_id + 1}",
-            "content": "",
-            "widget": self._create_tab_widget()
-        }
-        self.tabs.append(new_tab)
-        self._update_tab_display()
-        self.switch_tab(tab_id)
-
-    def _create_tab_widget(self):
-        """创建标签控件"""
-        tab = QPushButton()
-        tab.setCheckable(True)
-        tab.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: rgba(0,0,0,0.8);
-                padding: 8px 16px;
-                text-align: left;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background: rgba(0,0,0,0.05);
-            }
-            QPushButton:checked {
-                background: rgba(0,0,0,0.1);
-                font-weight: 500;
-            }
-        """)
-        tab.setContextMenuPolicy(Qt.CustomContextMenu)
-        tab.customContextMenuRequested.connect(self.show_tab_menu)
-        return tab
+        self._add_note(self.store.new_note())
 
     def show_tab_menu(self, pos):
         """显示标签右键菜单"""
-        widget = self.sender()
+        index = self.tab_list.indexAt(pos)
+        if not index.isValid():
+            return
+        note_id = index.data(NoteIdRole)
         menu = QMenu()
 
+        # 在多选范围内右键时导出全部选中的笔记
+        selected = self.tab_list.selectionModel().selectedIndexes()
+        if len(selected) > 1 and index in selected:
+            selected.sort(key=lambda item: item.row())
+            note_ids = [item.data(NoteIdRole) for item in selected]
+            export = ("导出所选", lambda: self.export_notes(note_ids))
+        else:
+            export = ("导出", lambda: self.export_tab(note_id))
+
         actions = [
-            ("重命名", lambda: self.rename_tab(widget)),
-            ("删除", lambda: self.delete_tab(widget)),
-            ("导出", lambda: self.export_tab(widget))
+            ("重命名", lambda: self.rename_tab(note_id)),
+            ("删除", lambda: self.delete_tab(note_id)),
+            export
         ]
 
         for text, callback in actions:
@@ -252,121 +305,397 @@ class KnowledgeManager(AcrylicWindow):
             action.triggered.connect(callback)
             menu.addAction(action)
 
-        menu.exec(widget.mapToGlobal(pos))
+        menu.exec(self.tab_list.viewport().mapToGlobal(pos))
 
     def _update_tab_display(self):
-        """安全更新标签显示"""
-        # 清理旧控件
-        while self.tab_layout.count():
-            item = self.tab_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # 重建所有标签
-        for index, tab in enumerate(self.tabs):
-            widget = self._create_tab_widget()
-            widget.setText(tab["title"])
-            widget.setChecked(index == self.current_tab_id)
-            widget.clicked.connect(lambda _, idx=index: self.switch_tab(idx))
-            self.tab_layout.addWidget(widget)
-            tab["widget"] = widget  # 更新引用
+        """同步侧边栏选中行，行内容由模型逐行通知"""
+        index = self.tab_list.model().index_of(self.current_tab_id)
+        if not index.isValid():
+            self.tab_list.clearSelection()
+            return
+        self.tab_list.setCurrentIndex(index)
+        self.tab_list.scrollTo(index)
 
     def switch_tab(self, tab_id):
-        """增强版标签切换"""
-        if 0 <= tab_id < len(self.tabs):
-            # 保存旧标签内容
-            if self.current_tab_id != -1:
-                self.tabs[self.current_tab_id]["content"] = self.editor.toPlainText()
+        """增强版标签切换，tab_id 为笔记的稳定 ID"""
+        current_tab = self._note(tab_id)
+        if current_tab is not None:
+            # 记录旧标签的光标与滚动位置并写回修改，大文件笔记在切走时保存
+            self.documents.save_view(self.current_tab_id, self.editor)
+            previous = self.documents.document(self.current_tab_id)
+            if previous is not None and previous.isModified():
+                self._store_document(self.current_tab_id, previous)
+            self.large_view.close()
 
             # 更新当前标签
             self.current_tab_id = tab_id
-            current_tab = self.tabs[tab_id]
-
-            # 更新界面
-            self.editor.setText(current_tab["content"])
-            self.title_label.setText(current_tab["title"])
-
-            # 更新选中状态
-            for i, tab in enumerate(self.tabs):
-                if tab["widget"]:
-                    tab["widget"].setChecked(i == tab_id)
+            self.title_label.setText(current_tab.title)
+            self._update_tab_display()
 
-            self._update_status(f"已切换到：{current_tab['title']}")
+            if current_tab.path is not None:
+                self._open_large(current_tab)
+                return
+
+            # 更新界面：命中缓存时直接换上文档，不复制也不重新排版
+            document = self.documents.document(tab_id)
+            if document is None:
+                document = self.documents.add(
+                    tab_id, self.database.load_content(current_tab), self.editor.font())
+                document.contentsChange.connect(
+                    lambda position, removed, added, note_id=tab_id, doc=document:
+                    self._record_change(note_id, doc, position, removed, added))
+                if not self.database.is_pending(tab_id):
+                    current_tab.content = None  # 正文由文档持有，需要时再从数据库读取
+            self.editor.setDocument(document)
+            self.editor_stack.setCurrentWidget(self.editor)
+            self.documents.restore_view(tab_id, self.editor)
+            highlight_matches(self.editor, self.searcher.text())
+
+            self._update_status(f"已切换到：{current_tab.title}")
 
     # 以下是需要补充的关联方法
-    def rename_tab(self, widget):
+    def rename_tab(self, tab_id):
         """重命名标签"""
-        tab = next((t for t in self.tabs if t["widget"] == widget), None)
-        if tab:
+        tab = self._note(tab_id)
+        if tab is not None:
             new_name, ok = QInputDialog.getText(
-                self, "重命名", "新名称：", text=tab["title"])
+                self, "重命名", "新名称：", text=tab.title)
             if ok and new_name:
-                tab["title"] = new_name
-                self._update_tab_display()
+                tab.title = new_name
+                self._mark_dirty(tab)
+                self.tab_model.note_changed(tab_id)
+                self.result_model.note_changed(tab_id)
+                if tab_id == self.current_tab_id:
+                    self.title_label.setText(new_name)
                 self._update_status(f"已重命名为：{new_name}")
 
-    def delete_tab(self, widget):
+    def delete_tab(self, tab_id):
         """增强版删除逻辑"""
-        try:
-            delete_index = next(i for i, t in enumerate(self.tabs) if t["widget"] == widget)
-        except StopIteration:
+        tab = self._note(tab_id)
+        if tab is None:
             return
 
         confirm = QMessageBox.question(
             self, "确认删除",
-            f"确定删除 {self.tabs[delete_index]['title']} 吗？",
+            f"确定删除 {tab.title} 吗？",
             QMessageBox.Yes | QMessageBox.No
         )
 
         if confirm == QMessageBox.Yes:
-            # 保存当前内容
-            if delete_index == self.current_tab_id:
-                self.save_content()
-
-            # 调整索引
-            if self.current_tab_id >= delete_index:
-                self.current_tab_id -= 1
-
-            # 执行删除
-            del self.tabs[delete_index]
-            widget.deleteLater()
+            deleting_current = tab_id == self.current_tab_id
+
+            # 执行删除，其他笔记的 ID 不受影响
+            view_store = self.tab_list.model().store()
+            delete_row = view_store.row_of(tab_id)
+            self.tab_model.remove_note(tab_id)
+            self.result_model.remove_note(tab_id)
+            if deleting_current:
+                self.large_view.close()
+                self.editor_stack.setCurrentWidget(self.editor)
+                self.editor.setDocument(self.documents.blank())
+            self.documents.discard(tab_id)
+            self.database.delete(tab_id)
+            self.journal.deleted(tab_id)
+            self.flush_timer.start(self.FLUSH_DELAY)
 
             # 自动切换
-            if self.tabs:
-                new_index = max(0, min(delete_index, len(self.tabs) - 1))
-                self.switch_tab(new_index)
-            else:
+            if deleting_current:
                 self.current_tab_id = -1
-                self.editor.clear()
-                self.title_label.setText("未命名文档")
+                if len(view_store):
+                    self.switch_tab(view_store.at(min(delete_row, len(view_store) - 1)).id)
+                else:
+                    self.editor.clear()
+                    self.title_label.setText("未命名文档")
 
             self._update_tab_display()
             self._update_status(f"已删除标签")
 
-    def export_tab(self, widget):
+    def export_tab(self, tab_id):
         """导出标签内容"""
-        tab = next((t for t in self.tabs if t["widget"] == widget), None)
-        if tab:
+        tab = self._note(tab_id)
+        if tab is not None:
+            if tab_id in self.documents:
+                self._capture_documents()
             path, _ = QFileDialog.getSaveFileName(
                 self, "导出内容", "", "文本文件 (*.txt)")
             if path:
                 try:
-                    with open(path, "w", encoding="utf-8") as f:
-                        f.write(tab["content"])
-                    self._update_status(f"已导出到：{path}", "#64B5F6")
+                    if tab.path is not None:
+                        if self.large_view.path == tab.path:
+                            self.large_view.save()
+                        self.large_view.wait_writes()
+                        shutil.copyfile(tab.path, path)
+                    else:
+                        with open(path, "w", encoding="utf-8") as f:
+                            f.write(self.database.load_content(tab))
+                    self._update_status(f"已导出到：{path}", "info")
                 except Exception as e:
                     QMessageBox.critical(self, "导出错误", str(e))
 
-    def _update_status(self, message, color="rgba(0,0,0,0.6)"):
-        """更新状态栏"""
+    def export_notes(self, note_ids=None):
+        """在后台批量导出笔记，note_ids 为 None 时导出全部"""
+        if self.exporter is not None:
+            self._update_status("已有导出正在进行", "info")
+            return
+        formats = {"ZIP 压缩包": "zip", "文本文件 (.txt)": "txt", "Markdown (.md)": "md"}
+        choice, ok = QInputDialog.getItem(self, "批量导出", "导出格式：", list(formats), 0, False)
+        if not ok:
+            return
+        fmt = formats[choice]
+        if fmt == "zip":
+            target, _ = QFileDialog.getSaveFileName(self, "导出到", "笔记.zip", "ZIP 压缩包 (*.zip)")
+        else:
+            target = QFileDialog.getExistingDirectory(self, "导出到文件夹")
+        if not target:
+            return
+
+        # 导出线程读取数据库，先写入所有未保存的修改
+        self.large_view.save()
+        self.large_view.wait_writes()
+        self._capture_documents()
+        self.flush_notes()
+
+        self.exporter = ExportWorker(self.database.path, target, fmt, note_ids, self)
+        dialog = QProgressDialog("正在导出笔记...", "取消", 0, 0, self)
+        dialog.setWindowTitle("批量导出")
+        dialog.setMinimumDuration(500)
+        dialog.setAutoReset(False)
+        dialog.canceled.connect(self.exporter.cancel)
+        self.exporter.progress.connect(lambda done, total: (dialog.setMaximum(total), dialog.setValue(done)))
+        self.exporter.failed.connect(lambda message: QMessageBox.critical(self, "导出错误", message))
+        self.exporter.finished.connect(dialog.deleteLater)
+        self.exporter.finished.connect(self._on_export_finished)
+        self.exporter.start()
+
+    def _on_export_finished(self):
+        exporter, self.exporter = self.exporter, None
+        if exporter.error is not None:
+            self._update_status(f"导出失败（已写出 {exporter.exported} 条）", "info")
+        elif exporter.cancelled:
+            self._update_status(f"导出已取消（已写出 {exporter.exported} 条）", "info")
+        else:
+            self._update_status(f"已导出 {exporter.exported} 条笔记到：{exporter.target}", "info")
+        exporter.deleteLater()
+
+    def open_file(self):
+        """把文本文件打开为笔记，超过大文件阈值时在后台复制为大文件笔记"""
+        path, _ = QFileDialog.getOpenFileName(self, "打开文件", "", "文本文件 (*.txt *.md *.log);;所有文件 (*)")
+        if not path:
+            return
+        title = os.path.basename(path)
+        if os.path.getsize(path) >= LARGE_NOTE_BYTES:
+            # 复制进笔记库后编辑副本，保存时不改写原文件
+            note = self.store.new_note(title, "")
+            note.path = large_note_path(self.database.path, note.id)
+            self.large_view.write_file(note.path, file_chunks(path))
+        else:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                note = self.store.new_note(title, f.read())
+        self._add_note(note)
+
+    def import_folder(self):
+        """把文件夹（含子文件夹）中的文本文件批量导入为笔记"""
+        if self.importer is not None:
+            self._update_status("已有导入正在进行", "info")
+            return
+        root = QFileDialog.getExistingDirectory(self, "导入文件夹")
+        if not root:
+            return
+        self.search_bar.clear()
+        # 未保存的修改先写入，导入线程写库时不与界面线程争用
+        self.flush_notes()
+        self.importer = ImportWorker(root, self.database.path, parent=self)
+        self.importer.scanned.connect(self._on_import_scanned)
+        self.importer.batch.connect(self._on_import_batch)
+        self.importer.progress.connect(
+            lambda done, total, rate: self._update_status(f"正在导入 {done}/{total}（{rate:.0f} 个文件/秒）"))
+        self.importer.failed.connect(lambda message: QMessageBox.critical(self, "导入错误", message))
+        self.importer.finished.connect(self._on_import_finished)
+        self.import_btn.setEnabled(False)
+        self.importer.start()
+
+    def _on_import_scanned(self, total):
+        """为导入线程预留 ID 与排序位置"""
+        self.importer.begin(self.store.reserve(total), self.database.reserve_positions(total))
+
+    def _on_import_batch(self, notes):
+        """导入线程已写入一批笔记，侧边栏只收到一次插入通知"""
+        # 滚动分页可能已经从数据库读到了其中一部分
+        self.tab_model.append_notes([note for note in notes if note.id not in self.store])
+
+    def _on_import_finished(self):
+        importer, self.importer = self.importer, None
+        self.import_btn.setEnabled(True)
+        message = f"已导入 {importer.imported} 个文件，{importer.files_per_second():.0f} 个文件/秒"
+        if importer.unreadable:
+            message += f"，{importer.unreadable} 个无法读取"
+        if importer.error is not None:
+            message = "导入失败，" + message
+        if importer.cancelled:
+            message = "导入已取消，" + message
+        self._update_status(message, "info")
+        importer.deleteLater()
+
+    def _on_oversized_paste(self, text):
+        """超大粘贴另存为文件，作为大文件笔记打开"""
+        note = self.store.new_note(content="")
+        note.path = large_note_path(self.database.path, note.id)
+        self.large_view.write_file(note.path, text_chunks(text))
+        self._add_note(note)
+
+    def _add_note(self, note):
+        self.search_bar.clear()
+        self.tab_model.insert_note(note)
+        self._mark_dirty(note)
+        self.switch_tab(note.id)
+
+    def _open_large(self, note):
+        try:
+            self.large_view.open(note.path)
+        except OSError as e:
+            self.editor_stack.setCurrentWidget(self.editor)
+            self.editor.setDocument(self.documents.blank())
+            self._update_status(f"无法打开：{e}", "info")
+            return
+        self.editor_stack.setCurrentWidget(self.large_view)
+        self._update_status(f"已切换到：{note.title}（大文件，正在建立行索引）")
+
+    def _on_large_indexed(self, lines, complete):
+        if complete:
+            self.previews.invalidate(self.current_tab_id)  # 后台复制完成前读到的摘要为空
+            self._update_status(f"行索引完成：共 {lines} 行")
+
+    def _note(self, note_id):
+        """按 ID 取笔记；侧边栏尚未分页加载到的笔记从搜索结果或数据库读取"""
+        note = self.store.get(note_id)
+        if note is None:
+            note = self.result_model.store().get(note_id)
+        if note is None and note_id != -1:
+            note = self.database.load_note(note_id)
+        return note
+
+    def search_notes(self, text):
+        """跳过防抖立即检索，结果异步显示在侧边栏"""
+        self.searcher.request(text, immediate=True)
+
+    def _on_search_starting(self, text):
+        # 查询已提交的索引；正在编辑的修改在切换笔记或停止输入 CAPTURE_DELAY 后写入，之后即可被检索
+        self._fresh_results = True
+
+    def _on_search_results(self, note_ids, finished):
+        """逐批接收结果，第一批到达时才替换上一次的结果"""
+        if self._fresh_results:
+            self._fresh_results = False
+            self.result_model.reset_store(NoteStore())
+            if self.tab_list.model() is not self.result_model:
+                self.tab_list.setModel(self.result_model)
+        notes = [note for note in map(self._note, note_ids) if note is not None]
+        self.result_model.append_notes(notes)
+        if finished:
+            self._update_tab_display()
+            highlight_matches(self.editor, self.searcher.text())
+            self._update_status(f"找到 {len(self.result_model.store())} 条结果")
+
+    def _on_search_failed(self, message):
+        self._fresh_results = False
+        self._update_status(f"搜索失败：{message}", "info")
+
+    def _show_all_notes(self):
+        self.editor.setExtraSelections([])
+        if self.tab_list.model() is not self.tab_model:
+            self.tab_list.setModel(self.tab_model)
+            self.result_model.reset_store(NoteStore())
+            self._update_tab_display()
+
+    def _capture_documents(self):
+        """把缓存中有修改的文档写回对应笔记并标记待保存"""
+        self.capture_timer.stop()
+        for note_id, document in self.documents.modified():
+            self._store_document(note_id, document)
+
+    def _store_document(self, note_id, document):
+        note = self._note(note_id)
+        if note is not None:
+            note.content = document.toPlainText()
+            document.setModified(False)
+            self._mark_dirty(note)
+            self._checkpoints[note_id] = self.journal.seq
+            self.index_preparer.request(note)
+
+    def _record_change(self, note_id, document, position, removed, added):
+        """把一次编辑记为日志增量，只取出新插入的文本"""
+        cursor = QTextCursor(document)
+        cursor.setPosition(position)
+        cursor.setPosition(min(position + added, document.characterCount() - 1), QTextCursor.KeepAnchor)
+        self.journal.record(note_id, position, removed, cursor.selectedText().replace("\u2029", "\n"))
+        note = self._note(note_id)
+        if note is not None:
+            self.previews.update_from_document(note, document)
+        self.capture_timer.start(self.CAPTURE_DELAY)
+
+    def _recover_journal(self):
+        """把上次异常退出时日志中未写入数据库的修改重放并保存"""
+        recovered = self.journal.recover(self.database.checkpoints())
+        for note_id, deltas in recovered.items():
+            note = self._note(note_id)
+            if note is None:
+                # 新建后还没来得及写入数据库的笔记
+                note = Note(note_id, f"恢复的笔记 {note_id}", "")
+                self.tab_model.insert_note(note)
+            note.content = apply_deltas(self.database.load_content(note), deltas)
+            self._mark_dirty(note)
+            self._checkpoints[note_id] = self.journal.seq
+        self.flush_notes()
+        self.journal.reset()
+        if recovered:
+            self._update_status(f"已从自动保存日志恢复 {len(recovered)} 条笔记", "info")
+
+    def _on_document_evicted(self, note_id, document):
+        if document.isModified():
+            self._store_document(note_id, document)
+
+    def _mark_dirty(self, note):
+        note.modified = time.time()
+        self.previews.invalidate(note.id)
+        self.database.save(note)
+        self.flush_timer.start(self.FLUSH_DELAY)
+
+    def flush_notes(self):
+        """把积累的修改在一个事务中写入数据库，由自动保存定时器调用；编辑中的文档由 _capture_documents 写回"""
+        self.flush_timer.stop()
+        # 检查点与正文同一事务写入；日志中的检查点只用于压缩
+        self.database.flush(self.store.next_id, self._checkpoints)
+        for note_id, seq in self._checkpoints.items():
+            self.journal.checkpoint(note_id, seq)
+        self._checkpoints.clear()
+        self.journal.compact()
+
+    def closeEvent(self, event):
+        self.searcher.stop()
+        for worker in (self.exporter, self.importer):
+            if worker is not None:
+                worker.cancel()
+                worker.wait()
+        self.large_view.close()
+        self.large_view.wait_writes()
+        self.index_preparer.stop()
+        self._capture_documents()
+        self.flush_notes()
+        self.journal.compact(force=True)
+        self.journal.stop()
+        super().closeEvent(event)
+
+    def _update_status(self, message, tone="normal"):
+        """更新状态栏，tone 对应样式表中的 NoteStatus[tone] 规则"""
         self.status_bar.setText(message)
-        self.status_bar.setStyleSheet(f"color: {color}; padding: 8px 16px;")
+        ThemeEngine.set_state(self.status_bar, "tone", tone)
         QTimer.singleShot(5000, lambda: self.status_bar.setText("就绪"))
 
 
 
 if __name__ == "__main__":
     app = QApplication([])
+    app.setApplicationName(APP_NAME)  # 数据库位于该名称的 AppDataLocation 下
     app.setFont(QFont("微软雅黑"))
     window = KnowledgeManager()
     window.show()
@@ -0,0 +1,65 @@
+from PySide6.QtCore import QEventLoop, QTimer
+
+from knowledge.async_search import AsyncSearch
+from knowledge.storage import NoteDatabase
+from knowledge.store import Note
+
+
+def test_query_errors_are_reported(app, tmp_path):
+    path = tmp_path / "broken.db"
+    path.write_bytes(b"not a database" * 100)  # 打开索引必然出错
+    searcher = AsyncSearch(str(path))
+    failures, results = [], []
+    loop = QEventLoop()
+    searcher.failed.connect(lambda message: (failures.append(message), loop.quit()))
+    searcher.results.connect(lambda ids, finished: (results.append(ids), loop.quit()))
+    QTimer.singleShot(5000, loop.quit)
+    searcher.request("笔记", immediate=True)
+    loop.exec()
+    searcher.stop()
+
+    assert results == []
+    assert len(failures) == 1 and failures[0]
+
+
+def _search_database(tmp_path):
+    database = NoteDatabase(str(tmp_path / "notes.db"))
+    for note_id in range(1, 26):
+        database.save(Note(note_id, f"笔记 {note_id}", "检索" if note_id % 2 else "索引"))
+    database.flush(26)
+    database.close()
+    return str(tmp_path / "notes.db")
+
+
+def _collect(searcher, queries):
+    batches = []
+    loop = QEventLoop()
+
+    def on_results(ids, finished):
+        batches.append((ids, finished))
+        if finished:
+            loop.quit()
+
+    searcher.results.connect(on_results)
+    QTimer.singleShot(5000, loop.quit)
+    for text in queries:
+        searcher.request(text, immediate=True)
+    loop.exec()
+    searcher.stop()
+    return batches
+
+
+def test_results_arrive_in_batches(app, tmp_path):
+    searcher = AsyncSearch(_search_database(tmp_path), batch=5)
+    batches = _collect(searcher, ["检索"])
+    assert [len(ids) for ids, _ in batches] == [5, 5, 3]
+    assert [finished for _, finished in batches] == [False, False, True]
+    assert sorted(sum((ids for ids, _ in batches), [])) == list(range(1, 26, 2))
+
+
+def test_newer_query_supersedes_the_running_one(app, tmp_path):
+    searcher = AsyncSearch(_search_database(tmp_path), batch=1)
+    batches = _collect(searcher, ["检索", "索引"])
+    # 旧查询的结果即使已取出也被代号过滤掉，只收到新查询的完整结果
+    assert sorted(sum((ids for ids, _ in batches), [])) == list(range(2, 26, 2))
+    assert [finished for _, finished in batches].count(True) == 1
@@ -0,0 +1,89 @@
+from PySide6.QtGui import QTextCursor
+
+from conftest import process_events
+from knowledge.search import SearchIndex
+from knowledge.storage import NoteDatabase
+from knowledge.store import Note
+from test_pyside import KnowledgeManager
+
+
+def _database(tmp_path, *contents):
+    path = str(tmp_path / "notes.db")
+    database = NoteDatabase(path)
+    for note_id, content in enumerate(contents, 1):
+        database.save(Note(note_id, "笔记", content))
+    database.flush(len(contents) + 1)
+    database.close()
+    return path
+
+
+def _crash(window):
+    """模拟异常退出：日志已落盘，编辑中的文档没有写回数据库"""
+    window.flush_timer.stop()
+    window.searcher.stop()
+    window.index_preparer.stop()
+    window.journal.stop()
+    window.database.close()
+
+
+def _stored(path):
+    database = NoteDatabase(path)
+    content = database.load_content(Note(1, "笔记", None))
+    database.close()
+    return content
+
+
+def test_opening_a_note_journals_nothing(app, tmp_path):
+    path = _database(tmp_path, "abc def")
+    window = KnowledgeManager(path)
+    window.switch_tab(1)
+    assert window.editor.toPlainText() == "abc def"
+    assert window.journal.seq == 0  # 载入正文不是编辑
+    _crash(window)
+
+    window = KnowledgeManager(path)
+    window.close()
+    assert _stored(path) == "abc def"
+
+
+def _type(window, text):
+    cursor = window.editor.textCursor()
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText(text)
+
+
+def test_typing_pauses_rely_on_the_journal(app, tmp_path):
+    path = _database(tmp_path, "abc def")
+    window = KnowledgeManager(path)
+    window.switch_tab(1)
+    _type(window, " ghi")
+    assert not window.flush_timer.isActive()  # 停顿时不取全文、不写数据库
+    assert window.capture_timer.isActive()
+    _crash(window)
+
+    window = KnowledgeManager(path)
+    window.close()
+    assert _stored(path) == "abc def ghi"
+
+
+def test_switching_away_indexes_off_the_gui_thread(app, tmp_path, monkeypatch):
+    path = _database(tmp_path, "abc def", "second")
+    window = KnowledgeManager(path)
+    window.switch_tab(1)
+    _type(window, " 倒排索引")
+    window.switch_tab(2)
+    assert window.database.is_pending(1)
+    assert window.flush_timer.isActive()
+    for _ in range(100):
+        if 1 in window.database._prepared:
+            break
+        process_events(10)
+
+    def inline(*args):
+        raise AssertionError("索引文本应已在后台切分")
+
+    monkeypatch.setattr(SearchIndex, "update", inline)
+    window.flush_notes()
+    assert window.database.search("倒排") == [1]
+    monkeypatch.undo()
+    window.close()
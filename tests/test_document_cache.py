@@ -0,0 +1,22 @@
+from PySide6.QtWidgets import QTextEdit
+
+from knowledge.document_cache import DocumentCache
+from conftest import process_events
+
+
+def test_blank_document_survives_document_swaps(app):
+    cache = DocumentCache(max_chars=10)
+    editor = QTextEdit()
+    blank = cache.blank()
+    editor.setDocument(blank)
+
+    editor.setDocument(cache.add(1, "第一条笔记的正文"))
+    editor.setDocument(cache.add(2, "第二条笔记的正文"))  # 淘汰笔记 1
+    editor.setDocument(cache.blank())
+    cache.discard(2)
+    process_events(0)
+
+    assert cache.blank() is blank
+    editor.insertPlainText("仍然可用")
+    assert blank.toPlainText() == "仍然可用"
+    assert 1 not in cache and 2 not in cache
@@ -0,0 +1,27 @@
+from PySide6.QtWidgets import QWidget
+
+from acrylic.effect import AcrylicEffect
+from conftest import process_events
+
+
+def test_invalidation_repaints_again_after_resume(app):
+    widget = QWidget()
+    widget.resize(200, 100)
+    effect = AcrylicEffect(widget)
+    effect.suspend()
+    effect.set_opacity(50)
+    widget.resize(300, 100)
+    effect._invalidate_cache()
+    assert effect.dirty_rects == []  # 暂停期间不积累失效区域
+    assert not effect.timer.isActive()
+
+    effect.resume()
+    assert effect.timer.isActive()
+    process_events(effect.update_interval + 30)
+    assert effect.dirty_rects == []
+
+    # 恢复之后的参数变化仍能安排重绘
+    effect.set_tint_color(effect.tint_color)
+    assert effect.timer.isActive()
+    process_events(effect.update_interval + 30)
+    assert effect.dirty_rects == [] and not effect.timer.isActive()
@@ -0,0 +1,51 @@
+import os
+import zipfile
+
+from knowledge.export import ExportWorker
+from knowledge.storage import NoteDatabase
+from knowledge.store import Note
+
+
+def _database(tmp_path, count):
+    path = str(tmp_path / "notes.db")
+    database = NoteDatabase(path)
+    for note_id in range(1, count + 1):
+        database.save(Note(note_id, "同名" if note_id <= 2 else f"笔记/{note_id}", f"正文 {note_id}"))
+    large = tmp_path / "large.txt"
+    large.write_bytes(b"x" * (3 * 1024 * 1024))
+    database.save(Note(count + 1, "大文件", "", path=str(large)))
+    database.flush(count + 2)
+    database.close()
+    return path
+
+
+def test_zip_export_streams_every_note(app, tmp_path):
+    target = str(tmp_path / "out.zip")
+    worker = ExportWorker(_database(tmp_path, 5), target)
+    progress = []
+    worker.progress.connect(lambda done, total: progress.append((done, total)))
+    worker.start()
+    worker.wait()
+
+    assert worker.error is None and not worker.cancelled
+    assert worker.exported == worker.total == 6
+    assert not os.path.exists(target + ".part")
+    with zipfile.ZipFile(target) as archive:
+        assert archive.namelist() == ["同名.txt", "同名 (2).txt", "笔记_3.txt", "笔记_4.txt",
+                                      "笔记_5.txt", "大文件.txt"]
+        assert archive.read("同名 (2).txt").decode() == "正文 2"
+        assert archive.read("大文件.txt") == b"x" * (3 * 1024 * 1024)
+
+
+def test_cancelled_zip_export_leaves_no_file(app, tmp_path):
+    target = str(tmp_path / "out.zip")
+    worker = ExportWorker(_database(tmp_path, 50), target)
+    worker.BATCH = 10
+    worker.PROGRESS_INTERVAL = 0
+    # 直接调用 run，进度回调同步执行，导出第一批后取消
+    worker.progress.connect(lambda done, total: done and worker.cancel())
+    worker.run()
+
+    assert worker.cancelled and worker.error is None
+    assert worker.exported == 10
+    assert not os.path.exists(target) and not os.path.exists(target + ".part")
@@ -0,0 +1,22 @@
+from PySide6.QtGui import QColor, QImage
+
+from acrylic import glyph_cache
+from acrylic.title_bar import TitleButton
+
+
+def test_hover_frames_reuse_cached_pixmaps(app):
+    button = TitleButton("", config={'color': '#ffffff'})
+    image = QImage(button.size(), QImage.Format_ARGB32)
+    button.bgColor = QColor(255, 255, 255, 10)
+    button.render(image)
+    misses = glyph_cache.glyphs.misses, glyph_cache.backgrounds.misses
+
+    # 悬停动画只改变透明度，逐帧绘制不应再渲染新的位图
+    for alpha in range(11, 61):
+        button.bgColor = QColor(255, 255, 255, alpha)
+        button.render(image)
+    assert (glyph_cache.glyphs.misses, glyph_cache.backgrounds.misses) == misses
+
+    # 第二个同样配置的按钮共用进程级缓存
+    TitleButton("", config={'color': '#ffffff'}).render(image)
+    assert (glyph_cache.glyphs.misses, glyph_cache.backgrounds.misses) == misses
@@ -0,0 +1,52 @@
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+from acrylic import AcrylicWindow
+from acrylic.event_router import BorderEventRouter
+from conftest import process_events
+
+
+class _EventCounter(QObject):
+    """统计界面线程中的定时器与绘制事件"""
+
+    KINDS = (QEvent.Timer, QEvent.Paint, QEvent.UpdateRequest)
+
+    def __init__(self):
+        super().__init__()
+        self.counts = dict.fromkeys(self.KINDS, 0)
+
+    def eventFilter(self, obj, event):
+        kind = event.type()
+        if kind in self.counts:
+            self.counts[kind] += 1
+        return False
+
+
+def _counters(window):
+    resizer = window.window_resizer
+    return (resizer.cursor_updates, resizer.geometry_applies,
+            resizer.zone_map.rebuilds, BorderEventRouter.instance().routed)
+
+
+def test_idle_window_has_no_wakeups(app):
+    window = AcrylicWindow()
+    window.resize(500, 400)
+    window.show()
+    process_events(300)  # 等待首帧与延迟刷新结束
+
+    before = _counters(window)
+    counter = _EventCounter()
+    QApplication.instance().installEventFilter(counter)
+    try:
+        process_events(500)
+    finally:
+        QApplication.instance().removeEventFilter(counter)
+
+    assert _counters(window) == before
+    assert not window.acrylic.timer.isActive()
+    assert not window.window_resizer.frame_timer.isActive()
+    # 唯一的定时器事件是 process_events 自己的退出计时
+    assert counter.counts[QEvent.Timer] <= 1
+    assert counter.counts[QEvent.Paint] == 0
+    assert counter.counts[QEvent.UpdateRequest] == 0
+    window.close()
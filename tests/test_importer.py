@@ -0,0 +1,57 @@
+from PySide6.QtCore import QEventLoop, QTimer
+
+from conftest import process_events
+from knowledge.importer import ImportWorker
+from knowledge.storage import NoteDatabase
+from knowledge.store import Note
+
+
+def _tree(tmp_path):
+    root = tmp_path / "notes"
+    (root / "子目录").mkdir(parents=True)
+    (root / "a.txt").write_text("第一篇\r\n笔记", encoding="utf-8")
+    (root / "子目录" / "b.md").write_bytes("国标编码的笔记".encode("gbk"))
+    (root / "c.log").write_text("log line", encoding="utf-8")
+    (root / "skip.bin").write_bytes(b"\x00\x01")
+    return str(root)
+
+
+def _run(worker):
+    batches, failures = [], []
+    worker.scanned.connect(lambda total: worker.begin(1, 1))
+    worker.batch.connect(batches.append)
+    worker.failed.connect(failures.append)
+    loop = QEventLoop()
+    worker.finished.connect(loop.quit)
+    QTimer.singleShot(60000, loop.quit)
+    worker.start()
+    loop.exec()
+    assert worker.wait(1000)
+    process_events(0)
+    return batches, failures
+
+
+def test_import_tree_through_the_process_pool(app, tmp_path):
+    db_path = str(tmp_path / "notes.db")
+    NoteDatabase(db_path).close()
+    worker = ImportWorker(_tree(tmp_path), db_path, processes=2)
+    batches, failures = _run(worker)
+
+    assert failures == [] and worker.error is None
+    assert worker.total == worker.processed == worker.imported == 3
+    assert [note.title for notes in batches for note in notes] == ["a", "c", "b"]
+    database = NoteDatabase(db_path)
+    assert [database.load_content(Note(note_id, "", None)) for note_id in (1, 2, 3)] == [
+        "第一篇\n笔记", "log line", "国标编码的笔记"]
+    assert database.search("国标") == [3]
+    database.close()
+
+
+def test_database_errors_are_reported(app, tmp_path):
+    db_path = tmp_path / "broken.db"
+    db_path.write_bytes(b"not a database" * 100)
+    worker = ImportWorker(_tree(tmp_path), str(db_path), processes=1)
+    batches, failures = _run(worker)
+
+    assert batches == [] and worker.imported == 0
+    assert len(failures) == 1 and failures[0] == worker.error
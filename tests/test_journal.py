@@ -0,0 +1,40 @@
+from knowledge.journal import AutosaveJournal
+from knowledge.storage import NoteDatabase
+from knowledge.store import Note
+
+
+def test_many_records_share_few_fsyncs(tmp_path):
+    path = str(tmp_path / "notes.autosave")
+    journal = AutosaveJournal(path, fsync_interval=5.0)
+    journal.start()
+    writer = journal._writer
+    for i in range(2000):
+        journal.record(1, i, 0, "字")
+    journal.stop()
+
+    # 间隔内的记录合并，只有退出时的一次 fsync
+    assert writer.fsyncs == 1
+    recovered = AutosaveJournal(path).recover()
+    assert len(recovered[1]) == 2000
+
+
+def test_checkpoints_in_the_database_skip_saved_deltas(tmp_path):
+    database = NoteDatabase(str(tmp_path / "notes.db"))
+    note = Note(1, "笔记", "ab")
+    database.save(note)
+    database.flush(2)
+    path = str(tmp_path / "notes.autosave")
+    journal = AutosaveJournal(path)
+    journal.start()
+    seq = journal.record(1, 2, 0, "c")
+    note.content = "abc"
+    database.save(note)
+    database.flush(2, {1: seq})
+    journal.stop()  # 崩溃在日志检查点写入之前
+
+    recovering = AutosaveJournal(path)
+    assert recovering.recover(database.checkpoints()) == {}
+    recovering.reset()
+    # 清空日志后序号继续递增，新的增量不会被旧检查点跳过
+    assert recovering.record(1, 3, 0, "d") > seq
+    database.close()
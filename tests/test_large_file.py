@@ -0,0 +1,102 @@
+from PySide6.QtGui import QTextCursor
+
+from knowledge.large_file import LargeNoteView, file_chunks
+from conftest import process_events
+
+
+def _wait(condition, timeout=5000):
+    for _ in range(timeout // 10):
+        if condition():
+            return
+        process_events(10)
+    raise AssertionError("等待超时")
+
+
+def _open(view, path):
+    indexed = []
+    view.indexed.connect(lambda lines, complete: indexed.append(complete))
+    view.open(path)
+    _wait(lambda: indexed and indexed[-1])
+
+
+def test_editing_a_crlf_page_keeps_crlf(app, tmp_path):
+    path = tmp_path / "note.txt"
+    path.write_bytes(b"".join(b"line %d\r\n" % i for i in range(200)))
+    view = LargeNoteView()
+    view.resize(400, 300)
+    _open(view, str(path))
+
+    cursor = view.editor.textCursor()
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText("\nadded")
+    view.editor.setTextCursor(cursor)
+    view.close()
+    view.wait_writes()
+    process_events(0)
+
+    data = path.read_bytes()
+    assert b"added\r\n" in data
+    assert data.count(b"\n") == data.count(b"\r\n") == 201
+
+
+def test_save_runs_in_background_and_reopens(app, tmp_path):
+    path = tmp_path / "note.txt"
+    path.write_bytes(b"first\nsecond\n")
+    view = LargeNoteView()
+    view.resize(400, 300)
+    _open(view, str(path))
+
+    view.editor.textCursor().insertText("new ")
+    assert view.save()
+    assert view.editor.isReadOnly()  # 写入期间只读
+    _wait(lambda: view._table is not None and not view.editor.isReadOnly())
+    assert path.read_bytes() == b"new first\nsecond\n"
+    view.close()
+
+
+def test_copied_file_leaves_the_source_untouched(app, tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"original\n")
+    copy = str(tmp_path / "copy.txt")
+    view = LargeNoteView()
+    view.resize(400, 300)
+    view.write_file(copy, file_chunks(str(source)))
+    _open(view, copy)  # 复制完成后才映射
+
+    view.editor.textCursor().insertText("edited ")
+    view.close()
+    view.wait_writes()
+    process_events(0)
+
+    assert source.read_bytes() == b"original\n"
+    assert open(copy, "rb").read() == b"edited original\n"
+
+
+def test_edits_on_distant_pages_keep_line_offsets(app, tmp_path):
+    path = tmp_path / "note.txt"
+    lines = [f"line {i}" for i in range(2000)]
+    path.write_bytes("".join(line + "\n" for line in lines).encode())
+    view = LargeNoteView()
+    view.resize(400, 300)
+    _open(view, str(path))
+
+    def edit(first, text):
+        view.scroll_bar.setValue(first)
+        cursor = view.editor.textCursor()
+        cursor.movePosition(QTextCursor.Start)
+        cursor.insertText(text)
+        lines[first:first + 1] = (text + lines[first]).split("\n")
+
+    edit(1500, "尾部\n")
+    edit(10, "开头 ")
+    edit(900, "中间\n\n")
+    edit(1200, "x")
+    for first in (0, 905, 1203, 1990):
+        view.scroll_bar.setValue(first)
+        shown = view.editor.toPlainText().split("\n")
+        first = view._first  # 末尾受滚动范围限制
+        assert shown == lines[first:first + len(shown)]
+    view.close()
+    view.wait_writes()
+    process_events(0)
+    assert path.read_bytes().decode() == "".join(line + "\n" for line in lines)
@@ -0,0 +1,65 @@
+from PySide6.QtWidgets import QWidget
+
+from acrylic.mini_mode import COLLAPSING, DOCKED, EXPANDED, WindowMiniMode
+from conftest import process_events
+
+
+def _docked_window():
+    window = QWidget()
+    window.setGeometry(300, 300, 300, 200)
+    window.show()
+    mini = WindowMiniMode(window)
+    mini.expand_delay = mini.collapse_delay = 20
+    mini.pos_anim.setDuration(10)
+    mini.enable()
+    process_events(100)
+    assert mini.state == DOCKED
+    return window, mini
+
+
+def test_hover_burst_ending_outside_starts_no_animation(app):
+    window, mini = _docked_window()
+    before = mini.animations
+    for _ in range(20):
+        mini.handle_enter_event()
+        mini.handle_leave_event()
+    process_events(100)
+    assert mini.animations == before
+    assert mini.state == DOCKED
+    mini.disable()
+    window.close()
+
+
+def test_hover_burst_ending_inside_starts_one_animation(app):
+    window, mini = _docked_window()
+    before = mini.animations
+    for _ in range(20):
+        mini.handle_enter_event()
+        mini.handle_leave_event()
+    mini.handle_enter_event()
+    process_events(100)
+    assert mini.animations == before + 1
+    assert mini.state == EXPANDED
+    mini.disable()
+    window.close()
+
+
+def test_docking_moves_a_proxy_while_the_window_is_hidden(app):
+    window = QWidget()
+    window.setGeometry(300, 300, 300, 200)
+    window.show()
+    mini = WindowMiniMode(window)
+    mini.pos_anim.setDuration(200)
+    mini.enable()
+    process_events(50)
+    assert mini.state == COLLAPSING
+    assert window.isHidden()
+    assert mini._proxy.isVisible()
+    target = mini.pos_anim.endValue()
+    process_events(300)
+    assert mini.state == DOCKED
+    assert window.isVisible() and window.pos() == target
+    assert window.updatesEnabled()
+    assert mini._proxy.isHidden()
+    mini.disable()
+    window.close()
@@ -0,0 +1,49 @@
+from knowledge.note_list import NoteIdRole, NoteListModel
+from knowledge.storage import NoteDatabase
+
+
+def _database(tmp_path, count):
+    database = NoteDatabase(str(tmp_path / "notes.db"))
+    store = database.load_store()
+    for number in range(count):
+        note = store.new_note(f"笔记 {number}", f"正文 {number}")
+        store.insert(note)
+        database.save(note)
+    database.flush(store.next_id)
+    return database
+
+
+def test_fetch_more_pages_in_before_new_notes(app, tmp_path):
+    database = _database(tmp_path, 7)
+    store = database.load_store(page_size=3)
+    model = NoteListModel(store, lambda store: database.fetch_page(store, 3))
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    assert model.rowCount() == 3
+
+    # 本次新建的笔记排在末尾，之后分页读入的笔记插在它前面
+    note = store.new_note("新笔记")
+    model.insert_note(note)
+    assert note.id == 8
+    inserted.clear()
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert inserted == [(3, 5), (6, 6)]
+    titles = [model.index(row).data() for row in range(model.rowCount())]
+    assert titles == [f"笔记 {number}" for number in range(7)] + ["新笔记"]
+    assert model.index_of(note.id).row() == 7
+    assert [model.index(row).data(NoteIdRole) for row in range(7)] == list(range(1, 8))
+    # 分页读入的笔记正文仍未加载
+    assert store.get(5).content is None
+
+
+def test_removing_a_loaded_note_keeps_the_fetch_position(app, tmp_path):
+    database = _database(tmp_path, 4)
+    store = database.load_store(page_size=2)
+    model = NoteListModel(store, lambda store: database.fetch_page(store, 2))
+    model.insert_note(store.new_note("新笔记"))
+    model.remove_note(1)
+    model.fetchMore()
+    assert [model.index(row).data() for row in range(model.rowCount())] == [
+        "笔记 1", "笔记 2", "笔记 3", "新笔记"]
@@ -0,0 +1,81 @@
+from PySide6.QtGui import QFont, QTextDocument
+
+from conftest import process_events
+from knowledge.note_list import NoteDelegate
+from knowledge.preview import PreviewCache, snippet_of
+from knowledge.store import Note
+
+
+def _cache(rows):
+    calls = []
+
+    def loader(note_ids):
+        calls.append(list(note_ids))
+        return {note_id: rows[note_id] for note_id in note_ids if note_id in rows}
+
+    cache = PreviewCache(loader)
+    ready = []
+    cache.ready.connect(ready.append)
+    return cache, calls, ready
+
+
+def test_requests_in_one_pass_share_one_query(app):
+    cache, calls, ready = _cache({1: ("\n  第一行  \n第二行", 12), 2: ("标题", 2)})
+    notes = [Note(1, "a", None, 1.0), Note(2, "b", None, 1.0), Note(3, "c", None, 1.0)]
+    assert [cache.get(note) for note in notes] == [None, None, None]
+    process_events(0)
+
+    assert calls == [[1, 2, 3]]
+    assert ready == [[1, 2, 3]]
+    preview = cache.get(notes[0])
+    assert (preview.snippet, preview.chars) == ("第一行", 12)
+    assert cache.get(notes[2]).chars == 0  # 库中没有的笔记
+    assert calls == [[1, 2, 3]]  # 命中缓存不再查询
+
+
+def test_modification_and_invalidation_recompute(app, tmp_path):
+    cache, calls, ready = _cache({1: ("旧的", 2)})
+    note = Note(1, "a", None, 1.0)
+    cache.get(note)
+    process_events(0)
+
+    note.modified = 2.0  # 版本变化后重新查询
+    assert cache.get(note) is None
+    process_events(0)
+    assert calls == [[1], [1]]
+
+    cache.invalidate(1)
+    assert ready[-1] == [1]
+    note.content = "  \n新的内容"
+    assert cache.get(note).snippet == "新的内容"  # 正文在内存中时直接计算
+    cache.invalidate(99)  # 没有缓存的笔记不通知
+    assert ready[-1] == [1]
+
+    document = QTextDocument()
+    document.setPlainText("编辑中\n" + "x" * 1000)
+    cache.update_from_document(note, document)
+    assert (cache.get(note).snippet, cache.get(note).chars) == ("编辑中", 1004)
+
+    path = tmp_path / "large.txt"
+    path.write_bytes("大文件开头\n".encode() + b"y" * 5000)
+    large = Note(2, "large", None, 1.0, str(path))
+    cache.get(large)
+    process_events(0)
+    assert len(calls) == 2  # 大文件笔记读取文件，不查询数据库
+    assert cache.get(large).snippet == "大文件开头"
+    assert cache.get(large).chars == path.stat().st_size
+
+
+def test_snippet_skips_blank_lines():
+    assert snippet_of("\n \t\n  内容  \n后面") == "内容"
+    assert snippet_of("   \n") == ""
+
+
+def test_delegate_rebuilds_fonts_when_the_size_changes(app):
+    delegate = NoteDelegate(previews=True)
+    base = QFont("Sans", 10)
+    font, selected = delegate._fonts(base)
+    assert font.pointSizeF() == 10 and selected.weight() == QFont.Medium
+    font, _ = delegate._fonts(QFont("Sans", 14))  # 同一字族
+    assert font.pointSizeF() == 14
+    assert delegate._small_font.pointSizeF() == 14 * 0.85
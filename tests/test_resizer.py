@@ -0,0 +1,130 @@
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QWidget
+
+from acrylic.resizer import WindowResizer
+from conftest import process_events
+
+
+def mouse_event(kind, window, pos, buttons=Qt.LeftButton):
+    """构造窗口坐标 pos 处的鼠标事件"""
+    button = Qt.NoButton if kind == QEvent.MouseMove else Qt.LeftButton
+    return QMouseEvent(kind, QPointF(pos), QPointF(window.mapToGlobal(pos)),
+                       button, buttons, Qt.NoModifier)
+
+
+class _PlainWindow(QWidget):
+    """不在 resizeEvent 中通知 WindowResizer 的窗口"""
+
+    def __init__(self):
+        super().__init__()
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        self.resize(400, 300)
+        self.window_resizer = WindowResizer(self)
+
+
+def test_zone_map_follows_resize_without_owner_help(app):
+    window = _PlainWindow()
+    window.resize(900, 700)
+
+    # 原先的 400x300 热区会把 (450, 350) 当作右下角
+    assert window.window_resizer._get_resize_edge(QPoint(450, 350)) == 0
+    assert window.window_resizer._get_resize_edge(QPoint(899, 350)) == 2
+    rebuilds = window.window_resizer.zone_map.rebuilds
+    window.window_resizer._get_resize_edge(QPoint(450, 350))
+    assert window.window_resizer.zone_map.rebuilds == rebuilds
+
+
+def test_moves_within_one_frame_are_coalesced(app):
+    window = _PlainWindow()
+    window.move(100, 100)
+    window.show()
+    process_events(50)
+    resizer = window.window_resizer
+    start = QPoint(200, 150)
+    resizer.handle_mouse_press(mouse_event(QEvent.MouseButtonPress, window, start))
+    before = resizer.geometry_applies
+
+    origin = window.pos()
+    global_start = window.mapToGlobal(start)
+    for step in range(1, 51):
+        event = QMouseEvent(QEvent.MouseMove, QPointF(start), QPointF(global_start + QPoint(step, step)),
+                            Qt.NoButton, Qt.LeftButton, Qt.NoModifier)
+        resizer.handle_mouse_move(event)
+    # 第一次移动立即应用，其余合并到下一帧
+    assert resizer.geometry_applies - before == 1
+    process_events(100)
+    assert resizer.geometry_applies - before == 2
+    assert window.pos() == origin + QPoint(50, 50)
+    assert not resizer.frame_timer.isActive()
+    window.close()
+
+
+def test_auto_mode_measures_work_and_reprobes_slow_modes(app):
+    import time
+    from acrylic import AcrylicWindow
+
+    window = AcrylicWindow()
+    window.setGeometry(100, 100, 400, 300)
+    window.show()
+    process_events(50)
+    resizer = window.window_resizer
+    edge = QPoint(399, 150)
+    resizer.handle_mouse_press(mouse_event(QEvent.MouseButtonPress, window, edge))
+    assert resizer.active_mode == "live"
+    global_edge = window.mapToGlobal(edge)
+    for step in range(1, 6):
+        resizer.handle_mouse_move(QMouseEvent(QEvent.MouseMove, QPointF(edge), QPointF(global_edge + QPoint(step * 10, 0)),
+                                              Qt.NoButton, Qt.LeftButton, Qt.NoModifier))
+        process_events(20)
+    resizer.handle_mouse_release(mouse_event(QEvent.MouseButtonRelease, window, edge, Qt.NoButton))
+    cost, measured_at = resizer.frame_costs["live"]
+    assert cost > 0
+    assert time.monotonic() - measured_at < 5
+
+    resizer.frame_costs["live"] = (1000.0, time.monotonic())
+    assert resizer._choose_mode() == "snapshot"
+    resizer.frame_costs["live"] = (1000.0, time.monotonic() - resizer.REPROBE_AFTER - 1)
+    assert resizer._choose_mode() == "live"
+    window.close()
+
+
+def test_hover_is_hit_tested_once_by_the_router(app):
+    from PySide6.QtWidgets import QApplication
+    from acrylic import AcrylicWindow
+
+    window = AcrylicWindow()
+    window.setGeometry(100, 100, 400, 300)
+    window.show()
+    process_events(50)
+    resizer = window.window_resizer
+
+    def hover(pos):
+        before = resizer.cursor_updates
+        QApplication.sendEvent(window.windowHandle(), mouse_event(QEvent.MouseMove, window, pos, Qt.NoButton))
+        return resizer.cursor_updates - before
+
+    hover(QPoint(190, 150))  # 首次移动会先产生 Enter 事件
+    assert hover(QPoint(200, 150)) == 0  # 内部悬停不做命中检测
+    assert hover(QPoint(399, 150)) == 1
+    assert resizer.last_valid_cursor == Qt.SizeHorCursor
+    assert hover(QPoint(200, 150)) == 1  # 离开边框时再检测一次以恢复光标
+    assert resizer.last_valid_cursor is None
+    assert hover(QPoint(210, 150)) == 0
+    window.close()
+
+
+def test_destroyed_window_drops_screen_connections(app):
+    from PySide6.QtCore import SIGNAL
+    from acrylic import AcrylicWindow
+    from acrylic.screens import ScreenIndex
+
+    index = ScreenIndex.instance()
+    before = index.receivers(SIGNAL("changed()"))
+    window = AcrylicWindow()
+    assert index.receivers(SIGNAL("changed()")) > before
+
+    window.deleteLater()
+    process_events(0)
+    assert index.receivers(SIGNAL("changed()")) == before
+    index.refresh()
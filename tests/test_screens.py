@@ -0,0 +1,12 @@
+from PySide6.QtCore import QPoint
+
+from acrylic.screens import ScreenIndex
+
+
+def test_nearest_edge_uses_available_geometry(app):
+    index = ScreenIndex.instance()
+    geo = index.entries[0].available
+    assert index.nearest_edge(QPoint(geo.left() + 5, geo.center().y())) == ("left", geo)
+    assert index.nearest_edge(QPoint(geo.right() - 5, geo.center().y()))[0] == "right"
+    assert index.nearest_edge(QPoint(geo.center().x(), geo.top() + 5))[0] == "top"
+    assert index.nearest_edge(QPoint(geo.center().x(), geo.bottom() - 5))[0] == "bottom"
@@ -0,0 +1,43 @@
+import sqlite3
+
+from knowledge.search import SearchIndex, build_query, tokenize
+from knowledge.storage import NoteDatabase
+from knowledge.store import Note
+
+
+def test_tokenize_mixed_cjk_and_latin():
+    assert tokenize("Qt 知识库管理 PySide6") == ["qt", "知识", "识库", "库管", "管理", "理", "pyside6"]
+    assert tokenize("知识库管理", query=True) == ["知识", "识库", "库管", "管理"]
+    assert tokenize("用Qt做笔记") == ["用", "qt", "做笔", "笔记", "记"]
+    assert build_query("知识 Py") == ('"知识" AND "py"*', True)
+    assert build_query("知") == ('"知"*', False)
+
+
+def test_bm25_ranks_title_matches_and_denser_bodies_first():
+    conn = sqlite3.connect(":memory:")
+    index = SearchIndex(conn)
+    index.update(1, "杂记", "今天读了一本书。" * 10 + "提到索引")
+    index.update(2, "索引设计", "倒排表")
+    index.update(3, "杂记", "索引 索引 索引，全文索引")
+    index.update(4, "无关", "天气很好")
+    assert [note_id for note_id, _ in index.query("索引")] == [2, 3, 1]
+    assert [note_id for note_id, _ in index.query("索引 倒排")] == [2]
+    # 子串匹配：二元词序列作为短语，不会命中只含其中一个字的笔记
+    assert [note_id for note_id, _ in index.query("天气")] == [4]
+
+
+def test_reopening_a_database_keeps_the_index_without_rebuilding(tmp_path, monkeypatch):
+    path = str(tmp_path / "notes.db")
+    database = NoteDatabase(path)
+    database.save(Note(1, "读书笔记", "全文检索与倒排索引"))
+    database.flush(2)
+    database.close()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("不应重建索引")
+
+    monkeypatch.setattr(SearchIndex, "rebuild", fail)
+    database = NoteDatabase(path)
+    assert database.search("倒排") == [1]
+    assert database.search("读书") == [1]
+    database.close()
@@ -0,0 +1,83 @@
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QWidget
+
+from acrylic.effect import AcrylicEffect, _BlurWorker
+from acrylic.snapshot import SnapshotCache
+from conftest import process_events
+
+
+def _image():
+    image = QImage(64, 48, QImage.Format_ARGB32)
+    image.fill(QColor(10, 20, 30))
+    return image
+
+
+def test_snapshot_requires_same_geometry(app, tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    widget = QWidget()
+    widget.setGeometry(100, 100, 200, 150)
+    assert cache.save("main", widget, _image())
+    assert cache.load("main", widget) is not None
+
+    widget.setGeometry(120, 100, 200, 150)
+    assert cache.load("main", widget) is None
+
+
+def test_snapshot_keys_by_object_name(app, tmp_path):
+    first, second = QWidget(), QWidget()
+    first.setObjectName("first")
+    second.setObjectName("second")
+    effects = []
+    for widget in (first, second):
+        effect = AcrylicEffect(widget)
+        effect.use_hardware_accel = False
+        effect.set_snapshot_cache(SnapshotCache(str(tmp_path)))
+        effect.blur_cache = _image()
+        effects.append(effect)
+    assert all(effect.save_snapshot() for effect in effects)
+    assert sorted(p.name for p in tmp_path.glob("*.jpg")) == ["first.jpg", "second.jpg"]
+
+    unnamed = AcrylicEffect(QWidget())
+    unnamed.use_hardware_accel = False
+    unnamed.blur_cache = _image()
+    assert not unnamed.save_snapshot()
+
+
+class _Window(QWidget):
+    def __init__(self, cache):
+        super().__init__()
+        self.setObjectName("window")
+        self.setGeometry(50, 50, 160, 120)
+        self.acrylic = AcrylicEffect(self)
+        self.acrylic.use_hardware_accel = False
+        self.acrylic.set_snapshot_cache(cache)
+
+    def paintEvent(self, event):
+        self.acrylic.paint(QPainter(self))
+
+
+def test_refine_is_scheduled_once_and_blurred_off_thread(app, tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    window = _Window(cache)
+    assert cache.save("window", window, _image())
+
+    workers = []
+    original = _BlurWorker.start
+    _BlurWorker.start = lambda self: (workers.append(self), original(self))
+    try:
+        image = QImage(window.size(), QImage.Format_ARGB32)
+        window.render(image)
+        window.render(image)  # 快照期间的重绘不会重复安排刷新
+        process_events(0)
+    finally:
+        _BlurWorker.start = original
+    assert len(workers) == 1
+
+    for _ in range(200):
+        if window.acrylic._blur_worker is None:
+            break
+        process_events(10)
+
+    assert window.acrylic._snapshot is None
+    window.render(image)
+    assert window.acrylic.blur_cache is not None
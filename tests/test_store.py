@@ -0,0 +1,37 @@
+import pytest
+
+from knowledge.store import Note, NoteStore
+
+
+def test_ids_stay_stable_across_removal_and_reordering():
+    store = NoteStore()
+    notes = [store.new_note() for _ in range(5)]
+    for note in notes:
+        store.insert(note)
+    assert [note.id for note in store] == [1, 2, 3, 4, 5]
+
+    assert store.remove(2) == 1
+    assert store.remove(2) == -1
+    moved = store.get(5)
+    store.remove(5)
+    store.insert(moved, 0)
+    assert [note.id for note in store] == [5, 1, 3, 4]
+    assert [store.row_of(note_id) for note_id in (5, 1, 3, 4)] == [0, 1, 2, 3]
+    assert store.at(2) is notes[2]
+
+    # ID 不回收，删除后新建的笔记继续递增
+    assert store.new_note().id == 6
+    assert 2 not in store and store.get(2) is None
+
+
+def test_insert_many_and_reserve_advance_next_id():
+    store = NoteStore(next_id=10)
+    store.insert_many([Note(20, "a"), Note(12, "b")])
+    assert store.next_id == 21
+    assert store.reserve(3) == 21
+    assert store.new_note().id == 24
+    store.insert_many([Note(30, "c")], row=1)
+    assert [note.id for note in store] == [20, 30, 12]
+    assert store.row_of(12) == 2
+    with pytest.raises(ValueError):
+        store.insert(Note(30, "d"))
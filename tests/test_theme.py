@@ -0,0 +1,40 @@
+from PySide6.QtGui import QColor
+
+from acrylic.theme import ThemeEngine
+from acrylic.title_bar import TitleButton, parse_color
+
+
+def test_theme_keeps_the_application_stylesheet(app):
+    saved = app.styleSheet()
+    try:
+        app.setStyleSheet("QLabel { color: red; }")
+        engine = ThemeEngine()
+        engine.register("a", "QPushButton { border: none; }")
+        assert engine.compiles == 1
+        assert "QLabel { color: red; }" in app.styleSheet()
+        assert "QPushButton { border: none; }" in app.styleSheet()
+
+        engine.register("a", "QPushButton { border: none; }")  # 内容未变
+        engine.apply()
+        assert engine.compiles == 1
+
+        # 应用之后又改了样式表，引擎更新片段时保留新的应用样式，并去掉自己旧的部分
+        app.setStyleSheet("QLabel { color: blue; }")
+        engine.register("a", "QPushButton { border: 1px; }")
+        assert engine.compiles == 2
+        sheet = app.styleSheet()
+        assert "color: blue" in sheet and "color: red" not in sheet
+        assert "border: 1px" in sheet and "border: none" not in sheet
+    finally:
+        app.setStyleSheet(saved)
+
+
+def test_parse_color_accepts_css_rgba():
+    assert parse_color("rgba(255, 255, 255, 0.25)") == QColor(255, 255, 255, 64)
+    assert parse_color("#ff3b30") == QColor(255, 59, 48)
+
+
+def test_title_button_uses_configured_colors(app):
+    button = TitleButton("", config={'hover_color': '#102030', 'press_color': 'rgba(1, 2, 3, 0.5)'})
+    assert button._hover_color == QColor(16, 32, 48)
+    assert button._press_color == QColor(1, 2, 3, 128)
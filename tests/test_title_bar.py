@@ -0,0 +1,50 @@
+from PySide6.QtCore import SIGNAL, QEvent, QObject, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication
+
+from acrylic import AcrylicWindow
+from acrylic.screens import ScreenIndex
+from acrylic.snap import SnapEngine
+from conftest import process_events
+
+
+def _event(kind, pos, buttons):
+    button = Qt.NoButton if kind == QEvent.MouseMove else Qt.LeftButton
+    return QMouseEvent(kind, QPointF(10, 10), QPointF(pos), button, buttons, Qt.NoModifier)
+
+
+def test_title_bar_drag_uses_coalesced_geometry(app):
+    window = AcrylicWindow()
+    window.setGeometry(200, 200, 400, 300)
+    window.show()
+    process_events(50)
+    bar, resizer = window.title_bar, window.window_resizer
+    origin = window.pos()
+    start = bar.mapToGlobal(QPoint(100, 10))
+    before = resizer.geometry_applies
+
+    QApplication.sendEvent(bar, _event(QEvent.MouseButtonPress, start, Qt.LeftButton))
+    for step in range(1, 31):
+        QApplication.sendEvent(bar, _event(QEvent.MouseMove, start + QPoint(step, 0), Qt.LeftButton))
+    assert resizer.geometry_applies - before == 1  # 其余移动合并到下一帧
+    QApplication.sendEvent(bar, _event(QEvent.MouseButtonRelease, start + QPoint(30, 0), Qt.NoButton))
+
+    assert resizer.geometry_applies - before == 2
+    assert window.pos() == origin + QPoint(30, 0)
+    assert not resizer.frame_timer.isActive()
+    window.close()
+
+
+def test_snap_engine_disconnects_with_its_parent(app):
+    owner = QObject()
+    engine = SnapEngine(parent=owner)
+    engine._zones["stale"] = None
+    index = ScreenIndex.instance()
+    index.refresh()
+    assert engine._zones == {}
+
+    receivers = index.receivers(SIGNAL("changed()"))
+    owner.deleteLater()
+    process_events(0)
+    assert index.receivers(SIGNAL("changed()")) == receivers - 1  # 已销毁的引擎不再收到通知
+    index.refresh()
@@ -0,0 +1,33 @@
+from PySide6.QtGui import QPixmap
+
+from acrylic.window import AcrylicWindow
+from conftest import process_events
+
+
+def test_resume_rendering_undoes_suspend(app):
+    window = AcrylicWindow()
+    window.show()
+    process_events(50)
+    pixmap = QPixmap(window.size())
+    window.suspend_rendering(pixmap)
+    assert window.acrylic.suspended
+    assert not window.main_layout.isEnabled()
+    assert not window.title_bar.updatesEnabled()
+    assert not window.main_content.updatesEnabled()
+    window.suspend_rendering(pixmap)  # 重复暂停只替换缓存图
+
+    window.resume_rendering()
+    assert not window.acrylic.suspended
+    assert window.main_layout.isEnabled()
+    assert window.title_bar.updatesEnabled() and window.main_content.updatesEnabled()
+    assert window.acrylic.timer.isActive()  # 恢复后整体重绘背景
+    process_events(window.acrylic.update_interval + 30)
+    assert window.acrylic.dirty_rects == []
+
+    # 暂停期间的尺寸变化在恢复后仍会重新计算背景
+    window.suspend_rendering(pixmap)
+    window.resize(window.width() + 40, window.height())
+    assert window.acrylic.dirty_rects == []
+    window.resume_rendering()
+    assert window.acrylic.timer.isActive()
+    window.close()